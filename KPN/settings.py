@@ -158,6 +158,42 @@ if DATABASES['default'].get('ENGINE') == 'django.db.backends.postgresql':
         DATABASES['default']['OPTIONS'] = {}
     DATABASES['default']['OPTIONS']['connect_timeout'] = 10
 
+# ======================================
+# Cache
+# ======================================
+# One cache shared by every gunicorn worker and the job runner (see
+# core.caching for key conventions). Uses Redis when REDIS_URL is set,
+# otherwise a SQLite file on local disk, which is shared between processes
+# on the same machine.
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    _default_cache = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+else:
+    _default_cache = {
+        'BACKEND': 'core.cache_backends.SQLiteCache',
+        'LOCATION': config('CACHE_PATH', default=str(BASE_DIR / 'cache.sqlite3')),
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    }
+
+CACHES = {
+    'default': {
+        **_default_cache,
+        'KEY_PREFIX': 'kpn',
+        # Raise to discard everything cached by a previous deploy
+        'VERSION': config('CACHE_VERSION', default=1, cast=int),
+    }
+}
+
+# django-ratelimit counters (register, forgot password) must be shared
+RATELIMIT_USE_CACHE = 'default'
+
+# Count repeat views of a campaign from the same session once (see campaigns.counters)
+CAMPAIGN_VIEWS_ONCE_PER_SESSION = config('CAMPAIGN_VIEWS_ONCE_PER_SESSION', default=True, cast=bool)
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -212,6 +248,15 @@ if not USE_CLOUDINARY:
     MEDIA_URL = '/media/'
     MEDIA_ROOT = BASE_DIR / 'media'
 
+# Resumable video uploads (see media.uploads). Chunks wait here until the
+# upload is finished, so every web worker must see the same directory; the
+# default is a folder in the system temp directory.
+MEDIA_CHUNKED_UPLOAD_DIR = config('MEDIA_CHUNKED_UPLOAD_DIR', default='')
+MEDIA_CHUNKED_UPLOAD_MAX_SIZE = config('MEDIA_CHUNKED_UPLOAD_MAX_SIZE', default=2 * 1024 ** 3, cast=int)
+
+# Seconds between report consolidation passes of the run_jobs worker (0 disables them)
+REPORT_CONSOLIDATION_INTERVAL = config('REPORT_CONSOLIDATION_INTERVAL', default=60 * 60, cast=int)
+
 # WhiteNoise static file serving optimization
 WHITENOISE_MAX_AGE = 31536000  # 1 year cache for static files
 WHITENOISE_COMPRESSION = True
@@ -284,7 +329,9 @@ AUTH_PASSWORD_VALIDATORS = [
 # Authentication Backends
 AUTHENTICATION_BACKENDS = [
     'axes.backends.AxesStandaloneBackend',  # AxesBackend should be first
-    'django.contrib.auth.backends.ModelBackend',
+    # Replaces ModelBackend (listing both hashed every failed password twice);
+    # staff migration 0012 moves existing sessions over to it
+    'staff.backends.UserBackend',  # Loads role and geography with the session user
 ]
 
 # Django Axes Configuration - Brute Force Protection
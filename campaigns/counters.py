@@ -0,0 +1,96 @@
+"""
+Buffered campaign view counts.
+
+Counting a view used to be ``campaign.views += 1; campaign.save()``, which
+loses updates when two requests race and makes every visitor of a popular
+campaign wait on the same row lock. ``record_view()`` only adds to a
+per-process counter; the counter is written back every ``FLUSH_INTERVAL``
+seconds (and when the worker exits) by ``flush()`` as a single
+``UPDATE ... SET views = views + CASE ...`` for all campaigns viewed in the
+meantime. A worker that is killed outright loses at most that interval's
+views.
+
+With ``CAMPAIGN_VIEWS_ONCE_PER_SESSION`` enabled, a visitor reloading a
+campaign is counted once per session. Visitors without a session (most
+anonymous readers) are not given one just for this, so each of their hits
+still counts.
+"""
+import atexit
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, F, Value, When
+
+from .models import Campaign
+
+
+FLUSH_INTERVAL = 10
+
+# Most recently viewed campaign ids remembered per session.
+SESSION_KEY = 'viewed_campaigns'
+SESSION_LIMIT = 100
+
+_lock = threading.Lock()
+_pending = Counter()
+_timer = None
+
+
+def _first_view_in_session(request, campaign_id):
+    if not getattr(settings, 'CAMPAIGN_VIEWS_ONCE_PER_SESSION', False):
+        return True
+    if request.session.session_key is None:
+        return True
+    seen = request.session.get(SESSION_KEY, [])
+    if campaign_id in seen:
+        return False
+    request.session[SESSION_KEY] = (seen + [campaign_id])[-SESSION_LIMIT:]
+    return True
+
+
+def record_view(request, campaign):
+    """Count a view of ``campaign`` and reflect it on the instance for display."""
+    global _timer
+    if not _first_view_in_session(request, campaign.pk):
+        return
+    campaign.views += 1
+    with _lock:
+        _pending[campaign.pk] += 1
+        if _timer is None:
+            _timer = threading.Timer(FLUSH_INTERVAL, _flush_in_background)
+            _timer.daemon = True
+            _timer.start()
+
+
+def flush():
+    """Write buffered view counts to the database; returns the number of views written."""
+    global _timer
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _timer = None
+    if not pending:
+        return 0
+    try:
+        Campaign.objects.filter(pk__in=pending).update(views=F('views') + Case(
+            *[When(pk=pk, then=Value(count)) for pk, count in pending.items()],
+            default=Value(0),
+        ))
+    except Exception:
+        # Put the counts back so the next flush retries them.
+        with _lock:
+            _pending.update(pending)
+        raise
+    return sum(pending.values())
+
+
+def _flush_in_background():
+    try:
+        flush()
+    finally:
+        # The timer thread has its own database connection.
+        connections.close_all()
+
+
+atexit.register(flush)
@@ -0,0 +1,18 @@
+from django.db import migrations
+from django.db.models import F
+
+
+def backfill_published_at(apps, schema_editor):
+    Campaign = apps.get_model('campaigns', 'Campaign')
+    Campaign.objects.filter(status='PUBLISHED', published_at__isnull=True).update(published_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0003_campaign_campaign_status_author_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_published_at, migrations.RunPython.noop),
+    ]
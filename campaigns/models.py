@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 class Campaign(models.Model):
     STATUS_CHOICES = [
@@ -33,3 +34,11 @@ class Campaign(models.Model):
     
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        # Listings page by published_at, so a published campaign must have one
+        if self.status == 'PUBLISHED' and self.published_at is None:
+            self.published_at = timezone.now()
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'published_at'}
+        super().save(*args, **kwargs)
@@ -2,6 +2,7 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.utils import timezone
+from .counters import record_view
 from .models import Campaign
 from .forms import CampaignForm
 from staff.decorators import approved_leader_required, specific_role_required
@@ -171,8 +172,7 @@ def view_campaign(request, slug):
     """Public view for a published campaign"""
     campaign = get_object_or_404(Campaign, slug=slug, status='PUBLISHED')
     
-    campaign.views += 1
-    campaign.save(update_fields=['views'])
+    record_view(request, campaign)
     
     context = {
         'campaign': campaign,
@@ -0,0 +1,59 @@
+"""
+Cache key conventions.
+
+Every key in the shared cache is built with ``make_key()`` as
+``<app>:<name>[:<part>...]`` (``staff:idtag:<sha256>``); settings add the
+``kpn`` prefix and the deploy-wide ``CACHE_VERSION``.
+
+Entries that must be dropped together live in a ``Namespace``. Its version
+token is part of every key, so ``bump()`` orphans all of them in one write
+and the stale entries simply expire on their TTL. This works the same on
+Redis and on the SQLite fallback, neither of which needs pattern deletes.
+Bump from ``transaction.on_commit`` so other workers cannot re-cache
+uncommitted data.
+"""
+import uuid
+
+from django.core.cache import cache
+
+
+def make_key(*parts):
+    """Join ``parts`` with colons; ``None`` becomes ``0``."""
+    return ':'.join('0' if part is None else str(part) for part in parts)
+
+
+class Namespace:
+    """A group of cache entries invalidated together through a version key."""
+
+    def __init__(self, *name):
+        self.name = make_key(*name)
+        self.version_key = make_key(self.name, 'version')
+
+    def __repr__(self):
+        return f'<Namespace {self.name}>'
+
+    def version(self):
+        """The current version token, created on first use."""
+        version = cache.get(self.version_key)
+        if version is None:
+            # add() so that concurrent first readers agree on one token
+            cache.add(self.version_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_key)
+        return version
+
+    def key(self, *parts, version=None):
+        """The key for ``parts`` under the current (or given) version."""
+        return make_key(self.name, version or self.version(), *parts)
+
+    def bump(self):
+        """Invalidate every entry in the namespace."""
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+
+
+def versions(namespaces):
+    """``{namespace: version}`` for several namespaces in one cache round trip."""
+    found = cache.get_many([namespace.version_key for namespace in namespaces])
+    return {
+        namespace: found.get(namespace.version_key) or namespace.version()
+        for namespace in namespaces
+    }
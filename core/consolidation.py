@@ -0,0 +1,194 @@
+"""
+Period-based consolidation of approved reports.
+
+Approving a ward report used to escalate it on its own, so a Zonal
+Coordinator received one near-duplicate LGA report per ward. Approved
+reports now wait until ``consolidate()`` merges every approved, not yet
+escalated report of one level for the same area (the submitter's LGA for
+ward reports, their zone for LGA reports) and period into a single report
+for the next supervisor.
+
+Each run is one transaction: the consolidated reports are inserted with
+one ``bulk_create``, their sources are marked ESCALATED and linked to them
+(``Report.consolidated_into``) with one ``bulk_update``, and the
+notification emails are queued in the outbox. The lineage fields follow
+``consolidated_into``: the sources, and every report already merged into
+them, are re-rooted under the new report in the same transaction, so a single
+source and a merged group end up with the same shape and
+``Report.get_source_reports()`` / ``get_consolidation_chain()`` stay one
+query at any level.
+
+It runs on demand from the reports page (``core:consolidate_reports``),
+every ``REPORT_CONSOLIDATION_INTERVAL`` seconds in the ``run_jobs`` worker,
+and from ``manage.py consolidate_reports`` for cron-style schedulers.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from leadership.geography import get_tree
+from leadership.supervisors import get_directory
+from .models import Report
+from .notifications import send_report_notification
+
+
+# report type -> (consolidated report type, area the sources are grouped by)
+LEVELS = {
+    'WARD_TO_LGA': ('LGA_TO_ZONAL', 'lga'),
+    'LGA_TO_ZONAL': ('ZONAL_TO_STATE', 'zone'),
+}
+
+AREA_EXPRESSIONS = {
+    'lga': Coalesce(F('submitted_by__lga'), F('submitted_by__ward__lga')),
+    'zone': Coalesce(F('submitted_by__zone'), F('submitted_by__lga__zone'), F('submitted_by__ward__lga__zone')),
+}
+
+
+def pending(report_type, period=None, submitted_to=None):
+    """Approved ``report_type`` reports waiting for consolidation, annotated with ``area``."""
+    _, area = LEVELS[report_type]
+    reports = Report.objects.filter(report_type=report_type, status='APPROVED', is_escalated=False)
+    if period is not None:
+        reports = reports.filter(period=period)
+    if submitted_to is not None:
+        reports = reports.filter(submitted_to=submitted_to)
+    return reports.annotate(area=AREA_EXPRESSIONS[area])
+
+
+def pending_periods(submitted_to=None):
+    """Periods with reports of any level waiting for consolidation, for the on-demand form."""
+    reports = Report.objects.filter(report_type__in=LEVELS, status='APPROVED', is_escalated=False)
+    if submitted_to is not None:
+        reports = reports.filter(submitted_to=submitted_to)
+    return list(reports.order_by('period').values_list('period', flat=True).distinct())
+
+
+def _supervisors(area, area_ids):
+    """Next supervisor for each area id (None where the seat is vacant)."""
+    directory = get_directory()
+    if area == 'zone':
+        state_supervisor = directory.state_supervisor()
+        return {area_id: state_supervisor for area_id in area_ids}
+    return {area_id: directory.zonal_coordinator_for_lga(area_id) for area_id in area_ids}
+
+
+def _area_names(area, area_ids):
+    tree = get_tree()
+    lookup = tree.lga if area == 'lga' else tree.zone
+    names = {}
+    for area_id in area_ids:
+        node = lookup(area_id)
+        if node:
+            names[area_id] = node.name
+    return names
+
+
+def _content(sources, period):
+    parts = [f"[Consolidated from {len(sources)} approved report(s) for {period or 'no period'}]"]
+    for source in sources:
+        reviewer = source.reviewed_by.get_full_name() if source.reviewed_by else 'N/A'
+        parts.append(
+            f"=== {source.title} ===\n"
+            f"[Submitted by: {source.submitted_by.get_full_name()}]\n"
+            f"[Approved by: {reviewer}]\n\n"
+            f"{source.content}"
+        )
+    return '\n\n'.join(parts)
+
+
+def consolidate(report_type, period=None, submitted_to=None, reviewer=None):
+    """
+    Merge the pending ``report_type`` reports into one report per area and period.
+
+    ``period`` and ``submitted_to`` narrow the reports considered. Areas
+    whose next supervisor seat is vacant, and reports whose submitter has no
+    area, are left pending. Returns the consolidated reports.
+    """
+    next_type, area = LEVELS[report_type]
+    now = timezone.now()
+
+    with transaction.atomic():
+        sources = list(
+            pending(report_type, period, submitted_to)
+            .select_related('submitted_by', 'submitted_to', 'reviewed_by')
+            .select_for_update(of=('self',))
+            .order_by('submitted_at', 'pk')
+        )
+        groups = defaultdict(list)
+        for source in sources:
+            if source.area is not None:
+                groups[(source.area, source.period)].append(source)
+        if not groups:
+            return []
+
+        area_ids = {area_id for area_id, _ in groups}
+        supervisors = _supervisors(area, area_ids)
+        names = _area_names(area, area_ids)
+        source_type = dict(Report.REPORT_TYPE_CHOICES)[report_type]
+
+        batches = []
+        for (area_id, group_period), group in groups.items():
+            next_supervisor = supervisors.get(area_id)
+            submitter = group[0].submitted_to or reviewer
+            if next_supervisor is None or submitter is None:
+                continue
+            deadlines = [source.deadline for source in group if source.deadline]
+            report = Report(
+                title=f"Consolidated {source_type} - {names.get(area_id, '')} - {group_period}",
+                report_type=next_type,
+                content=_content(group, group_period),
+                period=group_period,
+                submitted_by=submitter,
+                submitted_to=next_supervisor,
+                status='SUBMITTED',
+                submitted_at=now,
+                deadline=min(deadlines) if deadlines else None,
+            )
+            batches.append((report, group))
+        if not batches:
+            return []
+
+        consolidated = Report.objects.bulk_create([report for report, _ in batches])
+
+        # Pending sources are outermost reports, so what was merged into them
+        # earlier is exactly the reports rooted at them.
+        roots = {}
+        escalated = []
+        for report, group in zip(consolidated, (group for _, group in batches)):
+            for source in group:
+                source.status = 'ESCALATED'
+                source.is_escalated = True
+                source.escalated_at = now
+                source.consolidated_into = report
+                for field, value in report.escalation_lineage().items():
+                    setattr(source, field, value)
+                roots[source.pk] = report
+                escalated.append(source)
+        Report.objects.bulk_update(
+            escalated,
+            ['status', 'is_escalated', 'escalated_at', 'consolidated_into', 'root_report', 'depth', 'lineage_path'],
+            batch_size=500,
+        )
+
+        descendants = list(Report.objects.filter(root_report__in=roots).only('root_report', 'depth', 'lineage_path'))
+        for descendant in descendants:
+            report = roots[descendant.root_report_id]
+            descendant.root_report_id = report.pk
+            descendant.depth += 1
+            descendant.lineage_path = f'/{report.pk}{descendant.lineage_path}'
+        Report.objects.bulk_update(descendants, ['root_report', 'depth', 'lineage_path'], batch_size=500)
+
+        for report in consolidated:
+            send_report_notification(report, 'submitted')
+    return consolidated
+
+
+def consolidate_all(period=None):
+    """Consolidate the pending reports of every level; used by the scheduled command."""
+    consolidated = []
+    for report_type in LEVELS:
+        consolidated += consolidate(report_type, period)
+    return consolidated
@@ -0,0 +1,134 @@
+"""
+Resized image URLs for templates (see ``core.templatetags.images``).
+
+Avatars and cards are shown at 112-400 CSS pixels but profile photos and
+campaign images are stored as uploaded. ``resized_url()`` returns a URL for
+a copy of the right size:
+
+* with Cloudinary storage it is a transformation URL (``w_``/``h_``,
+  ``c_fill``, ``f_auto``, ``q_auto``), so Cloudinary resizes on its CDN and
+  picks the format per browser;
+* with any other storage the copy is generated the first time it is asked
+  for, saved as WebP under ``LOCAL_CACHE_DIR`` through the same storage and
+  reused afterwards. The URL is remembered in the shared cache so later
+  renders do not touch the disk.
+
+If the source cannot be read the original URL is returned, so a broken
+upload never breaks the page.
+"""
+import hashlib
+import os
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from PIL import Image
+from pilkit.processors import ResizeToFill, ResizeToFit, Transpose
+
+from .caching import make_key
+
+
+LOCAL_CACHE_DIR = 'cache/images'
+
+URL_TTL = 60 * 60 * 24
+
+FORMATS = {
+    'webp': ('WEBP', '.webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', '.jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def _is_cloudinary(storage):
+    # Compared by module so cloudinary_storage, which refuses to import
+    # without credentials, is only loaded when it is configured.
+    return type(storage).__module__.startswith('cloudinary_storage.')
+
+
+def _cloudinary_url(storage, name, width, height):
+    import cloudinary
+
+    options = {
+        'width': width,
+        'crop': 'fill' if height else 'limit',
+        'fetch_format': 'auto',
+        'quality': 'auto',
+        'secure': True,
+    }
+    if height:
+        options.update(height=height, gravity='auto')
+    resource = cloudinary.CloudinaryResource(storage._prepend_prefix(name), default_resource_type='image')
+    return resource.build_url(**options)
+
+
+def derivative_name(name, width, height=None, fmt='webp'):
+    """Where the local copy of ``name`` at the given size is stored."""
+    digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(name))[0][:40]
+    size = f'{width}x{height}' if height else f'{width}w'
+    return f'{LOCAL_CACHE_DIR}/{digest[:2]}/{stem}-{digest}-{size}{FORMATS[fmt][1]}'
+
+
+def _render(file, width, height, fmt):
+    with file.open('rb') as source:
+        image = Image.open(source)
+        image.draft('RGB', (width * 2, (height or width) * 2))
+        image.load()
+    image = Transpose().process(image)
+    if height:
+        image = ResizeToFill(width, height).process(image)
+    else:
+        image = ResizeToFit(width=width, upscale=False).process(image)
+
+    pil_format, _, options = FORMATS[fmt]
+    if image.mode not in ('RGB', 'RGBA', 'L') or (pil_format == 'JPEG' and image.mode == 'RGBA'):
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def _local_url(file, width, height, fmt):
+    storage = file.storage
+    name = derivative_name(file.name, width, height, fmt)
+    key = make_key('core', 'image', hashlib.sha256(name.encode('utf-8')).hexdigest())
+    url = cache.get(key)
+    if url is not None:
+        return url
+
+    if not storage.exists(name):
+        try:
+            content = _render(file, width, height, fmt)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return file.url
+        name = storage.save(name, ContentFile(content))
+    url = storage.url(name)
+    cache.set(key, url, URL_TTL)
+    return url
+
+
+def resized_url(file, width, height=None, fmt='webp'):
+    """
+    URL of ``file`` (an image ``FieldFile``) resized to ``width`` pixels.
+
+    With ``height`` the image is cropped to exactly ``width`` x ``height``;
+    without it the aspect ratio is kept. Returns '' for an empty field.
+    """
+    if not file:
+        return ''
+    width = int(width)
+    height = int(height) if height else None
+    if _is_cloudinary(file.storage):
+        return _cloudinary_url(file.storage, file.name, width, height)
+    return _local_url(file, width, height, fmt)
+
+
+def resized_srcset(file, width, height=None, fmt='webp'):
+    """``srcset`` with 1x and 2x copies for high-density screens."""
+    if not file:
+        return ''
+    width = int(width)
+    height = int(height) if height else None
+    return ', '.join([
+        f'{resized_url(file, width, height, fmt)} 1x',
+        f'{resized_url(file, width * 2, height * 2 if height else None, fmt)} 2x',
+    ])
@@ -0,0 +1,162 @@
+"""
+Database-backed background jobs.
+
+Views call ``enqueue()`` and redirect to the job page instead of doing slow
+work (large PDF exports) inside a web worker. ``manage.py run_jobs`` claims
+queued jobs one at a time and calls the handler registered for their kind
+in ``HANDLERS``. A handler receives the job, reports progress through
+``Progress`` and returns ``(filename, bytes)``; the result is saved
+through the default storage backend and served by ``core:download_job``.
+Handlers for internal work with nothing to download (``INTERNAL_KINDS``)
+return None instead.
+"""
+import time
+import traceback
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import BackgroundJob
+
+
+HANDLERS = {
+    'members_pdf': 'staff.jobs.members_pdf',
+    'contact_list_pdf': 'staff.jobs.contact_list_pdf',
+    'id_tags_pdf': 'staff.jobs.id_tags_pdf',
+    'media_derivatives': 'media.jobs.media_derivatives',
+}
+
+# Kinds queued by the app itself rather than requested as exports; they are
+# not listed on the user's exports page.
+INTERNAL_KINDS = {'media_derivatives'}
+
+# Jobs still RUNNING after this long are assumed to belong to a dead worker.
+STALE_AFTER = timedelta(minutes=30)
+
+# Finished jobs and their files are removed after this long.
+RETENTION = timedelta(days=7)
+
+PROGRESS_INTERVAL = 1.0
+
+
+def enqueue(kind, user, **params):
+    """
+    Queue a ``kind`` job for ``user``.
+
+    An identical job that is still queued or running is returned instead of
+    creating a duplicate, so repeated clicks do not pile up work.
+    """
+    existing = BackgroundJob.objects.filter(
+        kind=kind,
+        created_by=user,
+        params=params,
+        status__in=['QUEUED', 'RUNNING'],
+    ).first()
+    if existing:
+        return existing
+    return BackgroundJob.objects.create(kind=kind, created_by=user, params=params)
+
+
+def claim_next():
+    """
+    Mark the oldest queued job as RUNNING and return it, or None.
+
+    The conditional UPDATE makes claiming safe with several workers without
+    relying on row locks, which SQLite does not support.
+    """
+    candidates = BackgroundJob.objects.filter(status='QUEUED').order_by('created_at')
+    for pk in candidates.values_list('pk', flat=True)[:10]:
+        claimed = BackgroundJob.objects.filter(pk=pk, status='QUEUED').update(
+            status='RUNNING',
+            started_at=timezone.now(),
+            message='Starting',
+        )
+        if claimed:
+            return BackgroundJob.objects.get(pk=pk)
+    return None
+
+
+class Progress:
+    """
+    Throttled progress reporter for a running job.
+
+    Call it with the number of processed items and/or a status message (and
+    ``total`` once a handler knows it); the row is written at most once
+    every ``PROGRESS_INTERVAL`` seconds.
+    """
+
+    def __init__(self, job, total, message=''):
+        self.job = job
+        self.total = total
+        self.processed = 0
+        self.message = message
+        self.last_write = 0.0
+        self.write()
+
+    def __call__(self, processed=None, message=None, total=None):
+        if total is not None:
+            self.total = total
+        if processed is not None:
+            self.processed = processed
+        if message is not None:
+            self.message = message
+        if time.monotonic() - self.last_write >= PROGRESS_INTERVAL:
+            self.write()
+
+    def write(self):
+        BackgroundJob.objects.filter(pk=self.job.pk).update(
+            processed=self.processed,
+            total=self.total,
+            message=self.message,
+        )
+        self.last_write = time.monotonic()
+
+
+def run(job):
+    """Run a claimed job and store its result or error."""
+    try:
+        handler = import_string(HANDLERS[job.kind])
+        result = handler(job)
+
+        job.refresh_from_db(fields=['total'])
+        if result is not None:
+            filename, content = result
+            # Inside the try: a storage error fails the job instead of the worker
+            job.result.save(filename, ContentFile(content), save=False)
+        job.status = 'DONE'
+        job.processed = job.total
+        job.message = 'Ready for download' if result is not None else 'Done'
+        job.finished_at = timezone.now()
+        job.save(update_fields=['result', 'status', 'processed', 'message', 'finished_at'])
+    except Exception:
+        job.status = 'FAILED'
+        job.error = traceback.format_exc()
+        job.message = 'Export failed'
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error', 'message', 'finished_at'])
+    return job
+
+
+def requeue_stale():
+    """Put jobs abandoned by a crashed worker back in the queue."""
+    return BackgroundJob.objects.filter(
+        status='RUNNING',
+        started_at__lt=timezone.now() - STALE_AFTER,
+    ).update(status='QUEUED', processed=0, message='Requeued', started_at=None)
+
+
+def purge_expired():
+    """Delete finished jobs older than ``RETENTION`` together with their files."""
+    expired = BackgroundJob.objects.filter(
+        status__in=['DONE', 'FAILED'],
+        finished_at__lt=timezone.now() - RETENTION,
+    )
+    count = 0
+    for job in expired.iterator():
+        if job.result:
+            job.result.delete(save=False)
+        job.delete()
+        count += 1
+    return count
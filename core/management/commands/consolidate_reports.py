@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core.consolidation import consolidate_all
+
+
+class Command(BaseCommand):
+    help = 'Merges approved reports into one consolidated report per area and period for the next level. The run_jobs worker also does this periodically'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--period', help='Only consolidate reports for this period')
+
+    def handle(self, *args, **options):
+        consolidated = consolidate_all(options['period'])
+        for report in consolidated:
+            self.stdout.write(f'{report.title} -> {report.submitted_to.get_full_name()} ({report.source_reports.count()} reports)')
+        self.stdout.write(self.style.SUCCESS(f'Created {len(consolidated)} consolidated report(s)'))
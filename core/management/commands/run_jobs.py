@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.consolidation import consolidate_all
+from core.jobs import claim_next, run, requeue_stale, purge_expired
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs queued background jobs (PDF exports). Keeps polling unless --once is given, '
+        'and consolidates approved reports every REPORT_CONSOLIDATION_INTERVAL seconds while idle'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run every queued job, then exit')
+        parser.add_argument('--sleep', type=float, default=2.0, help='Seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Waiting for jobs...' if not options['once'] else 'Running queued jobs...')
+        requeue_stale()
+        idle_passes = 0
+        last_consolidation = None
+        while True:
+            close_old_connections()
+            job = claim_next()
+            if job is None:
+                if options['once']:
+                    break
+                # Housekeeping roughly once a minute while idle
+                if idle_passes % max(1, int(60 / options['sleep'])) == 0:
+                    requeue_stale()
+                    purge_expired()
+                interval = settings.REPORT_CONSOLIDATION_INTERVAL
+                if interval and (last_consolidation is None or time.monotonic() - last_consolidation >= interval):
+                    last_consolidation = time.monotonic()
+                    self.consolidate_reports()
+                idle_passes += 1
+                time.sleep(options['sleep'])
+                continue
+
+            idle_passes = 0
+            started = time.monotonic()
+            self.stdout.write(f'Running {job}')
+            job = run(job)
+            elapsed = time.monotonic() - started
+            if job.status == 'DONE':
+                self.stdout.write(self.style.SUCCESS(f'Finished {job} in {elapsed:.1f}s ({job.total} items)'))
+            else:
+                self.stdout.write(self.style.ERROR(f'Failed {job}: {job.error.strip().splitlines()[-1]}'))
+
+    def consolidate_reports(self):
+        """Escalate approved reports; a failure is reported and retried on the next pass."""
+        try:
+            consolidated = consolidate_all()
+        except Exception as error:
+            self.stdout.write(self.style.ERROR(f'Report consolidation failed: {error}'))
+            return
+        if consolidated:
+            self.stdout.write(self.style.SUCCESS(f'Created {len(consolidated)} consolidated report(s)'))
@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core import outbox
+
+
+class Command(BaseCommand):
+    help = 'Sends queued outbox emails over one SMTP connection per batch. Keeps polling unless --once is given'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Send every due email, then exit')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when nothing is due')
+        parser.add_argument('--batch-size', type=int, default=outbox.BATCH_SIZE, help='Emails sent per connection')
+        parser.add_argument('--stats', action='store_true', help='Print delivery statistics and exit')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.print_stats()
+            return
+
+        self.stdout.write('Waiting for emails...' if not options['once'] else 'Sending queued emails...')
+        outbox.requeue_stale()
+        total_sent = total_failed = 0
+        idle_passes = 0
+        while True:
+            close_old_connections()
+            started = time.monotonic()
+            sent, failed = outbox.deliver(options['batch_size'])
+            if not sent and not failed:
+                if options['once']:
+                    break
+                # Housekeeping roughly once a minute while idle
+                if idle_passes % max(1, int(60 / options['sleep'])) == 0:
+                    outbox.requeue_stale()
+                    outbox.purge_expired()
+                idle_passes += 1
+                time.sleep(options['sleep'])
+                continue
+
+            idle_passes = 0
+            total_sent += sent
+            total_failed += failed
+            elapsed = time.monotonic() - started
+            style = self.style.SUCCESS if not failed else self.style.WARNING
+            self.stdout.write(style(f'Sent {sent}, failed {failed} in {elapsed:.1f}s'))
+
+        self.stdout.write(self.style.SUCCESS(f'Done: {total_sent} sent, {total_failed} failed attempts'))
+
+    def print_stats(self):
+        stats = outbox.stats()
+        latency = stats['average_latency']
+        oldest = stats['oldest_queued_age']
+        self.stdout.write(f"Queued:             {stats['queued']}")
+        self.stdout.write(f"Sending:            {stats['sending']}")
+        self.stdout.write(f"Failed (gave up):   {stats['failed']}")
+        self.stdout.write(f"Sent in last 24h:   {stats['sent_recently']} ({stats['retried_recently']} after a retry)")
+        self.stdout.write(f"Average latency:    {latency.total_seconds():.1f}s" if latency is not None else 'Average latency:    -')
+        self.stdout.write(f"Oldest queued:      {oldest.total_seconds():.0f}s ago" if oldest is not None else 'Oldest queued:      -')
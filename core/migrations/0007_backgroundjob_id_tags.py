@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='backgroundjob',
+            name='kind',
+            field=models.CharField(choices=[('members_pdf', 'Members List (PDF)'), ('contact_list_pdf', 'Member Contact List (PDF)'), ('id_tags_pdf', 'ID Tags (PDF)')], max_length=50),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_outgoingemail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of escalations from the root report'),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='lineage_path',
+            field=models.CharField(db_index=True, default='/', help_text="Ids of the reports this one was escalated from, root first (e.g. '/12/31/')", max_length=255),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='root_report',
+            field=models.ForeignKey(blank=True, help_text='First report of the escalation chain; empty for that report itself', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='descendant_reports', to='core.report'),
+        ),
+    ]
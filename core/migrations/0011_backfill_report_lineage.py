@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+def backfill_report_lineage(apps, schema_editor):
+    Report = apps.get_model('core', 'Report')
+    parents = dict(Report.objects.values_list('pk', 'parent_report_id'))
+    paths = {}
+
+    def ancestors(pk):
+        # Ids from the root down to pk's parent, following parent_report
+        chain = []
+        seen = {pk}
+        parent = parents.get(pk)
+        while parent is not None and parent in parents and parent not in seen:
+            if parent in paths:
+                chain = paths[parent] + [parent] + chain
+                break
+            chain.insert(0, parent)
+            seen.add(parent)
+            parent = parents[parent]
+        paths[pk] = chain
+        return chain
+
+    reports = []
+    for report in Report.objects.only('pk').iterator():
+        chain = ancestors(report.pk)
+        report.root_report_id = chain[0] if chain else None
+        report.depth = len(chain)
+        report.lineage_path = '/' + ''.join(f'{pk}/' for pk in chain)
+        reports.append(report)
+    Report.objects.bulk_update(reports, ['root_report', 'depth', 'lineage_path'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_report_lineage'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_report_lineage, migrations.RunPython.noop),
+    ]
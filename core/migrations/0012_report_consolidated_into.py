@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_backfill_report_lineage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='consolidated_into',
+            field=models.ForeignKey(blank=True, help_text='Consolidated next-level report this report was merged into', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='source_reports', to='core.report'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def rebuild_report_lineage(apps, schema_editor):
+    Report = apps.get_model('core', 'Report')
+
+    # Reports escalated one-to-one before consolidation only carry parent_report
+    legacy = []
+    for child_id, parent_id in Report.objects.filter(
+        parent_report__isnull=False,
+        parent_report__consolidated_into__isnull=True,
+    ).values_list('pk', 'parent_report_id'):
+        legacy.append(Report(pk=parent_id, consolidated_into_id=child_id))
+    Report.objects.bulk_update(legacy, ['consolidated_into'], batch_size=500)
+
+    targets = dict(Report.objects.values_list('pk', 'consolidated_into_id'))
+    paths = {}
+
+    def ancestors(pk):
+        # Ids from the outermost report down to the one pk was consolidated into
+        chain = []
+        seen = {pk}
+        target = targets.get(pk)
+        while target is not None and target in targets and target not in seen:
+            if target in paths:
+                chain = paths[target] + [target] + chain
+                break
+            chain.insert(0, target)
+            seen.add(target)
+            target = targets[target]
+        paths[pk] = chain
+        return chain
+
+    reports = []
+    for report in Report.objects.only('pk').iterator():
+        chain = ancestors(report.pk)
+        report.root_report_id = chain[0] if chain else None
+        report.depth = len(chain)
+        report.lineage_path = '/' + ''.join(f'{pk}/' for pk in chain)
+        reports.append(report)
+    Report.objects.bulk_update(reports, ['root_report', 'depth', 'lineage_path'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_report_consolidated_into'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='report',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of escalations between root_report and this report'),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='lineage_path',
+            field=models.CharField(db_index=True, default='/', help_text="Ids of the reports this one was escalated or consolidated into, outermost first (e.g. '/58/44/')", max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='root_report',
+            field=models.ForeignKey(blank=True, help_text='Outermost report this one was escalated or consolidated into; empty for that report itself', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='descendant_reports', to='core.report'),
+        ),
+        migrations.RunPython(rebuild_report_lineage, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_report_lineage_follows_consolidation'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='report',
+            name='parent_report',
+            field=models.ForeignKey(blank=True, help_text='Report this one was escalated from, before consolidation replaced one-to-one escalation (see consolidated_into)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='child_reports', to='core.report'),
+        ),
+    ]
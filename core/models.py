@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 class FAQ(models.Model):
     question = models.CharField(max_length=500)
@@ -44,7 +45,12 @@ class Report(models.Model):
     submitted_to = models.ForeignKey('staff.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='received_reports', help_text="Supervisor who receives this report")
     reviewed_by = models.ForeignKey('staff.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='reviewed_reports')
     
-    parent_report = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='child_reports', help_text="Parent report that this report was escalated from")
+    parent_report = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='child_reports', help_text="Report this one was escalated from, before consolidation replaced one-to-one escalation (see consolidated_into)")
+    # Materialized escalation lineage along consolidated_into, kept up to date by core.consolidation
+    root_report = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='descendant_reports', help_text="Outermost report this one was escalated or consolidated into; empty for that report itself")
+    depth = models.PositiveSmallIntegerField(default=0, help_text="Number of escalations between root_report and this report")
+    lineage_path = models.CharField(max_length=255, default='/', db_index=True, help_text="Ids of the reports this one was escalated or consolidated into, outermost first (e.g. '/58/44/')")
+    consolidated_into = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='source_reports', help_text="Consolidated next-level report this report was merged into")
     
     status = models.CharField(max_length=15, choices=STATUS_CHOICES, default='DRAFT')
     is_reviewed = models.BooleanField(default=False)
@@ -62,6 +68,7 @@ class Report(models.Model):
         indexes = [
             models.Index(fields=['status', 'submitted_to'], name='report_status_receiver_idx'),
             models.Index(fields=['status', '-created_at'], name='report_status_created_idx'),
+            models.Index(fields=['-created_at', '-id'], name='report_created_idx'),
         ]
     
     def __str__(self):
@@ -74,14 +81,26 @@ class Report(models.Model):
             return timezone.now().date() > self.deadline
         return False
     
-    def get_report_chain(self):
-        """Get the full chain of reports from root to this report"""
-        chain = [self]
-        current = self.parent_report
-        while current:
-            chain.insert(0, current)
-            current = current.parent_report
-        return chain
+    @property
+    def lineage_ids(self):
+        """Ids of the reports this one was escalated or consolidated into, outermost first"""
+        return [int(pk) for pk in self.lineage_path.split('/') if pk]
+    
+    def escalation_lineage(self):
+        """Lineage fields for a report consolidated into this one"""
+        return {
+            'root_report_id': self.root_report_id or self.pk,
+            'depth': self.depth + 1,
+            'lineage_path': f'{self.lineage_path}{self.pk}/',
+        }
+    
+    def get_source_reports(self):
+        """Every report consolidated into this one, directly or through others (one indexed prefix query)"""
+        return Report.objects.filter(lineage_path__startswith=f'{self.lineage_path}{self.pk}/')
+    
+    def get_consolidation_chain(self):
+        """The reports this one was escalated or consolidated into, nearest first (one query)"""
+        return Report.objects.filter(pk__in=self.lineage_ids).order_by('-depth')
     
     def can_be_escalated(self):
         """Check if this report can be escalated to the next level"""
@@ -91,3 +110,90 @@ class Report(models.Model):
             self.report_type in ['WARD_TO_LGA', 'LGA_TO_ZONAL']
         )
 
+
+
+class BackgroundJob(models.Model):
+    """A unit of work (e.g. a large PDF export) run by ``manage.py run_jobs``."""
+    KIND_CHOICES = [
+        ('members_pdf', 'Members List (PDF)'),
+        ('contact_list_pdf', 'Member Contact List (PDF)'),
+        ('id_tags_pdf', 'ID Tags (PDF)'),
+        ('media_derivatives', 'Gallery Image Sizes'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('QUEUED', 'Queued'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
+    
+    kind = models.CharField(max_length=50, choices=KIND_CHOICES)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='QUEUED')
+    
+    processed = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    message = models.CharField(max_length=200, blank=True)
+    
+    result = models.FileField(upload_to='exports/%Y/%m/', blank=True, null=True)
+    error = models.TextField(blank=True)
+    
+    created_by = models.ForeignKey('staff.User', on_delete=models.CASCADE, related_name='background_jobs')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='job_status_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.pk} - {self.get_status_display()}"
+    
+    @property
+    def percent(self):
+        if self.status == 'DONE':
+            return 100
+        if not self.total:
+            return 0
+        return min(99, self.processed * 100 // self.total)
+    
+    @property
+    def is_finished(self):
+        return self.status in ('DONE', 'FAILED')
+
+
+class OutgoingEmail(models.Model):
+    """An email waiting in the outbox for ``manage.py send_queued_mail`` (see ``core.outbox``)."""
+    STATUS_CHOICES = [
+        ('QUEUED', 'Queued'),
+        ('SENDING', 'Sending'),
+        ('SENT', 'Sent'),
+        ('FAILED', 'Failed'),
+    ]
+    
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='QUEUED')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='email_status_due_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.get_status_display()})"
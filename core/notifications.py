@@ -0,0 +1,59 @@
+"""Emails about reports, queued through the outbox (see ``core.outbox``)."""
+from django.conf import settings
+
+from .outbox import queue_mail
+
+
+def send_report_notification(report, notification_type):
+    """Queue an email notification for report submission or review"""
+    if notification_type == 'submitted':
+        if report.submitted_to and report.submitted_to.email:
+            subject = f'New Report Submitted: {report.title}'
+            message = f"""
+Dear {report.submitted_to.get_full_name()},
+
+A new report has been submitted for your review:
+
+Title: {report.title}
+Period: {report.period}
+Submitted by: {report.submitted_by.get_full_name()}
+Report Type: {report.get_report_type_display()}
+Deadline: {report.deadline if report.deadline else 'Not set'}
+
+Please log in to the KPN platform to review this report.
+
+Best regards,
+KPN Management System
+            """
+            queue_mail(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                [report.submitted_to.email],
+            )
+    
+    elif notification_type == 'reviewed':
+        if report.submitted_by and report.submitted_by.email:
+            status_text = report.get_status_display()
+            subject = f'Report {status_text}: {report.title}'
+            message = f"""
+Dear {report.submitted_by.get_full_name()},
+
+Your report has been reviewed:
+
+Title: {report.title}
+Status: {status_text}
+Reviewed by: {report.reviewed_by.get_full_name() if report.reviewed_by else 'N/A'}
+Review Notes: {report.review_notes if report.review_notes else 'No notes provided'}
+
+Please log in to the KPN platform to view the full details.
+
+Best regards,
+KPN Management System
+            """
+            queue_mail(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                [report.submitted_by.email],
+            )
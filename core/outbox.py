@@ -0,0 +1,158 @@
+"""
+Transactional email outbox.
+
+Views used to call ``send_mail`` inside the request, opening a new SMTP
+connection per message, so a slow relay held the web worker and a failed
+delivery was simply lost. ``queue_mail()`` instead inserts an
+``OutgoingEmail`` row; called inside the view's transaction, the email is
+only queued if the change it announces is committed.
+
+``manage.py send_queued_mail`` drains the outbox with ``deliver()``: it
+claims a batch of due messages and sends them over one SMTP connection.
+A failed message is retried with exponential backoff (``RETRY_DELAYS``)
+and marked FAILED after the last attempt. ``stats()`` summarises delivery
+for the command's ``--stats`` output.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Avg, Count, F, Min, Q
+from django.utils import timezone
+
+from .models import OutgoingEmail
+
+
+BATCH_SIZE = 50
+
+# Wait before each retry; a message is given up after len(RETRY_DELAYS) + 1 attempts.
+RETRY_DELAYS = [
+    timedelta(minutes=1),
+    timedelta(minutes=5),
+    timedelta(minutes=30),
+    timedelta(hours=2),
+    timedelta(hours=6),
+]
+
+# Messages still SENDING after this long belong to a worker that died mid-batch.
+STALE_AFTER = timedelta(minutes=15)
+
+# Sent and failed messages are removed after this long.
+RETENTION = timedelta(days=30)
+
+
+def queue_mail(subject, message, from_email, recipient_list):
+    """Queue an email; same arguments as ``send_mail``. Returns the ``OutgoingEmail``."""
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipient_list),
+    )
+
+
+def claim_batch(limit=BATCH_SIZE):
+    """
+    Mark up to ``limit`` due messages as SENDING and return them.
+
+    As with ``core.jobs.claim_next``, the conditional UPDATE lets several
+    workers drain the outbox without sending a message twice.
+    """
+    now = timezone.now()
+    due = OutgoingEmail.objects.filter(status='QUEUED', next_attempt_at__lte=now).order_by('next_attempt_at')
+    pks = list(due.values_list('pk', flat=True)[:limit])
+    if not pks:
+        return []
+    OutgoingEmail.objects.filter(pk__in=pks, status='QUEUED').update(status='SENDING', claimed_at=now)
+    return list(OutgoingEmail.objects.filter(pk__in=pks, status='SENDING', claimed_at=now).order_by('pk'))
+
+
+def _failed(email, error, now):
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts > len(RETRY_DELAYS):
+        email.status = 'FAILED'
+    else:
+        email.status = 'QUEUED'
+        email.next_attempt_at = now + RETRY_DELAYS[email.attempts - 1]
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+def deliver(limit=BATCH_SIZE, connection=None):
+    """
+    Send one batch of due messages over a single connection.
+
+    Returns ``(sent, failed)``. If the connection cannot be opened every
+    message in the batch counts as a failed attempt.
+    """
+    batch = claim_batch(limit)
+    if not batch:
+        return 0, 0
+
+    connection = connection or get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        now = timezone.now()
+        for email in batch:
+            _failed(email, f'Could not connect: {error}', now)
+        return 0, len(batch)
+
+    sent = failed = 0
+    try:
+        for email in batch:
+            message = EmailMessage(email.subject, email.body, email.from_email, email.to, connection=connection)
+            try:
+                # One message per call so a rejected recipient only fails its own email.
+                connection.send_messages([message])
+            except Exception as error:
+                _failed(email, str(error) or error.__class__.__name__, timezone.now())
+                failed += 1
+            else:
+                email.attempts += 1
+                email.status = 'SENT'
+                email.sent_at = timezone.now()
+                email.last_error = ''
+                email.save(update_fields=['attempts', 'status', 'sent_at', 'last_error'])
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def requeue_stale():
+    """Put messages abandoned by a crashed worker back in the queue."""
+    return OutgoingEmail.objects.filter(
+        status='SENDING',
+        claimed_at__lt=timezone.now() - STALE_AFTER,
+    ).update(status='QUEUED')
+
+
+def purge_expired():
+    """Delete sent and failed messages older than ``RETENTION``."""
+    cutoff = timezone.now() - RETENTION
+    deleted, _ = OutgoingEmail.objects.filter(
+        Q(status='SENT', sent_at__lt=cutoff) | Q(status='FAILED', created_at__lt=cutoff)
+    ).delete()
+    return deleted
+
+
+def stats(since=timedelta(hours=24)):
+    """Outbox counts and delivery latency over the last ``since``."""
+    now = timezone.now()
+    counts = dict(OutgoingEmail.objects.values_list('status').annotate(Count('pk')).order_by())
+    recent = OutgoingEmail.objects.filter(status='SENT', sent_at__gte=now - since).aggregate(
+        sent=Count('pk'),
+        retried=Count('pk', filter=Q(attempts__gt=1)),
+        latency=Avg(F('sent_at') - F('created_at')),
+    )
+    oldest = OutgoingEmail.objects.filter(status='QUEUED').aggregate(oldest=Min('created_at'))['oldest']
+    return {
+        'queued': counts.get('QUEUED', 0),
+        'sending': counts.get('SENDING', 0),
+        'failed': counts.get('FAILED', 0),
+        'sent_recently': recent['sent'],
+        'retried_recently': recent['retried'],
+        'average_latency': recent['latency'],
+        'oldest_queued_age': now - oldest if oldest else None,
+    }
@@ -0,0 +1,213 @@
+"""
+Full-page cache for anonymous visitors.
+
+The public pages (home, campaigns, gallery, leadership, ...) look the same
+for every anonymous visitor, so ``public_page`` stores their rendered HTML
+in the shared cache and serves it without running the view. Only GET/HEAD
+requests from anonymous visitors with no pending flash messages are
+cached, and a response is only stored if it did not set cookies or embed a
+CSRF token.
+
+Each page lists the namespaces its content depends on. ``watch()`` bumps
+those namespaces when a row that is, or was, publicly visible changes (see
+``core.signals``), so pages are refreshed as soon as their content changes
+instead of waiting for ``PAGE_TTL``. Browsers and proxies may keep a copy
+for ``BROWSER_MAX_AGE`` seconds; ``Vary: Cookie`` keeps logged-in members
+from being served the anonymous page.
+"""
+import hashlib
+import json
+from functools import wraps
+
+from django.contrib import messages
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import FileField
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_response_headers, patch_vary_headers
+
+from .caching import Namespace, make_key, versions
+from .pagination import KeysetPaginator
+
+
+PAGE_TTL = 60 * 60
+BROWSER_MAX_AGE = 60
+
+CAMPAIGN_PAGES = Namespace('core', 'pages', 'campaigns')
+GALLERY_PAGES = Namespace('core', 'pages', 'gallery')
+FAQ_PAGES = Namespace('core', 'pages', 'faq')
+LEADERSHIP_PAGES = Namespace('core', 'pages', 'leadership')
+
+
+def _cacheable_request(request):
+    if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+        return False
+    # Pending messages are rendered (and consumed) by the page.
+    return not len(messages.get_messages(request))
+
+
+def _cacheable_response(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+        and not response.has_header('Set-Cookie')
+    )
+
+
+def cursor_param(value):
+    """Key a keyset cursor on its decoded position; raises ``ValueError`` for garbage."""
+    return KeysetPaginator.decode(value)
+
+
+def choice_param(*choices):
+    """Key a parameter on one of ``choices``; any other value renders like ''."""
+    return lambda value: value if value in choices else ''
+
+
+def _page_key(view, namespaces, params, request, args, kwargs):
+    current = versions(namespaces)
+    values = []
+    for param, normalize in params.items():
+        value = request.GET.get(param, '')
+        values.append(normalize(value) if normalize and value else value)
+    variant = json.dumps(
+        [args, kwargs, values],
+        sort_keys=True,
+        default=str,
+    )
+    return make_key(
+        'core',
+        'page',
+        view.__module__,
+        view.__name__,
+        *[current[namespace] for namespace in namespaces],
+        hashlib.sha256(variant.encode('utf-8')).hexdigest(),
+    )
+
+
+def _public_headers(response):
+    patch_response_headers(response, BROWSER_MAX_AGE)
+    patch_cache_control(response, public=True)
+    patch_vary_headers(response, ['Cookie'])
+    return response
+
+
+def public_page(*namespaces, params=()):
+    """
+    Cache the view's page for anonymous visitors.
+
+    ``namespaces`` are the ``Namespace`` objects whose bump invalidates the
+    page. ``params`` names the query parameters that change its content;
+    any others (tracking tags and such) share the cached copy. It can also
+    map names to a normalizer (``cursor_param``, ``choice_param``) so that
+    arbitrary values cannot each create a cached copy; a normalizer raising
+    ``ValueError`` serves the page uncached.
+    """
+    if not isinstance(params, dict):
+        params = dict.fromkeys(params)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not _cacheable_request(request):
+                response = view(request, *args, **kwargs)
+                if request.user.is_authenticated:
+                    patch_cache_control(response, private=True)
+                patch_vary_headers(response, ['Cookie'])
+                return response
+
+            try:
+                key = _page_key(view, namespaces, params, request, args, kwargs)
+            except ValueError:
+                response = view(request, *args, **kwargs)
+                patch_vary_headers(response, ['Cookie'])
+                return response
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return _public_headers(HttpResponse(content, content_type=content_type))
+
+            response = view(request, *args, **kwargs)
+            if not _cacheable_response(request, response):
+                patch_vary_headers(response, ['Cookie'])
+                return response
+            cache.set(key, (response.content, response['Content-Type']), PAGE_TTL)
+            return _public_headers(response)
+        return wrapper
+    return decorator
+
+
+def _comparable(field, value):
+    # An empty file is '' in the database but a FieldFile named None on the instance.
+    if isinstance(field, FileField):
+        return getattr(value, 'name', value) or None
+    return value
+
+
+def _field_values(instance, fields):
+    return {field.attname: _comparable(field, field.value_from_object(instance)) for field in fields}
+
+
+def watch(model, *namespaces, visible=None, fields=None, exclude=()):
+    """
+    Bump ``namespaces`` when a publicly visible ``model`` row changes.
+
+    ``visible`` maps field names to the values a row must have to appear on
+    a public page (``{'status': 'PUBLISHED'}``); a change is relevant if the
+    row matches before or after it. Only changes to ``fields`` (default:
+    every concrete field not in ``exclude``) count, so e.g. a login touching
+    ``last_login`` leaves the pages alone.
+    """
+    visible = visible or {}
+    tracked = [
+        field for field in model._meta.concrete_fields
+        if (fields is None or field.name in fields) and field.name not in exclude
+    ]
+    tracked_names = {field.name for field in tracked} | {field.attname for field in tracked}
+    watched = {field.attname: field for field in tracked}
+    for name in visible:
+        field = model._meta.get_field(name)
+        watched.setdefault(field.attname, field)
+
+    def is_visible(values):
+        return all(values[model._meta.get_field(name).attname] == value for name, value in visible.items())
+
+    uid = f'pagecache_{model._meta.label}_{"_".join(namespace.name for namespace in namespaces)}'
+    attr = f'_{uid}'
+
+    def bump():
+        for namespace in namespaces:
+            namespace.bump()
+
+    def remember(sender, instance, raw=False, update_fields=None, **kwargs):
+        setattr(instance, attr, None)
+        if raw or (update_fields and not set(update_fields) & tracked_names):
+            return
+        if instance._state.adding or instance.pk is None:
+            setattr(instance, attr, {})
+            return
+        previous = model._default_manager.filter(pk=instance.pk).values(*watched).first() or {}
+        setattr(instance, attr, {name: _comparable(watched[name], value) for name, value in previous.items()})
+
+    def on_save(sender, instance, raw=False, **kwargs):
+        previous = instance.__dict__.pop(attr, None)
+        if previous is None:
+            return
+        current = _field_values(instance, watched.values())
+        was_visible = bool(previous) and is_visible(previous)
+        if not (was_visible or is_visible(current)):
+            return
+        if previous and all(previous[field.attname] == current[field.attname] for field in tracked):
+            return
+        transaction.on_commit(bump)
+
+    def on_delete(sender, instance, **kwargs):
+        if is_visible(_field_values(instance, watched.values())):
+            transaction.on_commit(bump)
+
+    pre_save.connect(remember, sender=model, weak=False, dispatch_uid=f'{uid}_pre')
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f'{uid}_save')
+    post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=f'{uid}_delete')
@@ -0,0 +1,92 @@
+"""
+Keyset ("cursor") pagination for newest-first listings.
+
+``Paginator`` pages with ``OFFSET``, which makes the database walk past
+every earlier row, and counts the whole table for the page links. The
+public archives only ever move forward ("load more"), so
+``KeysetPaginator`` instead remembers the (timestamp, id) of the last item
+shown and fetches the next page with
+``WHERE (ts, id) < (last_ts, last_id) ORDER BY ts DESC, id DESC LIMIT n``,
+which is a short range scan on a (status, ts) index no matter how deep
+the visitor scrolls.
+"""
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Page ``queryset`` newest first by the datetime ``field``, ties broken by id.
+
+    Rows whose ``field`` is NULL cannot be placed on a keyset and are
+    excluded.
+    """
+
+    def __init__(self, queryset, field, per_page):
+        self.field = field
+        self.per_page = per_page
+        self.queryset = queryset.filter(**{f'{field}__isnull': False}).order_by(f'-{field}', '-pk')
+
+    def encode(self, obj):
+        value = f'{getattr(obj, self.field).isoformat()}|{obj.pk}'
+        return base64.urlsafe_b64encode(value.encode('ascii')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(cursor):
+        """``(timestamp, pk)`` for ``cursor``; raises ``ValueError`` if it is malformed."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+            timestamp, pk = raw.rsplit('|', 1)
+            return datetime.fromisoformat(timestamp), int(pk)
+        except (TypeError, UnicodeError, binascii.Error) as error:
+            raise ValueError(f'Invalid cursor {cursor!r}') from error
+
+    def get_page(self, cursor=None):
+        """
+        The page after ``cursor``; the first page if it is empty or invalid.
+        """
+        queryset = self.queryset
+        if cursor:
+            try:
+                timestamp, pk = self.decode(cursor)
+            except ValueError:
+                pass
+            else:
+                queryset = queryset.filter(
+                    Q(**{f'{self.field}__lt': timestamp})
+                    | Q(**{self.field: timestamp, 'pk__lt': pk})
+                )
+
+        items = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(items) > self.per_page:
+            items = items[:self.per_page]
+            next_cursor = self.encode(items[-1])
+        return KeysetPage(items, next_cursor)
+
+
+def next_page_url(request, path, page):
+    """``path`` with the current query string and ``after`` set to the next cursor, or None."""
+    if not page.has_next():
+        return None
+    query = request.GET.copy()
+    query['after'] = page.next_cursor
+    return f'{path}?{query.urlencode()}'
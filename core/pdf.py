@@ -0,0 +1,201 @@
+"""
+Paged table PDFs on the KPN letterhead.
+
+Passing one ``Table`` with every row to ``SimpleDocTemplate`` makes reportlab
+measure all cells to size the columns and then split the table page by
+page, which grows much faster than the row count. ``PagedTableRenderer``
+instead uses fixed column widths and row heights, so the number of rows per
+page is known up front. Rows are consumed from an iterator one page at a
+time, each page gets its own small ``Table`` sharing one precomputed
+``TableStyle``, and the letterhead is drawn once into a form XObject that
+every page references. Render time is linear in the number of rows and
+only one page of rows is held in memory.
+"""
+from datetime import datetime
+from io import BytesIO
+from itertools import islice
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas as pdf_canvas
+from reportlab.platypus import Table, TableStyle
+
+
+KPN_GREEN = colors.HexColor('#28a745')
+
+LETTERHEAD_FORM = 'kpn-letterhead'
+
+LETTERHEAD_FOOTER = [
+    ('Helvetica-Bold', 'kpn.kebbi@gmail.com'),
+    ('Helvetica', 'Sani Abacha Bypass Road, Birnin Kebbi     +2348037851112, +2348067770283'),
+    ('Helvetica-Bold', 'www.mykpn.onrender.com'),
+]
+
+FONT = 'Helvetica'
+FONT_BOLD = 'Helvetica-Bold'
+FONT_SIZE = 8
+HEADER_FONT_SIZE = 10
+CELL_PADDING = 3
+ROW_HEIGHT = FONT_SIZE + 2 * CELL_PADDING + 2
+HEADER_ROW_HEIGHT = HEADER_FONT_SIZE + CELL_PADDING + 12
+
+
+def table_style(grid_width=0.5, grid_color=colors.grey, stripes=(colors.white, colors.HexColor('#f0f0f0'))):
+    """The green-header member table style, built once per renderer."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), KPN_GREEN),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), FONT_BOLD),
+        ('FONTSIZE', (0, 0), (-1, 0), HEADER_FONT_SIZE),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('FONTNAME', (0, 1), (-1, -1), FONT),
+        ('FONTSIZE', (0, 1), (-1, -1), FONT_SIZE),
+        ('TOPPADDING', (0, 1), (-1, -1), CELL_PADDING),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), CELL_PADDING),
+        ('GRID', (0, 0), (-1, -1), grid_width, grid_color),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), list(stripes)),
+    ])
+
+
+def fit_text(value, width, font=FONT, size=FONT_SIZE):
+    """``value`` as a string, shortened with an ellipsis to fit ``width`` points."""
+    text = '' if value is None else str(value)
+    # Helvetica glyphs are at most ~0.6em wide for the text we print, so most
+    # cells can skip measuring altogether.
+    if len(text) * size * 0.6 <= width:
+        return text
+    if stringWidth(text, font, size) <= width:
+        return text
+    ellipsis_width = stringWidth('...', font, size)
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if stringWidth(text[:middle], font, size) + ellipsis_width <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + '...'
+
+
+class PagedTableRenderer:
+    """
+    Render rows as a paginated table with a repeated header row.
+
+    ``widths`` are relative column widths; they are scaled to the printable
+    width of the page. Cell text that does not fit its column is shortened.
+    """
+
+    def __init__(self, title, headers, widths, pagesize=landscape(letter), margin=30,
+                 top=70, bottom=60, style=None, letterhead=True):
+        self.title = title
+        self.headers = list(headers)
+        self.pagesize = pagesize
+        self.margin = margin
+        self.top = top
+        self.bottom = bottom
+        self.letterhead = letterhead
+        self.style = style or table_style()
+
+        page_width, page_height = pagesize
+        usable = page_width - 2 * margin
+        scale = usable / sum(widths)
+        self.col_widths = [width * scale for width in widths]
+        self.text_widths = [width - 2 * 6 for width in self.col_widths]
+        self.table_width = usable
+
+        body_height = page_height - top - bottom
+        self.title_height = 36
+        self.rows_first_page = int((body_height - self.title_height - HEADER_ROW_HEIGHT) // ROW_HEIGHT)
+        self.rows_per_page = int((body_height - HEADER_ROW_HEIGHT) // ROW_HEIGHT)
+
+    def render(self, rows, on_row=None, on_page=None):
+        """
+        Render ``rows`` (an iterable of value lists) and return the PDF bytes.
+
+        ``on_row(count)`` is called after each page with the number of rows
+        written so far and ``on_page(page_number)`` after each page.
+        """
+        buffer = BytesIO()
+        canvas = pdf_canvas.Canvas(buffer, pagesize=self.pagesize, pageCompression=1)
+        canvas.setTitle(self.title)
+        if self.letterhead:
+            self._define_letterhead(canvas)
+
+        header = [fit_text(text, width, FONT_BOLD, HEADER_FONT_SIZE) for text, width in zip(self.headers, self.text_widths)]
+        rows = iter(rows)
+        written = 0
+        page = 0
+        while True:
+            capacity = self.rows_first_page if page == 0 else self.rows_per_page
+            chunk = [
+                [fit_text(value, width) for value, width in zip(row, self.text_widths)]
+                for row in islice(rows, capacity)
+            ]
+            if not chunk and page > 0:
+                break
+
+            page += 1
+            self._draw_page(canvas, page, header, chunk)
+            written += len(chunk)
+            canvas.showPage()
+
+            if on_row:
+                on_row(written)
+            if on_page:
+                on_page(page)
+            if len(chunk) < capacity:
+                break
+
+        canvas.save()
+        return buffer.getvalue()
+
+    def _define_letterhead(self, canvas):
+        """Draw the letterhead once as a form XObject; every page reuses it."""
+        page_width, page_height = self.pagesize
+        canvas.beginForm(LETTERHEAD_FORM)
+
+        canvas.setFont(FONT, 9)
+        canvas.setFillColor(colors.black)
+        canvas.drawString(self.margin, page_height - 40, 'Our Ref:')
+        canvas.drawRightString(page_width - self.margin, page_height - 40, f"Date: {datetime.now().strftime('%B %d, %Y')}")
+        canvas.setStrokeColor(KPN_GREEN)
+        canvas.setLineWidth(1.5)
+        canvas.line(self.margin, page_height - 50, page_width - self.margin, page_height - 50)
+
+        canvas.line(self.margin, self.bottom - 10, page_width - self.margin, self.bottom - 10)
+        canvas.setFillColor(colors.HexColor('#333333'))
+        y = self.bottom - 22
+        for font, text in LETTERHEAD_FOOTER:
+            canvas.setFont(font, 8)
+            canvas.drawString(self.margin, y, text)
+            y -= 10
+
+        canvas.endForm()
+
+    def _draw_page(self, canvas, page, header, chunk):
+        page_width, page_height = self.pagesize
+        if self.letterhead:
+            canvas.doForm(LETTERHEAD_FORM)
+
+        y = page_height - self.top
+        if page == 1:
+            canvas.setFont(FONT_BOLD, 14)
+            canvas.setFillColor(KPN_GREEN)
+            canvas.drawCentredString(page_width / 2, y - 18, self.title)
+            y -= self.title_height
+
+        table = Table(
+            [header] + chunk,
+            colWidths=self.col_widths,
+            rowHeights=[HEADER_ROW_HEIGHT] + [ROW_HEIGHT] * len(chunk),
+            style=self.style,
+        )
+        _, height = table.wrapOn(canvas, self.table_width, y)
+        table.drawOn(canvas, self.margin, y - height)
+
+        canvas.setFont(FONT, 8)
+        canvas.setFillColor(colors.HexColor('#333333'))
+        canvas.drawRightString(page_width - self.margin, self.bottom - 22, f'Page {page}')
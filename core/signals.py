@@ -0,0 +1,24 @@
+from campaigns.models import Campaign
+from leadership import supervisors
+from leadership.models import RoleDefinition
+from media.models import MediaItem
+from staff.models import User
+
+from .models import FAQ
+from .pagecache import CAMPAIGN_PAGES, FAQ_PAGES, GALLERY_PAGES, LEADERSHIP_PAGES, watch
+
+
+# Public pages show member names, photos, roles and locations on the
+# leadership directory and as uploaders in the gallery.
+PUBLIC_USER_FIELDS = {'first_name', 'last_name', 'photo', 'role', 'role_definition', 'status', 'is_superuser', 'zone', 'lga', 'ward'}
+
+watch(Campaign, CAMPAIGN_PAGES, visible={'status': 'PUBLISHED'}, exclude={'views', 'updated_at'})
+watch(MediaItem, GALLERY_PAGES, visible={'status': 'APPROVED'}, exclude={'updated_at'})
+watch(FAQ, FAQ_PAGES, visible={'is_active': True})
+# The supervisor directory shares these watchers so a User save reads the
+# previous row once; promotions, swaps, approvals and suspensions all save the User
+watch(
+    User, LEADERSHIP_PAGES, GALLERY_PAGES, supervisors.NAMESPACE,
+    visible={'status': 'APPROVED'}, fields=PUBLIC_USER_FIELDS | supervisors.TRACKED_FIELDS,
+)
+watch(RoleDefinition, LEADERSHIP_PAGES, GALLERY_PAGES, supervisors.NAMESPACE)
@@ -0,0 +1,26 @@
+"""
+Responsive image tags.
+
+    {% load images %}
+    <img src="{% resized_url user.photo 112 112 %}"
+         srcset="{% resized_srcset user.photo 112 112 %}" ...>
+
+Sizes are CSS pixels; ``resized_srcset`` adds the 2x copy. See
+``core.images`` for how the copies are produced on each storage backend.
+"""
+from django import template
+
+from core import images
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def resized_url(file, width, height=None, fmt='webp'):
+    return images.resized_url(file, width, height, fmt)
+
+
+@register.simple_tag
+def resized_srcset(file, width, height=None, fmt='webp'):
+    return images.resized_srcset(file, width, height, fmt)
@@ -1,3 +1,64 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
-# Create your tests here.
+from leadership import geography
+from leadership.models import Zone, LGA, RoleDefinition
+from staff.models import User
+
+from .consolidation import consolidate
+from .models import Report
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ConsolidationLineageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(name='Test Zone')
+        cls.lga = LGA.objects.create(name='Test LGA', zone=cls.zone)
+        cls.lga_coordinator = cls.leader('lga_coordinator', 'LGA', 'LGA Coordinator', lga=cls.lga)
+        cls.zonal_coordinator = cls.leader('zonal_coordinator', 'ZONAL', 'Zonal Coordinator', zone=cls.zone)
+        cls.leader('state_supervisor', 'STATE', 'State Supervisor')
+        cls.members = [
+            User.objects.create_user(f'member{i}', password='x', status='APPROVED', lga=cls.lga)
+            for i in range(2)
+        ]
+
+    @staticmethod
+    def leader(username, tier, title, **area):
+        role, _ = RoleDefinition.objects.get_or_create(tier=tier, title=title, defaults={'seat_number': 1})
+        return User.objects.create_user(username, password='x', status='APPROVED', role=tier, role_definition=role, **area)
+
+    def setUp(self):
+        # The tree is memoized per process; the test geography was created after it
+        geography.invalidate()
+
+    def test_two_level_consolidation_keeps_lineage(self):
+        wards = [
+            Report.objects.create(
+                title=f'Ward report {i}', report_type='WARD_TO_LGA', content='...', period='January 2025',
+                submitted_by=member, submitted_to=self.lga_coordinator, status='APPROVED', submitted_at=timezone.now(),
+            )
+            for i, member in enumerate(self.members)
+        ]
+
+        [lga_report] = consolidate('WARD_TO_LGA', 'January 2025')
+        self.assertEqual(lga_report.submitted_to, self.zonal_coordinator)
+        Report.objects.filter(pk=lga_report.pk).update(status='APPROVED')
+        [zonal_report] = consolidate('LGA_TO_ZONAL', 'January 2025')
+
+        for ward in wards:
+            ward.refresh_from_db()
+            self.assertEqual(ward.lineage_path, f'/{zonal_report.pk}/{lga_report.pk}/')
+            self.assertEqual(ward.root_report_id, zonal_report.pk)
+            self.assertEqual(ward.depth, 2)
+            self.assertEqual(list(ward.get_consolidation_chain()), [lga_report, zonal_report])
+
+        lga_report.refresh_from_db()
+        self.assertEqual(lga_report.lineage_path, f'/{zonal_report.pk}/')
+        self.assertEqual(lga_report.root_report_id, zonal_report.pk)
+        self.assertEqual(lga_report.depth, 1)
+
+        with self.assertNumQueries(1):
+            sources = set(zonal_report.get_source_reports())
+        self.assertEqual(sources, {lga_report, *wards})
+        self.assertEqual(set(lga_report.get_source_reports()), set(wards))
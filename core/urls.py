@@ -9,12 +9,19 @@ urlpatterns = [
     path('leadership/', views.leadership, name='leadership'),
     path('profile/<int:user_id>/', views.view_profile, name='view_profile'),
     path('campaigns/', views.campaigns, name='campaigns'),
+    path('campaigns/feed/', views.campaigns_feed, name='campaigns_feed'),
     path('campaign/<slug:slug>/', views.campaign_detail, name='campaign_detail'),
     path('gallery/', views.gallery, name='gallery'),
+    path('gallery/feed/', views.gallery_feed, name='gallery_feed'),
     path('contact/', views.contact, name='contact'),
     path('support-us/', views.support_us, name='support_us'),
     path('faq/', views.faq, name='faq'),
     path('code-of-conduct/', views.code_of_conduct, name='code_of_conduct'),
     path('submit-report/', views.submit_report, name='submit_report'),
     path('review-report/<int:report_id>/', views.review_report, name='review_report'),
+    path('consolidate-reports/', views.consolidate_reports, name='consolidate_reports'),
+    path('exports/', views.job_list, name='job_list'),
+    path('exports/<int:pk>/', views.job_detail, name='job_detail'),
+    path('exports/<int:pk>/status/', views.job_status, name='job_status'),
+    path('exports/<int:pk>/download/', views.download_job, name='download_job'),
 ]
@@ -2,17 +2,33 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
-from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
+from django.http import JsonResponse
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.views.decorators.http import require_POST
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+from campaigns.counters import record_view
 from campaigns.models import Campaign
 from media.models import MediaItem
 from staff.models import User
 from leadership.models import Zone, LGA, Ward
+from leadership.directory import SeatDirectory
+from leadership import geography
+from leadership.geography import get_tree
+from leadership.supervisors import get_directory
 from .models import FAQ, Report
+from .notifications import send_report_notification
+from .outbox import queue_mail
+from .pagination import KeysetPaginator, next_page_url
+from .pagecache import CAMPAIGN_PAGES, FAQ_PAGES, GALLERY_PAGES, LEADERSHIP_PAGES, choice_param, cursor_param, public_page
 from .forms import WardReportForm, LGAReportForm, ZonalReportForm, ReportReviewForm
 from staff.decorators import approved_leader_required
 
+@public_page(CAMPAIGN_PAGES)
 def home(request):
     featured_campaigns = Campaign.objects.filter(status='PUBLISHED').order_by('-published_at')[:3]
     latest_news = Campaign.objects.filter(status='PUBLISHED').order_by('-published_at')[:6]
@@ -22,95 +38,28 @@ def home(request):
     }
     return render(request, 'core/home.html', context)
 
+@public_page()
 def about(request):
     return render(request, 'core/about.html')
 
+@public_page(LEADERSHIP_PAGES, geography.NAMESPACE, params=('zone', 'lga', 'ward'))
 def leadership(request):
     zone_filter = request.GET.get('zone')
     lga_filter = request.GET.get('lga')
     ward_filter = request.GET.get('ward')
     
-    from leadership.models import RoleDefinition
+    geography = get_tree()
+    directory = SeatDirectory()
     
-    leadership_positions = []
-    
-    # Case 1: Default - Show only State Executive roles (20 roles)
+    # Default - Show only State Executive roles (20 roles)
     if not zone_filter and not lga_filter and not ward_filter:
-        state_roles = RoleDefinition.objects.filter(tier='STATE').order_by('seat_number')
-        for role in state_roles:
-            holder = User.objects.filter(
-                role_definition=role, 
-                status='APPROVED',
-                is_superuser=False
-            ).first()
-            leadership_positions.append({
-                'role': role,
-                'holder': holder,
-                'vacant': holder is None
-            })
-    
-    # Case 2: Only Zone selected - Show Zonal roles for that zone
-    elif zone_filter and not lga_filter and not ward_filter:
-        zone = Zone.objects.get(id=zone_filter)
-        
-        zonal_roles = RoleDefinition.objects.filter(tier='ZONAL').order_by('seat_number')
-        for role in zonal_roles:
-            holder = User.objects.filter(
-                role_definition=role, 
-                zone=zone, 
-                status='APPROVED',
-                is_superuser=False
-            ).first()
-            leadership_positions.append({
-                'role': role,
-                'holder': holder,
-                'zone': zone,
-                'vacant': holder is None
-            })
-    
-    # Case 3: Only LGA selected - Show LGA roles for that LGA
-    elif lga_filter and not zone_filter and not ward_filter:
-        lga = LGA.objects.get(id=lga_filter)
-        
-        lga_roles = RoleDefinition.objects.filter(tier='LGA').order_by('seat_number')
-        for role in lga_roles:
-            holder = User.objects.filter(
-                role_definition=role, 
-                lga=lga, 
-                status='APPROVED',
-                is_superuser=False
-            ).first()
-            leadership_positions.append({
-                'role': role,
-                'holder': holder,
-                'lga': lga,
-                'vacant': holder is None
-            })
-    
-    # Case 4: Only Ward selected - Show Ward roles for that ward
-    elif ward_filter and not zone_filter and not lga_filter:
-        ward = Ward.objects.get(id=ward_filter)
-        
-        ward_roles = RoleDefinition.objects.filter(tier='WARD').order_by('seat_number')
-        for role in ward_roles:
-            holder = User.objects.filter(
-                role_definition=role, 
-                ward=ward, 
-                status='APPROVED',
-                is_superuser=False
-            ).first()
-            leadership_positions.append({
-                'role': role,
-                'holder': holder,
-                'ward': ward,
-                'vacant': holder is None
-            })
+        directory.add_tier('STATE')
     
-    # Case 5: Multiple filters - Show roles based on filter combination
-    elif zone_filter or lga_filter or ward_filter:
-        zone = Zone.objects.get(id=zone_filter) if zone_filter else None
-        lga = LGA.objects.get(id=lga_filter) if lga_filter else None
-        ward = Ward.objects.get(id=ward_filter) if ward_filter else None
+    # Filters - Show roles based on filter combination
+    else:
+        zone = geography.get(Zone, zone_filter) if zone_filter else None
+        lga = geography.get(LGA, lga_filter) if lga_filter else None
+        ward = geography.get(Ward, ward_filter) if ward_filter else None
         
         # Determine which lga and zone to use if not directly provided
         if ward and not lga:
@@ -133,92 +82,31 @@ def leadership(request):
         show_ward = bool(ward_filter)
         
         # Add State Executive roles only if all three filters are selected
-        # Show positions filled in that location + statewide leaders (NULL geography)
+        # Include: 1) Executives in the filtered location (zone or LGA match)
+        #         2) Statewide leaders with NULL geography (e.g., President)
         # Hide vacant positions for executives not in the filtered location
         if show_state:
-            state_roles = RoleDefinition.objects.filter(tier='STATE').order_by('seat_number')
-            for role in state_roles:
-                holder_query = User.objects.filter(
-                    role_definition=role, 
-                    status='APPROVED',
-                    is_superuser=False
-                )
-                
-                # Build location filter for state executives
-                # Include: 1) Executives in the filtered location (zone or LGA match)
-                #         2) Statewide leaders with NULL geography (e.g., President)
-                location_filter = Q(zone__isnull=True, lga__isnull=True)  # Statewide leaders
-                if zone:
-                    location_filter |= Q(zone=zone)
-                if lga:
-                    location_filter |= Q(lga=lga)
-                
-                # Apply location filter
-                holder_query = holder_query.filter(location_filter)
-                holder = holder_query.first()
-                
-                # Only add if position is filled (no vacant positions for state executives in filtered view)
-                if holder:
-                    leadership_positions.append({
-                        'role': role,
-                        'holder': holder,
-                        'vacant': False
-                    })
+            location_filter = Q(zone__isnull=True, lga__isnull=True)  # Statewide leaders
+            if zone:
+                location_filter |= Q(zone=zone)
+            if lga:
+                location_filter |= Q(lga=lga)
+            directory.add_tier('STATE', location_filter, show_vacant=False)
         
-        # Add Zonal roles if zone is specified
         if show_zonal and zone:
-            zonal_roles = RoleDefinition.objects.filter(tier='ZONAL').order_by('seat_number')
-            for role in zonal_roles:
-                holder = User.objects.filter(
-                    role_definition=role, 
-                    zone=zone, 
-                    status='APPROVED',
-                    is_superuser=False
-                ).first()
-                leadership_positions.append({
-                    'role': role,
-                    'holder': holder,
-                    'zone': zone,
-                    'vacant': holder is None
-                })
+            directory.add_tier('ZONAL', Q(zone=zone), zone=zone)
         
-        # Add LGA roles if lga is specified
         if show_lga and lga:
-            lga_roles = RoleDefinition.objects.filter(tier='LGA').order_by('seat_number')
-            for role in lga_roles:
-                holder = User.objects.filter(
-                    role_definition=role, 
-                    lga=lga, 
-                    status='APPROVED',
-                    is_superuser=False
-                ).first()
-                leadership_positions.append({
-                    'role': role,
-                    'holder': holder,
-                    'lga': lga,
-                    'vacant': holder is None
-                })
+            directory.add_tier('LGA', Q(lga=lga), lga=lga)
         
-        # Add Ward roles if ward is specified
         if show_ward and ward:
-            ward_roles = RoleDefinition.objects.filter(tier='WARD').order_by('seat_number')
-            for role in ward_roles:
-                holder = User.objects.filter(
-                    role_definition=role, 
-                    ward=ward, 
-                    status='APPROVED',
-                    is_superuser=False
-                ).first()
-                leadership_positions.append({
-                    'role': role,
-                    'holder': holder,
-                    'ward': ward,
-                    'vacant': holder is None
-                })
+            directory.add_tier('WARD', Q(ward=ward), ward=ward)
     
-    zones = Zone.objects.all()
-    lgas = LGA.objects.select_related('zone').all()
-    wards = Ward.objects.select_related('lga').all()
+    leadership_positions = directory.positions()
+    
+    zones = geography.zones
+    lgas = geography.lgas
+    wards = geography.wards
     
     context = {
         'leadership_positions': leadership_positions,
@@ -239,17 +127,52 @@ def view_profile(request, user_id):
     }
     return render(request, 'core/view_profile.html', context)
 
+CAMPAIGNS_PER_PAGE = 12
+MEDIA_PER_PAGE = 12
+# Any other ?type= shows every item, so it shares the unfiltered cached page
+GALLERY_TYPES = choice_param('PHOTO', 'VIDEO')
+
+
+def _campaign_page(request):
+    published = Campaign.objects.filter(status='PUBLISHED')
+    return KeysetPaginator(published, 'published_at', CAMPAIGNS_PER_PAGE).get_page(request.GET.get('after'))
+
+
+@public_page(CAMPAIGN_PAGES, params={'after': cursor_param})
 def campaigns(request):
-    all_campaigns = Campaign.objects.filter(status='PUBLISHED').order_by('-published_at')
+    page = _campaign_page(request)
     context = {
-        'campaigns': all_campaigns,
+        'campaigns': page,
+        'next_url': next_page_url(request, request.path, page),
+        'feed_url': next_page_url(request, reverse('core:campaigns_feed'), page),
     }
     return render(request, 'core/campaigns.html', context)
 
+
+@public_page(CAMPAIGN_PAGES, params={'after': cursor_param})
+def campaigns_feed(request):
+    """JSON page of published campaigns for infinite scroll; follow ``next`` for more."""
+    page = _campaign_page(request)
+    return JsonResponse({
+        'items': [
+            {
+                'id': campaign.id,
+                'title': campaign.title,
+                'url': reverse('core:campaign_detail', args=[campaign.slug]),
+                'excerpt': Truncator(strip_tags(campaign.content)).words(25),
+                'image': campaign.featured_image.url if campaign.featured_image else None,
+                'published_at': campaign.published_at.isoformat(),
+                'views': campaign.views,
+            }
+            for campaign in page
+        ],
+        'html': render_to_string('core/_campaign_cards.html', {'campaigns': page}, request=request),
+        'next': next_page_url(request, request.path, page),
+    })
+
 def campaign_detail(request, slug):
     campaign = get_object_or_404(Campaign, slug=slug, status='PUBLISHED')
-    campaign.views += 1
-    campaign.save(update_fields=['views'])
+    record_view(request, campaign)
     
     related_campaigns = Campaign.objects.filter(status='PUBLISHED').exclude(id=campaign.id).order_by('-published_at')[:3]
     
@@ -259,24 +182,57 @@ def campaign_detail(request, slug):
     }
     return render(request, 'core/campaign_detail.html', context)
 
-def gallery(request):
-    media_type = request.GET.get('type', 'all')
+def _gallery_page(request):
+    media_type = GALLERY_TYPES(request.GET.get('type', '')) or 'all'
     
-    media_items = MediaItem.objects.filter(status='APPROVED')
+    media_items = MediaItem.objects.filter(status='APPROVED').select_related(
+        'uploaded_by__zone', 'uploaded_by__lga', 'uploaded_by__ward', 'uploaded_by__role_definition',
+    )
     
     if media_type == 'PHOTO':
         media_items = media_items.filter(media_type='PHOTO')
     elif media_type == 'VIDEO':
         media_items = media_items.filter(media_type='VIDEO')
     
-    media_items = media_items.order_by('-created_at')
+    page = KeysetPaginator(media_items, 'created_at', MEDIA_PER_PAGE).get_page(request.GET.get('after'))
+    return page, media_type
+
+
+@public_page(GALLERY_PAGES, geography.NAMESPACE, params={'type': GALLERY_TYPES, 'after': cursor_param})
+def gallery(request):
+    page, media_type = _gallery_page(request)
     
     context = {
-        'media_items': media_items,
+        'media_items': page,
         'selected_type': media_type,
+        'next_url': next_page_url(request, request.path, page),
+        'feed_url': next_page_url(request, reverse('core:gallery_feed'), page),
     }
     return render(request, 'core/gallery.html', context)
 
+
+@public_page(GALLERY_PAGES, geography.NAMESPACE, params={'type': GALLERY_TYPES, 'after': cursor_param})
+def gallery_feed(request):
+    """JSON page of approved media for infinite scroll; follow ``next`` for more."""
+    page, _ = _gallery_page(request)
+    return JsonResponse({
+        'items': [
+            {
+                'id': item.id,
+                'title': item.title,
+                'description': item.description,
+                'media_type': item.media_type,
+                'url': item.file.url,
+                'uploaded_by': item.uploaded_by.get_full_name(),
+                'role': item.uploaded_by.role_definition.title if item.uploaded_by.role_definition else None,
+                'created_at': item.created_at.isoformat(),
+            }
+            for item in page
+        ],
+        'html': render_to_string('core/_media_cards.html', {'media_items': page}, request=request),
+        'next': next_page_url(request, request.path, page),
+    })
+
 def contact(request):
     if request.method == 'POST':
         name = request.POST.get('name')
@@ -298,12 +254,11 @@ Message:
 This message was sent via the KPN contact form.
             """
             
-            send_mail(
+            queue_mail(
                 subject=email_subject,
                 message=email_body,
                 from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=['kpn.kebbi@gmail.com'],
-                fail_silently=False,
             )
             
             messages.success(request, 'Thank you for contacting us! We will get back to you soon.')
@@ -317,6 +272,7 @@ This message was sent via the KPN contact form.
 def support_us(request):
     return render(request, 'core/support_us.html')
 
+@public_page(FAQ_PAGES)
 def faq(request):
     faqs = FAQ.objects.filter(is_active=True)
     context = {
@@ -324,6 +280,7 @@ def faq(request):
     }
     return render(request, 'core/faq.html', context)
 
+@public_page()
 def code_of_conduct(request):
     return render(request, 'core/code_of_conduct.html')
 
@@ -333,42 +290,27 @@ def code_of_conduct(request):
 def submit_report(request):
     """Hierarchical report submission view"""
     user = request.user
+    # Recipients come from the precomputed directory, without a query
+    directory = get_directory()
     
     if user.role == 'WARD':
         FormClass = WardReportForm
         report_type = 'WARD_TO_LGA'
-        if not user.ward:
+        if not user.ward_id:
             messages.error(request, 'Your ward assignment is missing. Please contact the administrator.')
             return redirect('staff:dashboard')
-        lga_coordinator = User.objects.filter(
-            role='LGA',
-            lga=user.ward.lga,
-            role_definition__title='LGA Coordinator',
-            status='APPROVED'
-        ).first()
-        submitted_to = lga_coordinator
+        submitted_to = directory.lga_coordinator_for_ward(user.ward_id)
     elif user.role == 'LGA':
         FormClass = LGAReportForm
         report_type = 'LGA_TO_ZONAL'
-        if not user.lga:
+        if not user.lga_id:
             messages.error(request, 'Your LGA assignment is missing. Please contact the administrator.')
             return redirect('staff:dashboard')
-        zonal_coordinator = User.objects.filter(
-            role='ZONAL',
-            zone=user.lga.zone,
-            role_definition__title='Zonal Coordinator',
-            status='APPROVED'
-        ).first()
-        submitted_to = zonal_coordinator
+        submitted_to = directory.zonal_coordinator_for_lga(user.lga_id)
     elif user.role == 'ZONAL':
         FormClass = ZonalReportForm
         report_type = 'ZONAL_TO_STATE'
-        state_supervisor = User.objects.filter(
-            role='STATE',
-            role_definition__title='State Supervisor',
-            status='APPROVED'
-        ).first()
-        submitted_to = state_supervisor
+        submitted_to = directory.state_supervisor()
     else:
         messages.error(request, 'Report submission is only available for Ward, LGA, and Zonal leaders.')
         return redirect('staff:dashboard')
@@ -386,9 +328,9 @@ def submit_report(request):
             report.report_type = report_type
             report.status = 'SUBMITTED'
             report.submitted_at = timezone.now()
-            report.save()
-            
-            _send_report_notification(report, 'submitted')
+            with transaction.atomic():
+                report.save()
+                send_report_notification(report, 'submitted')
             
             messages.success(request, f'Report submitted successfully to {submitted_to.get_full_name()}!')
             return redirect('staff:dashboard')
@@ -424,7 +366,6 @@ def review_report(request, report_id):
             report.is_reviewed = True
             report.reviewed_by = user
             report.reviewed_at = timezone.now()
-            report.save()
             
             action_text = {
                 'APPROVED': 'approved',
@@ -432,21 +373,17 @@ def review_report(request, report_id):
                 'REJECTED': 'rejected'
             }.get(action, 'reviewed')
             
-            _send_report_notification(report, 'reviewed')
+            # Queued emails commit or roll back with the review itself
+            with transaction.atomic():
+                report.save()
+                send_report_notification(report, 'reviewed')
             
             if action == 'APPROVED' and report.can_be_escalated():
-                escalated_report = _escalate_report(report, user)
-                if escalated_report:
-                    _send_report_notification(escalated_report, 'submitted')
-                    messages.success(
-                        request, 
-                        f'Report approved and escalated to {escalated_report.submitted_to.get_full_name()}!'
-                    )
-                else:
-                    messages.warning(
-                        request, 
-                        f'Report approved but could not be escalated - no supervisor found for the next level. Please contact the administrator to ensure all coordinator positions are filled.'
-                    )
+                # Escalated with the other approved reports of the period (see core.consolidation)
+                messages.success(
+                    request,
+                    f'Report approved! It will be escalated in the consolidated report for {report.period or "its period"}.'
+                )
             else:
                 messages.success(request, f'Report has been {action_text} successfully!')
             
@@ -461,128 +398,77 @@ def review_report(request, report_id):
     return render(request, 'core/review_report.html', context)
 
 
-def _escalate_report(original_report, reviewer):
-    """
-    Create an escalated report to the next level in the hierarchy.
-    Ward → LGA → Zonal → State
-    
-    Uses the original submitter's geography (ward/LGA/zone) to determine the next supervisor,
-    ensuring escalation works even when President or others without zone data review.
-    """
-    if original_report.report_type == 'WARD_TO_LGA':
-        next_report_type = 'LGA_TO_ZONAL'
-        
-        submitter = original_report.submitted_by
-        submitter_zone = submitter.zone
-        
-        if not submitter_zone and submitter.ward:
-            if submitter.ward.lga and submitter.ward.lga.zone:
-                submitter_zone = submitter.ward.lga.zone
-        
-        if not submitter_zone and submitter.lga:
-            if submitter.lga.zone:
-                submitter_zone = submitter.lga.zone
-        
-        if not submitter_zone:
-            return None
-        
-        next_supervisor = User.objects.filter(
-            role='ZONAL',
-            zone=submitter_zone,
-            role_definition__title='Zonal Coordinator',
-            status='APPROVED'
-        ).first()
-    elif original_report.report_type == 'LGA_TO_ZONAL':
-        next_report_type = 'ZONAL_TO_STATE'
-        next_supervisor = User.objects.filter(
-            role='STATE',
-            role_definition__title='State Supervisor',
-            status='APPROVED'
-        ).first()
-    else:
-        return None
-    
-    if not next_supervisor:
-        return None
-    
-    actual_submitter = original_report.submitted_to if original_report.submitted_to else reviewer
+@login_required
+@approved_leader_required
+@require_POST
+def consolidate_reports(request):
+    """Consolidate the approved reports of a period now instead of waiting for the scheduled run"""
+    from .consolidation import LEVELS, consolidate
     
-    escalated_report = Report.objects.create(
-        title=f"Consolidated {original_report.get_report_type_display()} - {original_report.period}",
-        report_type=next_report_type,
-        content=f"[Escalated from {original_report.submitted_to.get_full_name() if original_report.submitted_to else reviewer.get_full_name()}]\n[Approved by: {reviewer.get_full_name()}]\n\n{original_report.content}",
-        period=original_report.period,
-        submitted_by=actual_submitter,
-        submitted_to=next_supervisor,
-        parent_report=original_report,
-        status='SUBMITTED',
-        submitted_at=timezone.now(),
-        deadline=original_report.deadline
-    )
+    user = request.user
+    sees_all = user.role_definition and user.role_definition.title in ('President', 'State Supervisor')
+    period = request.POST.get('period')
     
-    original_report.is_escalated = True
-    original_report.escalated_at = timezone.now()
-    original_report.status = 'ESCALATED'
-    original_report.save()
+    consolidated = []
+    for report_type in LEVELS:
+        consolidated += consolidate(report_type, period, submitted_to=None if sees_all else user, reviewer=user)
     
-    return escalated_report
+    if consolidated:
+        messages.success(request, f'Created {len(consolidated)} consolidated report(s) for the next level.')
+    else:
+        messages.warning(request, 'No approved reports could be consolidated. The next-level supervisor position may be vacant.')
+    return redirect('staff:view_reports')
+
+
+def _user_job(request, pk):
+    from .models import BackgroundJob
+    jobs = BackgroundJob.objects.all()
+    if not request.user.is_superuser:
+        jobs = jobs.filter(created_by=request.user)
+    return get_object_or_404(jobs, pk=pk)
 
 
-def _send_report_notification(report, notification_type):
-    """Send email notification for report submission or review"""
+@login_required
+def job_list(request):
+    """Exports queued by the current user"""
+    from .jobs import INTERNAL_KINDS
+    from .models import BackgroundJob
+    jobs = BackgroundJob.objects.filter(created_by=request.user).exclude(kind__in=INTERNAL_KINDS)[:50]
+    return render(request, 'core/job_list.html', {'jobs': jobs})
+
+
+@login_required
+def job_detail(request, pk):
+    """Progress page for a background export, with the download link once it is ready"""
+    job = _user_job(request, pk)
+    return render(request, 'core/job_detail.html', {'job': job})
+
+
+@login_required
+def job_status(request, pk):
+    """Polled by the progress page"""
+    job = _user_job(request, pk)
+    return JsonResponse({
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'percent': job.percent,
+        'processed': job.processed,
+        'total': job.total,
+        'message': job.message,
+        'download_url': reverse('core:download_job', args=[job.pk]) if job.status == 'DONE' else None,
+    })
+
+
+@login_required
+def download_job(request, pk):
+    """Serve a finished export from the storage backend"""
+    import os
+    from django.http import FileResponse, Http404
+    job = _user_job(request, pk)
+    if job.status != 'DONE' or not job.result:
+        raise Http404("Export is not ready")
     try:
-        if notification_type == 'submitted':
-            if report.submitted_to and report.submitted_to.email:
-                subject = f'New Report Submitted: {report.title}'
-                message = f"""
-Dear {report.submitted_to.get_full_name()},
-
-A new report has been submitted for your review:
-
-Title: {report.title}
-Period: {report.period}
-Submitted by: {report.submitted_by.get_full_name()}
-Report Type: {report.get_report_type_display()}
-Deadline: {report.deadline if report.deadline else 'Not set'}
-
-Please log in to the KPN platform to review this report.
-
-Best regards,
-KPN Management System
-                """
-                send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [report.submitted_to.email],
-                    fail_silently=True,
-                )
-        
-        elif notification_type == 'reviewed':
-            if report.submitted_by and report.submitted_by.email:
-                status_text = report.get_status_display()
-                subject = f'Report {status_text}: {report.title}'
-                message = f"""
-Dear {report.submitted_by.get_full_name()},
-
-Your report has been reviewed:
-
-Title: {report.title}
-Status: {status_text}
-Reviewed by: {report.reviewed_by.get_full_name() if report.reviewed_by else 'N/A'}
-Review Notes: {report.review_notes if report.review_notes else 'No notes provided'}
-
-Please log in to the KPN platform to view the full details.
-
-Best regards,
-KPN Management System
-                """
-                send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [report.submitted_by.email],
-                    fail_silently=True,
-                )
-    except Exception as e:
-        pass
+        handle = job.result.open('rb')
+    except FileNotFoundError:
+        raise Http404("Export file is no longer available")
+    return FileResponse(handle, as_attachment=True, filename=os.path.basename(job.result.name))
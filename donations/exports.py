@@ -0,0 +1,25 @@
+from core.exports import Column, as_date, as_datetime, display, full_name
+from .models import Donation, Expense
+
+
+DONATION_COLUMNS = [
+    Column('Donor', 'donor_name'),
+    Column('Amount', 'amount'),
+    Column('Reference', 'reference'),
+    Column('Status', 'status', format=display(Donation.STATUS_CHOICES)),
+    Column('Received', 'created_at', format=as_datetime),
+    Column('Verified By', 'verified_by__first_name', 'verified_by__last_name', format=full_name, key='verified_by'),
+    Column('Verified At', 'verified_at', format=as_datetime),
+    Column('Recorded By', 'recorded_by__first_name', 'recorded_by__last_name', format=full_name, key='recorded_by'),
+    Column('Recorded At', 'recorded_at', format=as_datetime),
+    Column('Notes', 'notes'),
+]
+
+EXPENSE_COLUMNS = [
+    Column('Date', 'date', format=as_date),
+    Column('Description', 'description'),
+    Column('Category', 'category', format=display(Expense.CATEGORY_CHOICES)),
+    Column('Amount', 'amount'),
+    Column('Recorded By', 'recorded_by__first_name', 'recorded_by__last_name', format=full_name, key='recorded_by'),
+    Column('Notes', 'notes'),
+]
@@ -10,9 +10,11 @@ urlpatterns = [
     
     path('financial-secretary/', views.financial_secretary_donations, name='financial_secretary_donations'),
     path('financial-secretary/record/<int:donation_id>/', views.record_donation, name='record_donation'),
+    path('donations/export/', views.export_donations, name='export_donations'),
     
     path('expenses/', views.expenses_list, name='expenses_list'),
     path('expenses/add/', views.add_expense, name='add_expense'),
+    path('expenses/export/', views.export_expenses, name='export_expenses'),
     
     path('reports/', views.financial_reports, name='financial_reports'),
     path('reports/create/', views.create_financial_report, name='create_financial_report'),
@@ -1,7 +1,9 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.utils import timezone
+from core.exports import export_format, stream_export
 from staff.decorators import specific_role_required
+from .exports import DONATION_COLUMNS, EXPENSE_COLUMNS
 from .models import Donation, Expense, FinancialReport
 from .forms import DonationForm, ExpenseForm, FinancialReportForm
 
@@ -110,6 +112,23 @@ def expenses_list(request):
     return render(request, 'donations/expenses_list.html', context)
 
 
+@specific_role_required('Treasurer', 'Financial Secretary')
+def export_donations(request):
+    """Stream the donation ledger as CSV or NDJSON, optionally filtered by ?status="""
+    donations = Donation.objects.all()
+    status = request.GET.get('status')
+    if status in dict(Donation.STATUS_CHOICES):
+        donations = donations.filter(status=status)
+    return stream_export(donations.order_by('-created_at'), DONATION_COLUMNS, 'kpn_donations', export_format(request))
+
+
+@specific_role_required('Financial Secretary')
+def export_expenses(request):
+    """Stream all expenses as CSV or NDJSON"""
+    expenses = Expense.objects.order_by('-date', '-created_at')
+    return stream_export(expenses, EXPENSE_COLUMNS, 'kpn_expenses', export_format(request))
+
+
 @specific_role_required('Financial Secretary')
 def add_expense(request):
     """Financial Secretary records a new expense"""
@@ -0,0 +1,19 @@
+from core.exports import Column, as_datetime, full_name
+
+
+def yes_no(value):
+    return 'Yes' if value else 'No'
+
+
+ATTENDANCE_COLUMNS = [
+    Column('Event', 'event__title'),
+    Column('Name', 'attendee__first_name', 'attendee__last_name', format=full_name),
+    Column('Phone', 'attendee__phone', key='phone'),
+    Column('Zone', 'attendee__zone__name', key='zone'),
+    Column('LGA', 'attendee__lga__name', key='lga'),
+    Column('Ward', 'attendee__ward__name', key='ward'),
+    Column('Present', 'present', format=yes_no),
+    Column('Recorded By', 'recorded_by__first_name', 'recorded_by__last_name', format=full_name, key='recorded_by'),
+    Column('Recorded At', 'recorded_at', format=as_datetime),
+    Column('Notes', 'notes'),
+]
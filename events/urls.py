@@ -11,6 +11,7 @@ urlpatterns = [
     path('<int:pk>/delete/', views.delete_event, name='delete_event'),
     
     path('<int:pk>/attendance/', views.manage_attendance, name='manage_attendance'),
+    path('<int:pk>/attendance/export/', views.export_attendance, name='export_attendance'),
     path('<int:pk>/attendance/<int:attendee_id>/toggle/', views.mark_individual_attendance, name='mark_individual_attendance'),
     path('attendance/logs/', views.view_attendance_logs, name='view_attendance_logs'),
     
@@ -144,6 +144,17 @@ def manage_attendance(request, pk):
     return render(request, 'events/manage_attendance.html', context)
 
 
+@specific_role_required('Organizing Secretary')
+def export_attendance(request, pk):
+    """Stream the attendance register of an event as CSV or NDJSON"""
+    from core.exports import export_format, stream_export
+    from .exports import ATTENDANCE_COLUMNS
+    
+    event = get_object_or_404(Event, pk=pk)
+    attendances = EventAttendance.objects.filter(event=event).order_by('attendee__last_name', 'attendee__first_name')
+    return stream_export(attendances, ATTENDANCE_COLUMNS, f'kpn_event_{event.pk}_attendance', export_format(request))
+
+
 @specific_role_required('Organizing Secretary')
 def mark_individual_attendance(request, pk, attendee_id):
     event = get_object_or_404(Event, pk=pk)
@@ -0,0 +1,81 @@
+from functools import reduce
+from operator import or_
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from .models import RoleDefinition
+
+
+TIER_ORDER = ['STATE', 'ZONAL', 'LGA', 'WARD']
+
+
+class SeatDirectory:
+    """
+    Resolve leadership seats to their current holders in bulk.
+
+    Each tier is added with the filter that locates its holders (e.g. the
+    zone for Zonal roles). All role definitions are then fetched in one query
+    and all holders in a second one, and seats are matched to holders in
+    memory. The result has the same shape as the ``leadership_positions``
+    list rendered by ``core/leadership.html``.
+    """
+
+    def __init__(self):
+        self._scopes = []
+
+    def add_tier(self, tier, holder_filter=None, show_vacant=True, **extra):
+        """
+        Add every seat of ``tier`` to the directory.
+
+        ``holder_filter`` narrows down which approved members may hold the
+        seats, ``show_vacant`` controls whether empty seats are listed and
+        any extra keyword arguments (zone, lga, ward) are copied onto each
+        position for the template.
+        """
+        self._scopes.append({
+            'tier': tier,
+            'filter': holder_filter if holder_filter is not None else Q(),
+            'show_vacant': show_vacant,
+            'extra': extra,
+        })
+        return self
+
+    def positions(self):
+        if not self._scopes:
+            return []
+
+        tiers = [scope['tier'] for scope in self._scopes]
+        roles_by_tier = {tier: [] for tier in tiers}
+        for role in RoleDefinition.objects.filter(tier__in=tiers).order_by('seat_number'):
+            roles_by_tier[role.tier].append(role)
+
+        holder_query = reduce(or_, [
+            Q(role_definition_id__in=[role.id for role in roles_by_tier[scope['tier']]]) & scope['filter']
+            for scope in self._scopes
+        ])
+
+        # Keep the first holder per seat, matching the previous `.first()` lookups
+        # which followed the model's default ordering.
+        holders = {}
+        User = get_user_model()
+        for user in User.objects.filter(
+            holder_query,
+            status='APPROVED',
+            is_superuser=False,
+        ).select_related('zone', 'lga', 'ward'):
+            holders.setdefault(user.role_definition_id, user)
+
+        scopes = sorted(self._scopes, key=lambda scope: TIER_ORDER.index(scope['tier']))
+        positions = []
+        for scope in scopes:
+            for role in roles_by_tier[scope['tier']]:
+                holder = holders.get(role.id)
+                if holder is None and not scope['show_vacant']:
+                    continue
+                position = {'role': role, 'holder': holder}
+                position.update(scope['extra'])
+                position['vacant'] = holder is None
+                positions.append(position)
+
+        return positions
@@ -0,0 +1,96 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.choices import BaseChoiceIterator
+
+from .geography import get_tree
+from .models import Zone, LGA, Ward
+
+
+class GeographyChoiceIterator(BaseChoiceIterator):
+    """Yield select options from the geography tree at render time."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for node in self.field.nodes():
+            yield (node.id, node.label)
+
+    def __len__(self):
+        return len(self.field.nodes()) + (1 if self.field.empty_label is not None else 0)
+
+
+class GeographyChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField for Zone/LGA/Ward backed by the geography tree.
+
+    Options and validation come from ``leadership.geography`` instead of the
+    queryset, so rendering a select or cleaning a submitted id costs no
+    queries. Use ``restrict()`` rather than reassigning ``queryset`` to
+    narrow the available choices.
+    """
+
+    model = None
+    # Geography tree attributes with every node and the nodes by id
+    nodes_attr = None
+    lookup_attr = None
+    iterator = GeographyChoiceIterator
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', self.model.objects.all())
+        self.lookups = {}
+        super().__init__(**kwargs)
+
+    def restrict(self, **lookups):
+        """
+        Limit choices to nodes whose attributes match ``lookups``,
+        e.g. ``restrict(zone_id=3)`` or ``restrict(pk=user.ward_id)``.
+        """
+        self.lookups = lookups
+        self.widget.choices = self.choices
+
+    def nodes(self):
+        nodes = getattr(get_tree(), self.nodes_attr)
+        if self.lookups:
+            nodes = [node for node in nodes if self._matches(node)]
+        return nodes
+
+    def _matches(self, node):
+        return all(getattr(node, attr) == value for attr, value in self.lookups.items())
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, self.model):
+            value = value.pk
+        try:
+            node = getattr(get_tree(), self.lookup_attr).get(int(value))
+        except (TypeError, ValueError):
+            node = None
+        if node is None or not self._matches(node):
+            raise ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+        return node.as_instance()
+
+
+class ZoneChoiceField(GeographyChoiceField):
+    model = Zone
+    nodes_attr = 'zones'
+    lookup_attr = 'zone_by_id'
+
+
+class LGAChoiceField(GeographyChoiceField):
+    model = LGA
+    nodes_attr = 'lgas'
+    lookup_attr = 'lga_by_id'
+
+
+class WardChoiceField(GeographyChoiceField):
+    model = Ward
+    nodes_attr = 'wards'
+    lookup_attr = 'ward_by_id'
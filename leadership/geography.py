@@ -0,0 +1,273 @@
+"""
+In-memory Zone → LGA → Ward tree.
+
+The geography is seeded once and almost never changes, yet it is read on
+nearly every request (location selects, labels, filter forms). Each worker
+keeps one immutable tree built from three small queries. Saving or deleting a
+Zone, LGA or Ward (see ``leadership.signals``) drops the local copy and bumps
+a version key in the default cache, which other workers compare against every
+``CHECK_INTERVAL`` seconds. Bulk operations that skip signals
+(``bulk_create``, ``QuerySet.update``) must call ``invalidate()`` themselves.
+"""
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from core.caching import Namespace
+
+from .models import Zone, LGA, Ward
+
+
+NAMESPACE = Namespace('leadership', 'geography')
+CHECK_INTERVAL = 30
+
+
+@dataclass(frozen=True, eq=False)
+class ZoneNode:
+    id: int
+    name: str
+    lgas: tuple = field(default=(), repr=False)
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def label(self):
+        return self.name
+
+    @property
+    def wards(self):
+        return tuple(ward for lga in self.lgas for ward in lga.wards)
+
+    def as_instance(self):
+        return _attach(Zone(id=self.id, name=self.name))
+
+    def __str__(self):
+        return self.label
+
+
+@dataclass(frozen=True, eq=False)
+class LGANode:
+    id: int
+    name: str
+    zone: ZoneNode
+    wards: tuple = field(default=(), repr=False)
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def zone_id(self):
+        return self.zone.id
+
+    @property
+    def label(self):
+        return f"{self.name} ({self.zone.name})"
+
+    def as_instance(self):
+        lga = _attach(LGA(id=self.id, name=self.name, zone_id=self.zone.id))
+        lga.zone = self.zone.as_instance()
+        return lga
+
+    def __str__(self):
+        return self.label
+
+
+@dataclass(frozen=True, eq=False)
+class WardNode:
+    id: int
+    name: str
+    lga: LGANode
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def lga_id(self):
+        return self.lga.id
+
+    @property
+    def zone(self):
+        return self.lga.zone
+
+    @property
+    def zone_id(self):
+        return self.lga.zone.id
+
+    @property
+    def label(self):
+        return f"{self.name} ({self.lga.name})"
+
+    def as_instance(self):
+        ward = _attach(Ward(id=self.id, name=self.name, lga_id=self.lga.id))
+        ward.lga = self.lga.as_instance()
+        return ward
+
+    def __str__(self):
+        return self.label
+
+
+def _attach(instance):
+    """Mark a model instance built from a node as loaded from the database."""
+    instance._state.adding = False
+    instance._state.db = 'default'
+    return instance
+
+
+class GeographyTree:
+    """
+    Immutable snapshot of the geography.
+
+    ``zones``, ``lgas`` and ``wards`` keep the models' default ordering so
+    they can replace ``Model.objects.all()`` in views and templates.
+    """
+
+    def __init__(self, zone_rows, lga_rows, ward_rows):
+        zone_lgas = {}
+        lga_wards = {}
+
+        zones = [ZoneNode(id=pk, name=name) for pk, name in zone_rows]
+        zone_by_id = {zone.id: zone for zone in zones}
+
+        lgas = []
+        for pk, name, zone_id in lga_rows:
+            lga = LGANode(id=pk, name=name, zone=zone_by_id[zone_id])
+            lgas.append(lga)
+            zone_lgas.setdefault(zone_id, []).append(lga)
+        lga_by_id = {lga.id: lga for lga in lgas}
+
+        wards = []
+        for pk, name, lga_id in ward_rows:
+            ward = WardNode(id=pk, name=name, lga=lga_by_id[lga_id])
+            wards.append(ward)
+            lga_wards.setdefault(lga_id, []).append(ward)
+
+        # Children are filled in once every node exists; nodes are read-only afterwards.
+        for zone in zones:
+            object.__setattr__(zone, 'lgas', tuple(zone_lgas.get(zone.id, ())))
+        for lga in lgas:
+            object.__setattr__(lga, 'wards', tuple(lga_wards.get(lga.id, ())))
+
+        self.zones = tuple(zones)
+        self.lgas = tuple(lgas)
+        self.wards = tuple(wards)
+        self.zone_by_id = zone_by_id
+        self.lga_by_id = lga_by_id
+        self.ward_by_id = {ward.id: ward for ward in wards}
+
+    @classmethod
+    def load(cls):
+        return cls(
+            Zone.objects.values_list('id', 'name'),
+            LGA.objects.values_list('id', 'name', 'zone_id'),
+            Ward.objects.values_list('id', 'name', 'lga_id'),
+        )
+
+    @cached_property
+    def bundle(self):
+        """
+        The whole hierarchy as one compact JSON document (bytes)::
+
+            {"version": "<hash>",
+             "zones": [[zone_id, name, [[lga_id, name, [[ward_id, name], ...]], ...]], ...]}
+        """
+        zones = [
+            [zone.id, zone.name, [
+                [lga.id, lga.name, [[ward.id, ward.name] for ward in lga.wards]]
+                for lga in zone.lgas
+            ]]
+            for zone in self.zones
+        ]
+        return json.dumps(
+            {'version': self.bundle_version, 'zones': zones},
+            separators=(',', ':'),
+            ensure_ascii=False,
+        ).encode('utf-8')
+
+    @cached_property
+    def bundle_version(self):
+        """Content hash of the hierarchy, used as ETag and cache-busting token."""
+        digest = hashlib.sha256()
+        for zone in self.zones:
+            digest.update(f"z{zone.id}:{zone.name}\n".encode('utf-8'))
+            for lga in zone.lgas:
+                digest.update(f"l{lga.id}:{lga.name}\n".encode('utf-8'))
+                for ward in lga.wards:
+                    digest.update(f"w{ward.id}:{ward.name}\n".encode('utf-8'))
+        return digest.hexdigest()[:20]
+
+    def zone(self, pk):
+        return self._lookup(self.zone_by_id, pk)
+
+    def lga(self, pk):
+        return self._lookup(self.lga_by_id, pk)
+
+    def ward(self, pk):
+        return self._lookup(self.ward_by_id, pk)
+
+    def lgas_in_zone(self, zone_id):
+        zone = self.zone(zone_id)
+        return zone.lgas if zone else ()
+
+    def wards_in_lga(self, lga_id):
+        lga = self.lga(lga_id)
+        return lga.wards if lga else ()
+
+    def get(self, model, pk):
+        """
+        Return a model instance for ``pk`` built from the tree.
+
+        Mirrors ``model.objects.get(id=pk)``: raises ``model.DoesNotExist``
+        for unknown ids and ``ValueError``/``TypeError`` for malformed ones.
+        """
+        maps = {Zone: self.zone_by_id, LGA: self.lga_by_id, Ward: self.ward_by_id}
+        node = maps[model].get(int(pk))
+        if node is None:
+            raise model.DoesNotExist(f"{model._meta.object_name} matching query does not exist.")
+        return node.as_instance()
+
+    @staticmethod
+    def _lookup(nodes, pk):
+        if pk in (None, ''):
+            return None
+        try:
+            return nodes.get(int(pk))
+        except (TypeError, ValueError):
+            return None
+
+
+_lock = threading.Lock()
+_tree = None
+_version = None
+_checked_at = 0.0
+
+
+def get_tree():
+    """Return this worker's geography tree, rebuilding it if it is stale."""
+    global _tree, _version, _checked_at
+
+    tree = _tree
+    if tree is not None and time.monotonic() - _checked_at < CHECK_INTERVAL:
+        return tree
+
+    with _lock:
+        version = NAMESPACE.version()
+        if _tree is None or version != _version:
+            _tree = GeographyTree.load()
+            _version = version
+        _checked_at = time.monotonic()
+        return _tree
+
+
+def invalidate():
+    """Drop the local tree and tell other workers to rebuild theirs."""
+    global _tree
+    with _lock:
+        _tree = None
+    NAMESPACE.bump()
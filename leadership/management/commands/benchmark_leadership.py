@@ -0,0 +1,86 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+
+from leadership.directory import SeatDirectory
+from leadership.models import LGA, RoleDefinition
+from staff.models import User
+
+
+class Command(BaseCommand):
+    help = 'Compares query counts of per-seat lookups against the seat directory for the leadership page'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='Number of timed runs per scenario')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        lga = LGA.objects.select_related('zone').prefetch_related('wards').first()
+        ward = lga.wards.first() if lga else None
+        if lga is None or ward is None:
+            self.stdout.write(self.style.ERROR('No geography found. Run seed_data first.'))
+            return
+
+        zone = lga.zone
+        scenarios = [
+            ('State (default)', [('STATE', Q(), True, {})]),
+            ('Zone', [('ZONAL', Q(zone=zone), True, {'zone': zone})]),
+            ('Zone + LGA + Ward', [
+                ('STATE', Q(zone__isnull=True, lga__isnull=True) | Q(zone=zone) | Q(lga=lga), False, {}),
+                ('ZONAL', Q(zone=zone), True, {'zone': zone}),
+                ('LGA', Q(lga=lga), True, {'lga': lga}),
+                ('WARD', Q(ward=ward), True, {'ward': ward}),
+            ]),
+        ]
+
+        self.stdout.write(f'{"Scenario":<22}{"Seats":>7}{"Legacy q":>10}{"Dir q":>7}{"Legacy ms":>11}{"Dir ms":>9}')
+        for name, tiers in scenarios:
+            legacy_queries, legacy_ms, legacy_positions = self._measure(lambda: self._legacy(tiers), repeat)
+            directory_queries, directory_ms, positions = self._measure(lambda: self._directory(tiers), repeat)
+
+            if self._signature(legacy_positions) != self._signature(positions):
+                self.stdout.write(self.style.ERROR(f'{name}: seat directory output differs from per-seat lookups'))
+
+            self.stdout.write(
+                f'{name:<22}{len(positions):>7}{legacy_queries:>10}{directory_queries:>7}'
+                f'{legacy_ms:>11.2f}{directory_ms:>9.2f}'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _measure(self, build, repeat):
+        with CaptureQueriesContext(connection) as captured:
+            positions = build()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            build()
+        elapsed_ms = (time.perf_counter() - started) * 1000 / max(repeat, 1)
+        return len(captured), elapsed_ms, positions
+
+    def _legacy(self, tiers):
+        """Per-seat lookups as previously done by core.views.leadership."""
+        positions = []
+        for tier, holder_filter, show_vacant, extra in tiers:
+            for role in RoleDefinition.objects.filter(tier=tier).order_by('seat_number'):
+                holder = User.objects.filter(
+                    holder_filter,
+                    role_definition=role,
+                    status='APPROVED',
+                    is_superuser=False
+                ).first()
+                if holder is None and not show_vacant:
+                    continue
+                positions.append(dict(role=role, holder=holder, vacant=holder is None, **extra))
+        return positions
+
+    def _directory(self, tiers):
+        directory = SeatDirectory()
+        for tier, holder_filter, show_vacant, extra in tiers:
+            directory.add_tier(tier, holder_filter, show_vacant=show_vacant, **extra)
+        return directory.positions()
+
+    def _signature(self, positions):
+        return [(p['role'].id, p['holder'].id if p['holder'] else None, p['vacant']) for p in positions]
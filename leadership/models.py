@@ -22,6 +22,11 @@ class LGA(models.Model):
         verbose_name_plural = 'LGAs'
     
     def __str__(self):
+        if not LGA.zone.is_cached(self):
+            from .geography import get_tree
+            zone = get_tree().zone(self.zone_id)
+            if zone is not None:
+                return f"{self.name} ({zone.name})"
         return f"{self.name} ({self.zone.name})"
 
 
@@ -34,6 +39,11 @@ class Ward(models.Model):
         ordering = ['lga__name', 'name']
     
     def __str__(self):
+        if not Ward.lga.is_cached(self):
+            from .geography import get_tree
+            lga = get_tree().lga(self.lga_id)
+            if lga is not None:
+                return f"{self.name} ({lga.name})"
         return f"{self.name} ({self.lga.name})"
 
 
@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import geography
+from .models import Zone, LGA, Ward
+
+
+@receiver(post_save, sender=Zone)
+@receiver(post_save, sender=LGA)
+@receiver(post_save, sender=Ward)
+@receiver(post_delete, sender=Zone)
+@receiver(post_delete, sender=LGA)
+@receiver(post_delete, sender=Ward)
+def invalidate_geography(sender, **kwargs):
+    transaction.on_commit(geography.invalidate)
+
@@ -0,0 +1,131 @@
+"""
+Supervisor directory for report routing.
+
+Submitting, consolidating and auditing reports each looked up the
+recipient with a ``User`` query on ``role_definition__title``. The
+directory maps every routing seat (LGA Coordinator per LGA, Zonal
+Coordinator per zone, State Supervisor, President) to its current holder,
+built with one query and stored in the default cache so all workers share
+it. Each worker also keeps the snapshot in memory and only re-reads it when
+the version key changes, so routing itself runs no database query; ward
+and LGA parents come from the geography tree.
+
+The version is bumped when an approved member's seat, area, name or email
+changes, or a role definition changes (see ``core.signals``). Bulk updates
+that skip signals must call ``invalidate()`` themselves.
+"""
+import threading
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from core.caching import Namespace
+
+from .geography import get_tree
+from .models import RoleDefinition
+
+
+NAMESPACE = Namespace('leadership', 'supervisors')
+DIRECTORY_TTL = 60 * 60 * 24
+
+# Seat title -> (required User.role or None, area field the seat is per)
+SEATS = {
+    'LGA Coordinator': ('LGA', 'lga_id'),
+    'Zonal Coordinator': ('ZONAL', 'zone_id'),
+    'State Supervisor': ('STATE', None),
+    'President': (None, None),
+}
+
+# Fields a directory entry carries; anything else loads lazily from the database.
+HOLDER_FIELDS = ['id', 'first_name', 'last_name', 'email', 'role_definition_id']
+
+# User fields the directory depends on (see core.signals)
+TRACKED_FIELDS = {'first_name', 'last_name', 'email', 'role', 'role_definition', 'status', 'zone', 'lga'}
+
+
+class SupervisorDirectory:
+    """Immutable snapshot of who holds each routing seat."""
+
+    def __init__(self, seats):
+        # {(title, area_id or None): values of HOLDER_FIELDS}
+        self.seats = seats
+
+    @classmethod
+    def load(cls):
+        User = get_user_model()
+        seats = {}
+        holders = User.objects.filter(
+            status='APPROVED',
+            role_definition__title__in=SEATS,
+        ).values_list('role_definition__title', 'role', 'zone_id', 'lga_id', *HOLDER_FIELDS)
+        for title, role, zone_id, lga_id, *holder in holders:
+            required_role, area = SEATS[title]
+            if required_role and role != required_role:
+                continue
+            area_id = {'zone_id': zone_id, 'lga_id': lga_id}.get(area)
+            if area and area_id is None:
+                continue
+            # The first holder wins, matching the previous `.first()` lookups
+            seats.setdefault((title, area_id), tuple(holder))
+        return cls(seats)
+
+    def holder(self, title, area_id=None):
+        """The member holding ``title`` (for ``area_id``) or None if the seat is vacant."""
+        values = self.seats.get((title, area_id))
+        if values is None:
+            return None
+        holder = get_user_model().from_db('default', HOLDER_FIELDS, values)
+        # Templates show the seat title, so attach the role without a query
+        holder.role_definition = RoleDefinition.from_db('default', ['id', 'title'], [holder.role_definition_id, title])
+        return holder
+
+    def lga_coordinator(self, lga_id):
+        return self.holder('LGA Coordinator', lga_id)
+
+    def zonal_coordinator(self, zone_id):
+        return self.holder('Zonal Coordinator', zone_id)
+
+    def state_supervisor(self):
+        return self.holder('State Supervisor')
+
+    def president(self):
+        return self.holder('President')
+
+    def lga_coordinator_for_ward(self, ward_id):
+        ward = get_tree().ward(ward_id)
+        return self.lga_coordinator(ward.lga_id) if ward else None
+
+    def zonal_coordinator_for_lga(self, lga_id):
+        lga = get_tree().lga(lga_id)
+        return self.zonal_coordinator(lga.zone_id) if lga else None
+
+
+_lock = threading.Lock()
+_directory = None
+_version = None
+
+
+def get_directory():
+    """Return the current directory, from memory, the shared cache or the database."""
+    global _directory, _version
+
+    version = NAMESPACE.version()
+    directory = _directory
+    if directory is not None and version == _version:
+        return directory
+
+    with _lock:
+        if _directory is None or version != _version:
+            key = NAMESPACE.key(version=version)
+            seats = cache.get(key)
+            if seats is None:
+                seats = SupervisorDirectory.load().seats
+                cache.set(key, seats, DIRECTORY_TTL)
+            _directory = SupervisorDirectory(seats)
+            _version = version
+        return _directory
+
+
+def invalidate():
+    """Make every worker rebuild the directory on its next lookup."""
+    NAMESPACE.bump()
@@ -0,0 +1,122 @@
+"""
+Resized copies of gallery photos.
+
+Phones upload photos of several megabytes, far more than a gallery card
+needs. After a photo is uploaded, ``schedule()`` queues a background job
+(see ``core.jobs``) that decodes it once and writes a JPEG and a WebP copy
+at each of ``WIDTHS`` narrower than the original through the configured
+storage. The file names are recorded in ``MediaItem.renditions`` and the
+smallest JPEG becomes ``MediaItem.thumbnail``; templates build ``srcset``
+from them and fall back to the original until the job has run.
+"""
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+from pilkit.processors import ResizeToFit, Transpose
+
+from core.jobs import enqueue
+
+
+WIDTHS = (320, 640, 1024, 1600)
+
+FORMATS = {
+    'jpeg': ('JPEG', '.jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+    'webp': ('WEBP', '.webp', {'quality': 80, 'method': 4}),
+}
+
+
+def schedule(media_item):
+    """Queue derivative generation for a newly uploaded photo."""
+    if media_item.media_type != 'PHOTO':
+        return None
+    return enqueue('media_derivatives', media_item.uploaded_by, media_item=media_item.pk)
+
+
+def target_widths(width):
+    """The widths to generate for an original ``width`` pixels wide."""
+    widths = [target for target in WIDTHS if target < width]
+    # Small originals still get one re-encoded copy (and a WebP version).
+    return widths or [width]
+
+
+def derivative_name(media_item, width, extension):
+    stem = os.path.splitext(os.path.basename(media_item.file.name))[0]
+    return f'gallery/derivatives/{media_item.pk}/{stem}-{width}w{extension}'
+
+
+def _encode(image, fmt):
+    pil_format, _, options = FORMATS[fmt]
+    if pil_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def generate(media_item, progress=None):
+    """
+    Write every derivative of ``media_item`` and record them on the item.
+
+    ``progress(processed)`` is called after each file, and once with
+    ``total=`` before the first. Returns the number of files written.
+    """
+    storage = media_item.file.storage
+    with media_item.file.open('rb') as source:
+        original = Image.open(source)
+        full_width, full_height = original.size
+        # Let the JPEG decoder skip detail the largest copy does not need.
+        largest = max(WIDTHS)
+        original.draft('RGB', (largest, largest))
+        original.load()
+    # Apply the EXIF orientation so portrait phone photos stay upright.
+    original = Transpose().process(original)
+    if original.width < original.height and full_width > full_height:
+        full_width, full_height = full_height, full_width
+    if original.mode not in ('RGB', 'RGBA', 'L'):
+        original = original.convert('RGBA' if 'transparency' in original.info else 'RGB')
+
+    widths = target_widths(original.width)
+    if progress:
+        progress(0, total=len(widths) * len(FORMATS))
+
+    sizes = []
+    written = 0
+    for width in widths:
+        resized = ResizeToFit(width=width, upscale=False).process(original)
+        size = {'width': resized.width, 'height': resized.height}
+        for fmt, (_, extension, _) in FORMATS.items():
+            name = derivative_name(media_item, width, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            size[fmt] = storage.save(name, ContentFile(_encode(resized, fmt)))
+            written += 1
+            if progress:
+                progress(written)
+        sizes.append(size)
+
+    previous = media_item.renditions
+    media_item.renditions = {
+        'width': full_width,
+        'height': full_height,
+        'sizes': sizes,
+    }
+    media_item.thumbnail.name = sizes[0]['jpeg']
+    media_item.save(update_fields=['renditions', 'thumbnail'])
+
+    # Names are stable, so only files from a different width set are stale.
+    current = {size[fmt] for size in sizes for fmt in FORMATS}
+    delete_files(previous, keep=current, storage=storage)
+    return written
+
+
+def delete_files(renditions, keep=(), storage=None):
+    """Remove the derivative files listed in ``renditions`` (except ``keep``)."""
+    storage = storage or default_storage
+    for size in (renditions or {}).get('sizes', []):
+        for fmt in FORMATS:
+            name = size.get(fmt)
+            if name and name not in keep:
+                storage.delete(name)
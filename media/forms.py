@@ -1,5 +1,8 @@
 from django import forms
+from django.conf import settings
+from django.template.defaultfilters import filesizeformat
 from .models import MediaItem
+from .uploads import media_type_for
 
 
 class MediaUploadForm(forms.Form):
@@ -16,6 +19,26 @@ class MediaUploadForm(forms.Form):
     )
 
 
+class ChunkedUploadForm(MediaUploadForm):
+    """Starts a resumable upload of one large file"""
+    filename = forms.CharField(max_length=255)
+    size = forms.IntegerField(min_value=1)
+    
+    def clean_filename(self):
+        filename = self.cleaned_data['filename']
+        if media_type_for(filename) is None:
+            raise forms.ValidationError('Unsupported file type.')
+        return filename
+    
+    def clean_size(self):
+        size = self.cleaned_data['size']
+        if size > settings.MEDIA_CHUNKED_UPLOAD_MAX_SIZE:
+            raise forms.ValidationError(
+                f'Files can be at most {filesizeformat(settings.MEDIA_CHUNKED_UPLOAD_MAX_SIZE)}.'
+            )
+        return size
+
+
 # Legacy name for backwards compatibility
 OpinionUploadForm = MediaUploadForm
 
@@ -0,0 +1,15 @@
+"""Background job handlers for the media app (registered in ``core.jobs.HANDLERS``)."""
+from core.jobs import Progress
+from .models import MediaItem
+from . import derivatives
+
+
+def media_derivatives(job):
+    media_item = MediaItem.objects.filter(pk=job.params['media_item'], media_type='PHOTO').first()
+    if media_item is None or not media_item.file:
+        # Deleted or changed to a video before the job ran
+        return None
+    # generate() sets the total once it knows the photo's width
+    progress = Progress(job, 0, 'Resizing photo')
+    derivatives.generate(media_item, progress)
+    return None
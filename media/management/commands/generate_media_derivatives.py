@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from media import derivatives
+from media.models import MediaItem
+
+
+class Command(BaseCommand):
+    help = 'Creates resized JPEG/WebP copies for gallery photos that do not have them yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Regenerate photos that already have copies')
+        parser.add_argument('--now', action='store_true', help='Resize here instead of queueing jobs for run_jobs')
+
+    def handle(self, *args, **options):
+        photos = MediaItem.objects.filter(media_type='PHOTO').exclude(file='').select_related('uploaded_by')
+        if not options['all']:
+            photos = photos.filter(renditions={})
+
+        count = 0
+        failed = 0
+        started = time.monotonic()
+        for media_item in photos.iterator():
+            if not options['now']:
+                derivatives.schedule(media_item)
+                count += 1
+                continue
+            try:
+                written = derivatives.generate(media_item)
+            except Exception as error:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'{media_item.pk}: {error}'))
+                continue
+            count += 1
+            self.stdout.write(f'{media_item.pk}: {written} files')
+
+        if options['now']:
+            elapsed = time.monotonic() - started
+            self.stdout.write(self.style.SUCCESS(f'Resized {count} photos in {elapsed:.1f}s ({failed} failed)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Queued {count} photos; run_jobs will resize them'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media', '0003_mediaitem_media_status_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaitem',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
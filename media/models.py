@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.conf import settings
 
@@ -19,6 +21,8 @@ class MediaItem(models.Model):
     
     file = models.FileField(upload_to='gallery/')
     thumbnail = models.ImageField(upload_to='gallery/thumbnails/', blank=True, null=True)
+    # Resized JPEG/WebP copies written by media.derivatives
+    renditions = models.JSONField(default=dict, blank=True)
     
     uploaded_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='media_uploads')
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
@@ -29,8 +33,65 @@ class MediaItem(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='media_status_created_idx'),
+        ]
         verbose_name = 'Media Item'
         verbose_name_plural = 'Media Items'
     
     def __str__(self):
         return f"{self.title} ({self.get_media_type_display()})"
+    
+    def srcset(self, fmt='jpeg'):
+        """``srcset`` value listing the resized copies in ``fmt`` ('jpeg' or 'webp'), or ''."""
+        storage = self.file.storage
+        return ', '.join(
+            f"{storage.url(size[fmt])} {size['width']}w"
+            for size in self.renditions.get('sizes', [])
+            if size.get(fmt)
+        )
+    
+    @property
+    def jpeg_srcset(self):
+        return self.srcset('jpeg')
+    
+    @property
+    def webp_srcset(self):
+        return self.srcset('webp')
+
+
+class UploadSession(models.Model):
+    """A resumable chunked upload in progress (see ``media.uploads``)."""
+    STATUS_CHOICES = [
+        ('UPLOADING', 'Uploading'),
+        ('STORING', 'Storing'),
+        ('COMPLETE', 'Complete'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    uploaded_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='upload_sessions')
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    caption = models.TextField(blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='UPLOADING')
+    media_item = models.ForeignKey(MediaItem, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.filename} ({self.get_status_display()})"
+    
+    @property
+    def chunk_count(self):
+        return max(1, -(-self.size // self.chunk_size))
+    
+    def expected_length(self, index):
+        """Size in bytes of chunk ``index``; only the last one may be short."""
+        if index == self.chunk_count - 1:
+            return self.size - index * self.chunk_size
+        return self.chunk_size
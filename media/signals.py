@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from . import derivatives
+from .models import MediaItem
+
+
+@receiver(post_delete, sender=MediaItem)
+def delete_derivatives(sender, instance, **kwargs):
+    renditions = instance.renditions
+    storage = instance.file.storage
+    transaction.on_commit(lambda: derivatives.delete_files(renditions, storage=storage))
@@ -0,0 +1,230 @@
+"""
+Storing gallery uploads.
+
+A post can carry many files and, with Cloudinary, every file is a separate
+HTTPS upload. ``store_files()`` sends them through a small thread pool so a
+ten-photo post takes about as long as its slowest file rather than the sum
+of all of them. The threads only talk to the storage backend; the
+``MediaItem`` rows are inserted afterwards by the caller in one
+``bulk_create``.
+
+Large videos go through the resumable protocol instead of one multipart
+POST: the client starts an ``UploadSession``, PUTs the file in
+``CHUNK_SIZE`` pieces (each written atomically to its own file under
+``MEDIA_CHUNKED_UPLOAD_DIR``, so a retried chunk simply replaces itself)
+and asks which chunks arrived after a dropped connection. On completion
+the chunks are joined into one file on local disk and handed to the
+storage backend. Request bodies are read ``READ_BLOCK`` bytes at a time, so
+memory use does not grow with the file.
+"""
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import MediaItem, UploadSession
+
+
+UPLOAD_WORKERS = 4
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
+
+CHUNK_SIZE = 5 * 1024 * 1024
+READ_BLOCK = 64 * 1024
+
+# A session left STORING this long belongs to a request that died mid-way.
+STORING_STALE_AFTER = timedelta(minutes=30)
+
+# Unfinished sessions with no chunk for this long are deleted with their chunks.
+ABANDONED_AFTER = timedelta(days=1)
+
+
+@dataclass
+class StoredFile:
+    original_name: str
+    media_type: str = None
+    name: str = None
+    error: str = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def media_type_for(filename):
+    """'PHOTO', 'VIDEO' or None for an unsupported file, judged by extension."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in IMAGE_EXTENSIONS:
+        return 'PHOTO'
+    if extension in VIDEO_EXTENSIONS:
+        return 'VIDEO'
+    return None
+
+
+def _store(upload, name=None):
+    name = name or upload.name
+    result = StoredFile(name, media_type_for(name))
+    if result.media_type is None:
+        result.error = 'unsupported file type'
+        return result
+    field = MediaItem._meta.get_field('file')
+    try:
+        name = field.generate_filename(MediaItem(), name)
+        result.name = field.storage.save(name, upload, max_length=field.max_length)
+    except Exception as error:
+        result.error = str(error) or error.__class__.__name__
+    return result
+
+
+def store_files(uploads, workers=UPLOAD_WORKERS):
+    """
+    Save ``uploads`` to the media storage concurrently.
+
+    Returns one ``StoredFile`` per upload, in the same order, with either
+    the stored name or the reason it failed.
+    """
+    uploads = list(uploads)
+    if len(uploads) <= 1:
+        return [_store(upload) for upload in uploads]
+    with ThreadPoolExecutor(max_workers=min(workers, len(uploads))) as pool:
+        return list(pool.map(_store, uploads))
+
+
+def delete_stored(stored):
+    """Remove files saved by ``store_files`` whose rows could not be created."""
+    storage = MediaItem._meta.get_field('file').storage
+    for result in stored:
+        if result.name:
+            storage.delete(result.name)
+
+
+def chunk_dir(session):
+    root = settings.MEDIA_CHUNKED_UPLOAD_DIR or os.path.join(tempfile.gettempdir(), 'kpn-uploads')
+    return os.path.join(root, str(session.pk))
+
+
+def _chunk_path(session, index):
+    return os.path.join(chunk_dir(session), f'{index:06d}.part')
+
+
+def received_chunks(session):
+    """Indexes of the chunks of ``session`` already stored in full."""
+    try:
+        names = os.listdir(chunk_dir(session))
+    except FileNotFoundError:
+        return []
+    received = []
+    for name in names:
+        stem, extension = os.path.splitext(name)
+        if extension != '.part' or not stem.isdigit():
+            continue
+        index = int(stem)
+        if index < session.chunk_count and os.path.getsize(_chunk_path(session, index)) == session.expected_length(index):
+            received.append(index)
+    return sorted(received)
+
+
+def write_chunk(session, index, stream):
+    """
+    Store chunk ``index`` of ``session`` read from the file-like ``stream``.
+
+    Raises ``ValueError`` if the index is out of range or the body is not
+    exactly the expected length; a partly received chunk is discarded, so
+    the client can send it again.
+    """
+    if not 0 <= index < session.chunk_count:
+        raise ValueError(f'Chunk {index} is out of range')
+    expected = session.expected_length(index)
+    directory = chunk_dir(session)
+    os.makedirs(directory, exist_ok=True)
+
+    received = 0
+    with tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as part:
+        try:
+            while received <= expected:
+                block = stream.read(min(READ_BLOCK, expected + 1 - received))
+                if not block:
+                    break
+                part.write(block)
+                received += len(block)
+        except BaseException:
+            part.close()
+            os.unlink(part.name)
+            raise
+    if received != expected:
+        os.unlink(part.name)
+        raise ValueError(f'Chunk {index} should be {expected} bytes')
+    os.replace(part.name, _chunk_path(session, index))
+    UploadSession.objects.filter(pk=session.pk).update(updated_at=timezone.now())
+
+
+def missing_chunks(session):
+    received = set(received_chunks(session))
+    return [index for index in range(session.chunk_count) if index not in received]
+
+
+def claim(session):
+    """
+    Move ``session`` to STORING; False if another request is already storing it.
+
+    The conditional UPDATE keeps a double-clicked or retried "complete" from
+    storing the file twice.
+    """
+    now = timezone.now()
+    return bool(UploadSession.objects.filter(pk=session.pk).filter(
+        Q(status='UPLOADING') | Q(status='STORING', updated_at__lt=now - STORING_STALE_AFTER)
+    ).update(status='STORING', updated_at=now))
+
+
+def release(session):
+    """Put a session whose storing failed back to UPLOADING so it can be retried."""
+    UploadSession.objects.filter(pk=session.pk, status='STORING').update(
+        status='UPLOADING', updated_at=timezone.now(),
+    )
+
+
+def store_session(session):
+    """
+    Join the chunks of a fully received ``session`` and save the file to the
+    media storage. Returns a ``StoredFile``; the chunks are kept until the
+    caller ``discard()``s them, so a failure afterwards can still be retried.
+    """
+    missing = missing_chunks(session)
+    if missing:
+        return StoredFile(session.filename, error=f'{len(missing)} chunk(s) have not been received')
+
+    assembled = os.path.join(chunk_dir(session), 'assembled')
+    with open(assembled, 'wb') as destination:
+        for index in range(session.chunk_count):
+            with open(_chunk_path(session, index), 'rb') as chunk:
+                shutil.copyfileobj(chunk, destination, READ_BLOCK)
+    try:
+        with open(assembled, 'rb') as source:
+            result = _store(File(source), name=session.filename)
+    finally:
+        os.unlink(assembled)
+    return result
+
+
+def discard(session):
+    """Delete whatever chunks of ``session`` are on disk."""
+    shutil.rmtree(chunk_dir(session), ignore_errors=True)
+
+
+def purge_abandoned():
+    """Delete sessions idle for ``ABANDONED_AFTER`` together with their chunks."""
+    expired = UploadSession.objects.filter(updated_at__lt=timezone.now() - ABANDONED_AFTER)
+    count = 0
+    for session in expired.iterator():
+        discard(session)
+        session.delete()
+        count += 1
+    return count
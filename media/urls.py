@@ -5,6 +5,10 @@ app_name = 'media'
 
 urlpatterns = [
     path('create/', views.create_media, name='create_media'),
+    path('uploads/', views.start_upload, name='start_upload'),
+    path('uploads/<uuid:pk>/', views.upload_status, name='upload_status'),
+    path('uploads/<uuid:pk>/chunks/<int:index>/', views.upload_chunk, name='upload_chunk'),
+    path('uploads/<uuid:pk>/complete/', views.complete_upload, name='complete_upload'),
     path('my-media/', views.my_media, name='my_media'),
     path('<int:pk>/edit/', views.edit_media, name='edit_media'),
     path('<int:pk>/delete/', views.delete_media, name='delete_media'),
@@ -1,10 +1,15 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from .models import MediaItem
-from .forms import MediaUploadForm, MediaItemEditForm
+from django.db import transaction
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_GET, require_POST, require_http_methods
+from core.pagecache import GALLERY_PAGES
+from .models import MediaItem, UploadSession
+from . import derivatives, uploads
+from .forms import ChunkedUploadForm, MediaUploadForm, MediaItemEditForm
 from staff.decorators import specific_role_required, approved_leader_required
-import os
 
 
 def publicity_officer_required(view_func):
@@ -32,6 +37,31 @@ def publicity_officer_required(view_func):
     return wrapper
 
 
+def _is_director(user):
+    return bool(user.role_definition and user.role_definition.title == 'Director of Media & Publicity')
+
+
+def _new_media_item(user, result, caption):
+    """Unsaved MediaItem for a stored upload; auto-approved for the Director"""
+    is_director = _is_director(user)
+    return MediaItem(
+        title=f"Media by {user.get_full_name()}",
+        description=caption,
+        media_type=result.media_type,
+        file=result.name,
+        uploaded_by=user,
+        status='APPROVED' if is_director else 'PENDING',
+        approved_by=user if is_director else None
+    )
+
+
+def _uploaded_message(request, count):
+    if _is_director(request.user):
+        messages.success(request, f'Successfully uploaded {count} media file(s) to the gallery!')
+    else:
+        messages.success(request, f'Successfully uploaded {count} media file(s). They are pending approval by the Director of Media & Publicity.')
+
+
 @publicity_officer_required
 def create_media(request):
     """Create media posts with multiple file uploads"""
@@ -41,41 +71,34 @@ def create_media(request):
         
         if form.is_valid() and files:
             caption = form.cleaned_data['caption']
-            uploaded_count = 0
             
-            is_director = request.user.role_definition and request.user.role_definition.title == 'Director of Media & Publicity'
+            is_director = _is_director(request.user)
             
-            for file in files:
-                # Determine media type based on file extension
-                file_ext = os.path.splitext(file.name)[1].lower()
-                image_exts = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-                video_exts = ['.mp4', '.mov', '.avi', '.mkv', '.webm']
-                
-                if file_ext in image_exts:
-                    media_type = 'PHOTO'
-                elif file_ext in video_exts:
-                    media_type = 'VIDEO'
-                else:
-                    continue  # Skip unsupported files
-                
-                # Create media item with role information
-                # Auto-approve for Director, pending for others
-                media_item = MediaItem.objects.create(
-                    title=f"Media by {request.user.get_full_name()}",
-                    description=caption,
-                    media_type=media_type,
-                    file=file,
-                    uploaded_by=request.user,
-                    status='APPROVED' if is_director else 'PENDING',
-                    approved_by=request.user if is_director else None
-                )
-                uploaded_count += 1
+            stored = uploads.store_files(files)
+            saved = [result for result in stored if result.ok]
+            failed = [result for result in stored if not result.ok]
+            
+            # Auto-approve for Director, pending for others
+            try:
+                media_items = MediaItem.objects.bulk_create([
+                    _new_media_item(request.user, result, caption) for result in saved
+                ])
+            except Exception:
+                uploads.delete_stored(saved)
+                raise
+            
+            # bulk_create skips the signals that refresh the public gallery
+            if is_director and media_items:
+                transaction.on_commit(GALLERY_PAGES.bump)
+            for media_item in media_items:
+                derivatives.schedule(media_item)
+            uploaded_count = len(media_items)
+            
+            for result in failed:
+                messages.warning(request, f'{result.original_name} was not uploaded: {result.error}.')
             
             if uploaded_count > 0:
-                if is_director:
-                    messages.success(request, f'Successfully uploaded {uploaded_count} media file(s) to the gallery!')
-                else:
-                    messages.success(request, f'Successfully uploaded {uploaded_count} media file(s). They are pending approval by the Director of Media & Publicity.')
+                _uploaded_message(request, uploaded_count)
                 return redirect('media:my_media')
             else:
                 messages.error(request, 'No valid media files were uploaded.')
@@ -88,6 +111,97 @@ def create_media(request):
     return render(request, 'media/create_media.html', {'form': form})
 
 
+def _upload_state(session):
+    return {
+        'id': str(session.pk),
+        'status': session.status,
+        'size': session.size,
+        'chunk_size': session.chunk_size,
+        'chunk_count': session.chunk_count,
+        'received': uploads.received_chunks(session) if session.status != 'COMPLETE' else [],
+        'status_url': reverse('media:upload_status', args=[session.pk]),
+        'complete_url': reverse('media:complete_upload', args=[session.pk]),
+    }
+
+
+@publicity_officer_required
+@require_POST
+def start_upload(request):
+    """Start a resumable chunked upload of one large file (JSON API)"""
+    form = ChunkedUploadForm(request.POST)
+    if not form.is_valid():
+        return JsonResponse({'errors': form.errors.get_json_data()}, status=400)
+    
+    # Housekeeping for uploads that were never finished
+    uploads.purge_abandoned()
+    session = UploadSession.objects.create(
+        uploaded_by=request.user,
+        filename=form.cleaned_data['filename'],
+        size=form.cleaned_data['size'],
+        chunk_size=uploads.CHUNK_SIZE,
+        caption=form.cleaned_data['caption'],
+    )
+    return JsonResponse(_upload_state(session), status=201)
+
+
+@publicity_officer_required
+@require_GET
+def upload_status(request, pk):
+    """Which chunks of an upload have arrived, for resuming after a dropped connection"""
+    session = get_object_or_404(UploadSession, pk=pk, uploaded_by=request.user)
+    return JsonResponse(_upload_state(session))
+
+
+@publicity_officer_required
+@require_http_methods(['PUT'])
+def upload_chunk(request, pk, index):
+    """Store one chunk; the raw request body is the chunk. Sending it again replaces it."""
+    session = get_object_or_404(UploadSession, pk=pk, uploaded_by=request.user)
+    if session.status != 'UPLOADING':
+        return JsonResponse({'error': 'This upload has already been completed.'}, status=409)
+    try:
+        uploads.write_chunk(session, index, request)
+    except ValueError as error:
+        return JsonResponse({'error': str(error)}, status=400)
+    return JsonResponse({'index': index, 'size': session.expected_length(index)})
+
+
+@publicity_officer_required
+@require_POST
+def complete_upload(request, pk):
+    """Assemble the chunks, save the file to media storage and create the MediaItem"""
+    session = get_object_or_404(UploadSession, pk=pk, uploaded_by=request.user)
+    if session.status != 'COMPLETE':
+        if not uploads.claim(session):
+            return JsonResponse({'error': 'This upload is already being saved.'}, status=409)
+        try:
+            result = uploads.store_session(session)
+            if not result.ok:
+                uploads.release(session)
+                return JsonResponse({'error': result.error, 'missing': uploads.missing_chunks(session)}, status=409)
+            try:
+                with transaction.atomic():
+                    media_item = _new_media_item(request.user, result, session.caption)
+                    media_item.save()
+                    session.status = 'COMPLETE'
+                    session.media_item = media_item
+                    session.save(update_fields=['status', 'media_item', 'updated_at'])
+            except Exception:
+                uploads.delete_stored([result])
+                raise
+        except Exception:
+            uploads.release(session)
+            raise
+        uploads.discard(session)
+        derivatives.schedule(media_item)
+        _uploaded_message(request, 1)
+    
+    return JsonResponse({
+        'media_item': session.media_item_id,
+        'redirect': reverse('media:my_media'),
+    })
+
+
 @publicity_officer_required
 def my_media(request):
     """List all media posts uploaded by the current user"""
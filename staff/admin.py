@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import transaction
 from django.utils import timezone
 from .models import User, DisciplinaryAction, WomensProgram, YouthProgram, WelfareProgram, Announcement
 
@@ -18,7 +19,14 @@ approve_members.short_description = "Approve selected members"
 
 def suspend_members(modeladmin, request, queryset):
     """Action to suspend selected members"""
-    suspended_count = queryset.update(status='SUSPENDED')
+    suspended_count = 0
+    # Saved one by one, not with update(), so the signals keep the membership
+    # rollup, statistics and supervisor directory in step
+    with transaction.atomic():
+        for user in queryset.exclude(status='SUSPENDED'):
+            user.status = 'SUSPENDED'
+            user.save(update_fields=['status'])
+            suspended_count += 1
     modeladmin.message_user(request, f'{suspended_count} member(s) have been suspended.')
 suspend_members.short_description = "Suspend selected members"
 
@@ -0,0 +1,40 @@
+"""
+Cached announcement lists.
+
+Every authenticated page shows the announcements for the member's zone, LGA
+and ward, and all members of a ward see the same list. The resolved list is
+cached per (zone, lga, ward) under a shared version key that is bumped
+whenever an announcement is saved or deleted (see ``staff.signals``). Each
+entry also expires no later than the earliest ``expires_at`` it contains,
+so lapsed announcements disappear on time.
+"""
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.caching import Namespace
+
+from .models import Announcement
+
+
+ANNOUNCEMENTS_TTL = 300
+LIMIT = 10
+
+NAMESPACE = Namespace('staff', 'announcements')
+
+
+def for_user(user):
+    """The (at most ``LIMIT``) active announcements ``user`` should see."""
+    key = NAMESPACE.key(user.zone_id, user.lga_id, user.ward_id)
+    announcements = cache.get(key)
+    if announcements is None:
+        announcements = list(Announcement.for_user(user)[:LIMIT])
+        ttl = ANNOUNCEMENTS_TTL
+        expiries = [announcement.expires_at for announcement in announcements if announcement.expires_at]
+        if expiries:
+            ttl = min(ttl, max(1, int((min(expiries) - timezone.now()).total_seconds())))
+        cache.set(key, announcements, ttl)
+    return announcements
+
+
+def invalidate():
+    NAMESPACE.bump()
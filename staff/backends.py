@@ -0,0 +1,19 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class UserBackend(ModelBackend):
+    """
+    ModelBackend that loads the session user together with the role
+    definition and geography that nearly every page reads, in one query.
+    """
+
+    related = ('role_definition', 'zone', 'lga', 'ward')
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related(*self.related).get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -1,4 +1,6 @@
-from .models import Announcement
+from django.utils.functional import SimpleLazyObject
+
+from . import announcements as cached_announcements
 
 
 def announcements(request):
@@ -8,7 +10,8 @@ def announcements(request):
     user_announcements = []
     
     if request.user.is_authenticated:
-        user_announcements = Announcement.for_user(request.user)[:10]
+        user = request.user
+        user_announcements = SimpleLazyObject(lambda: cached_announcements.for_user(user))
     
     return {
         'user_announcements': user_announcements
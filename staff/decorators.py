@@ -2,13 +2,14 @@ from functools import wraps
 from django.shortcuts import redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from .memo import user_memo
 
 def role_required(*allowed_roles):
     def decorator(view_func):
         @wraps(view_func)
         @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if request.user.status != 'APPROVED':
+            if not user_memo(request).is_approved:
                 messages.error(request, 'Your account is not approved yet.')
                 return redirect('core:home')
             
@@ -25,11 +26,11 @@ def specific_role_required(*role_titles):
         @wraps(view_func)
         @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if request.user.status != 'APPROVED':
+            if not user_memo(request).is_approved:
                 messages.error(request, 'Your account is not approved yet.')
                 return redirect('core:home')
             
-            if not request.user.role_definition or request.user.role_definition.title not in role_titles:
+            if user_memo(request).role_title not in role_titles:
                 messages.error(request, 'You do not have permission to access this page.')
                 return redirect('staff:dashboard')
             
@@ -41,11 +42,11 @@ def approved_leader_required(view_func):
     @wraps(view_func)
     @login_required
     def _wrapped_view(request, *args, **kwargs):
-        if request.user.status != 'APPROVED':
+        if not user_memo(request).is_approved:
             messages.error(request, 'Your account is not approved yet.')
             return redirect('core:home')
         
-        if not request.user.is_leader():
+        if not user_memo(request).is_leader:
             messages.error(request, 'This page is only accessible to leaders.')
             return redirect('staff:dashboard')
         
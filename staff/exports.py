@@ -0,0 +1,52 @@
+from core.exports import Column, as_date, as_datetime, display, full_name
+from core.models import Report
+from .models import User
+
+
+def jurisdiction(role, zone, lga, ward):
+    """Same as User.get_jurisdiction(), from exported values."""
+    if role == 'STATE':
+        return 'State'
+    elif role == 'ZONAL' and zone:
+        return zone
+    elif role == 'LGA' and lga:
+        return lga
+    elif role == 'WARD' and ward:
+        return ward
+    return 'N/A'
+
+
+MEMBER_COLUMNS = [
+    Column('Name', 'first_name', 'last_name', format=full_name),
+    Column('Phone', 'phone'),
+    Column('Email', 'email'),
+    Column('Gender', 'gender', format=display(User.GENDER_CHOICES)),
+    Column('Role', 'role', format=display(User.ROLE_CHOICES)),
+    Column('Location', 'role', 'zone__name', 'lga__name', 'ward__name', format=jurisdiction),
+    Column('Date Joined', 'created_at', format=as_date),
+]
+
+CONTACT_COLUMNS = [
+    Column('Name', 'first_name', 'last_name', format=full_name),
+    Column('Phone', 'phone'),
+    Column('Role', 'role', format=display(User.ROLE_CHOICES)),
+    Column('Zone', 'zone__name'),
+    Column('LGA', 'lga__name'),
+    Column('Ward', 'ward__name'),
+    Column('Gender', 'gender', format=display(User.GENDER_CHOICES)),
+    Column('Status', 'status', format=display(User.STATUS_CHOICES)),
+]
+
+REPORT_COLUMNS = [
+    Column('Title', 'title'),
+    Column('Type', 'report_type', format=display(Report.REPORT_TYPE_CHOICES)),
+    Column('Period', 'period'),
+    Column('Status', 'status', format=display(Report.STATUS_CHOICES)),
+    Column('Submitted By', 'submitted_by__first_name', 'submitted_by__last_name', format=full_name, key='submitted_by'),
+    Column('Submitted To', 'submitted_to__first_name', 'submitted_to__last_name', format=full_name, key='submitted_to'),
+    Column('Reviewed By', 'reviewed_by__first_name', 'reviewed_by__last_name', format=full_name, key='reviewed_by'),
+    Column('Deadline', 'deadline', format=as_date),
+    Column('Created', 'created_at', format=as_datetime),
+    Column('Submitted At', 'submitted_at', format=as_datetime),
+    Column('Reviewed At', 'reviewed_at', format=as_datetime),
+]
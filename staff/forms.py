@@ -1,6 +1,7 @@
 from django import forms
 from .models import User, DisciplinaryAction, WomensProgram, YouthProgram, WelfareProgram, CommunityOutreach, WardMeeting, WardMeetingAttendance, Announcement
-from leadership.models import RoleDefinition, Zone, LGA, Ward
+from leadership.models import RoleDefinition
+from leadership.fields import ZoneChoiceField, LGAChoiceField, WardChoiceField
 from core.models import FAQ
 
 
@@ -14,20 +15,17 @@ class EditMemberRoleForm(forms.ModelForm):
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    zone = forms.ModelChoiceField(
-        queryset=Zone.objects.all(),
+    zone = ZoneChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    lga = forms.ModelChoiceField(
-        queryset=LGA.objects.all(),
+    lga = LGAChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    ward = forms.ModelChoiceField(
-        queryset=Ward.objects.all(),
+    ward = WardChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
@@ -42,20 +40,20 @@ class EditMemberRoleForm(forms.ModelForm):
         if 'zone' in self.data:
             try:
                 zone_id = int(self.data.get('zone'))
-                self.fields['lga'].queryset = LGA.objects.filter(zone_id=zone_id).order_by('name')
+                self.fields['lga'].restrict(zone_id=zone_id)
             except (ValueError, TypeError):
                 pass
-        elif self.instance.pk and self.instance.zone:
-            self.fields['lga'].queryset = self.instance.zone.lgas.order_by('name')
+        elif self.instance.pk and self.instance.zone_id:
+            self.fields['lga'].restrict(zone_id=self.instance.zone_id)
         
         if 'lga' in self.data:
             try:
                 lga_id = int(self.data.get('lga'))
-                self.fields['ward'].queryset = Ward.objects.filter(lga_id=lga_id).order_by('name')
+                self.fields['ward'].restrict(lga_id=lga_id)
             except (ValueError, TypeError):
                 pass
-        elif self.instance.pk and self.instance.lga:
-            self.fields['ward'].queryset = self.instance.lga.wards.order_by('name')
+        elif self.instance.pk and self.instance.lga_id:
+            self.fields['ward'].restrict(lga_id=self.instance.lga_id)
     
     def clean(self):
         cleaned_data = super().clean()
@@ -117,20 +115,17 @@ class PromoteMemberForm(forms.Form):
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    zone = forms.ModelChoiceField(
-        queryset=Zone.objects.all(),
+    zone = ZoneChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    lga = forms.ModelChoiceField(
-        queryset=LGA.objects.all(),
+    lga = LGAChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    ward = forms.ModelChoiceField(
-        queryset=Ward.objects.all(),
+    ward = WardChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
@@ -173,20 +168,17 @@ class DemoteMemberForm(forms.Form):
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    zone = forms.ModelChoiceField(
-        queryset=Zone.objects.all(),
+    zone = ZoneChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    lga = forms.ModelChoiceField(
-        queryset=LGA.objects.all(),
+    lga = LGAChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    ward = forms.ModelChoiceField(
-        queryset=Ward.objects.all(),
+    ward = WardChoiceField(
         required=False,
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
@@ -289,22 +281,19 @@ class DisciplinaryActionForm(forms.ModelForm):
 class MemberMobilizationFilterForm(forms.Form):
     """Advanced filter form for member mobilization and contact list generation"""
     
-    zone = forms.ModelChoiceField(
-        queryset=Zone.objects.all(),
+    zone = ZoneChoiceField(
         required=False,
         empty_label="All Zones",
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    lga = forms.ModelChoiceField(
-        queryset=LGA.objects.all(),
+    lga = LGAChoiceField(
         required=False,
         empty_label="All LGAs",
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
     )
     
-    ward = forms.ModelChoiceField(
-        queryset=Ward.objects.all(),
+    ward = WardChoiceField(
         required=False,
         empty_label="All Wards",
         widget=forms.Select(attrs={'class': 'w-full p-2 border rounded dark:bg-gray-700'})
@@ -349,7 +338,7 @@ class MemberMobilizationFilterForm(forms.Form):
         if 'zone' in self.data:
             try:
                 zone_id = int(self.data.get('zone'))
-                self.fields['lga'].queryset = LGA.objects.filter(zone_id=zone_id).order_by('name')
+                self.fields['lga'].restrict(zone_id=zone_id)
             except (ValueError, TypeError):
                 pass
         
@@ -357,9 +346,40 @@ class MemberMobilizationFilterForm(forms.Form):
         if 'lga' in self.data:
             try:
                 lga_id = int(self.data.get('lga'))
-                self.fields['ward'].queryset = Ward.objects.filter(lga_id=lga_id).order_by('name')
+                self.fields['ward'].restrict(lga_id=lga_id)
             except (ValueError, TypeError):
                 pass
+    
+    def filter_members(self, members):
+        """Apply the selected filters to ``members``; unbound or invalid forms leave it unchanged"""
+        if not self.is_valid():
+            return members
+        
+        if self.cleaned_data.get('zone'):
+            members = members.filter(zone=self.cleaned_data['zone'])
+        
+        if self.cleaned_data.get('lga'):
+            members = members.filter(lga=self.cleaned_data['lga'])
+        
+        if self.cleaned_data.get('ward'):
+            members = members.filter(ward=self.cleaned_data['ward'])
+        
+        if self.cleaned_data.get('role'):
+            members = members.filter(role=self.cleaned_data['role'])
+        
+        if self.cleaned_data.get('tier'):
+            members = members.filter(role=self.cleaned_data['tier'])
+        
+        if self.cleaned_data.get('gender'):
+            members = members.filter(gender=self.cleaned_data['gender'])
+        
+        if self.cleaned_data.get('status'):
+            members = members.filter(status=self.cleaned_data['status'])
+        else:
+            # If no status filter selected, default to APPROVED members only
+            members = members.filter(status='APPROVED')
+        
+        return members
 
 
 class WomensProgramForm(forms.ModelForm):
@@ -735,8 +755,7 @@ class CommunityOutreachForm(forms.ModelForm):
 class WardMeetingForm(forms.ModelForm):
     """Form for creating and managing ward meetings"""
     
-    ward = forms.ModelChoiceField(
-        queryset=Ward.objects.all(),
+    ward = WardChoiceField(
         widget=forms.Select(attrs={
             'class': 'w-full px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-kpn-blue dark:bg-gray-700 dark:text-white'
         })
@@ -807,9 +826,9 @@ class WardMeetingForm(forms.ModelForm):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         
-        if user and user.ward:
-            self.fields['ward'].initial = user.ward
-            self.fields['ward'].queryset = Ward.objects.filter(pk=user.ward.pk)
+        if user and user.ward_id:
+            self.fields['ward'].initial = user.ward_id
+            self.fields['ward'].restrict(pk=user.ward_id)
 
 
 class WardMeetingAttendanceForm(forms.Form):
@@ -869,8 +888,7 @@ class AnnouncementForm(forms.ModelForm):
         })
     )
     
-    target_zone = forms.ModelChoiceField(
-        queryset=Zone.objects.all(),
+    target_zone = ZoneChoiceField(
         required=False,
         widget=forms.Select(attrs={
             'class': 'w-full px-4 py-3 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-kpn-green dark:bg-gray-700 dark:text-white',
@@ -878,8 +896,7 @@ class AnnouncementForm(forms.ModelForm):
         })
     )
     
-    target_lga = forms.ModelChoiceField(
-        queryset=LGA.objects.all(),
+    target_lga = LGAChoiceField(
         required=False,
         widget=forms.Select(attrs={
             'class': 'w-full px-4 py-3 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-kpn-green dark:bg-gray-700 dark:text-white',
@@ -887,8 +904,7 @@ class AnnouncementForm(forms.ModelForm):
         })
     )
     
-    target_ward = forms.ModelChoiceField(
-        queryset=Ward.objects.all(),
+    target_ward = WardChoiceField(
         required=False,
         widget=forms.Select(attrs={
             'class': 'w-full px-4 py-3 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-kpn-green dark:bg-gray-700 dark:text-white',
@@ -915,31 +931,31 @@ class AnnouncementForm(forms.ModelForm):
         if user:
             if user.role == 'STATE':
                 pass
-            elif user.role == 'ZONAL' and user.zone:
+            elif user.role == 'ZONAL' and user.zone_id:
                 self.fields['scope'].choices = [
                     ('ZONAL', 'Zonal - Specific Zone'),
                     ('LGA', 'LGA - Specific LGA'),
                     ('WARD', 'Ward - Specific Ward'),
                 ]
-                self.fields['target_zone'].queryset = Zone.objects.filter(pk=user.zone.pk)
-                self.fields['target_zone'].initial = user.zone
-                self.fields['target_lga'].queryset = LGA.objects.filter(zone=user.zone)
-                self.fields['target_ward'].queryset = Ward.objects.filter(lga__zone=user.zone)
-            elif user.role == 'LGA' and user.lga:
+                self.fields['target_zone'].restrict(pk=user.zone_id)
+                self.fields['target_zone'].initial = user.zone_id
+                self.fields['target_lga'].restrict(zone_id=user.zone_id)
+                self.fields['target_ward'].restrict(zone_id=user.zone_id)
+            elif user.role == 'LGA' and user.lga_id:
                 self.fields['scope'].choices = [
                     ('LGA', 'LGA - Specific LGA'),
                     ('WARD', 'Ward - Specific Ward'),
                 ]
-                self.fields['target_lga'].queryset = LGA.objects.filter(pk=user.lga.pk)
-                self.fields['target_lga'].initial = user.lga
-                self.fields['target_ward'].queryset = Ward.objects.filter(lga=user.lga)
+                self.fields['target_lga'].restrict(pk=user.lga_id)
+                self.fields['target_lga'].initial = user.lga_id
+                self.fields['target_ward'].restrict(lga_id=user.lga_id)
                 del self.fields['target_zone']
-            elif user.role == 'WARD' and user.ward:
+            elif user.role == 'WARD' and user.ward_id:
                 self.fields['scope'].choices = [
                     ('WARD', 'Ward - Specific Ward'),
                 ]
-                self.fields['target_ward'].queryset = Ward.objects.filter(pk=user.ward.pk)
-                self.fields['target_ward'].initial = user.ward
+                self.fields['target_ward'].restrict(pk=user.ward_id)
+                self.fields['target_ward'].initial = user.ward_id
                 del self.fields['target_zone']
                 del self.fields['target_lga']
     
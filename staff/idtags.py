@@ -0,0 +1,416 @@
+"""
+Member ID tags.
+
+The tag template, fonts and photo mask are loaded once per process and kept
+in memory. A rendered tag depends only on the fields returned by
+``tag_fields()``, so the PDF is cached under a hash of those fields: a tag
+is re-rendered only after the member's name, position, location or photo
+changes. Images go to reportlab through ``ImageReader`` without touching
+the filesystem.
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+from io import BytesIO
+
+import qrcode
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from PIL import Image, ImageDraw, ImageFont
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas as pdf_canvas
+
+from core.caching import make_key
+
+
+# Bump when the tag layout changes so cached PDFs are not reused.
+LAYOUT_VERSION = 1
+
+CACHE_TTL = 60 * 60 * 24 * 30
+
+# A tag rendered without its photo because the download failed is only kept
+# briefly, so the next request retries the photo.
+MISSING_PHOTO_TTL = 60 * 5
+
+PHOTO_TIMEOUT = (3, 10)
+
+ROLE_SHORTENING = {
+    'President': 'President',
+    'Vice President': 'Vice President',
+    'General Secretary': 'General Secretary',
+    'Assistant General Secretary': 'Asst. Secretary',
+    'State Supervisor': 'State Supervisor',
+    'Legal & Ethics Adviser': 'Legal Adviser',
+    'Treasurer': 'Treasurer',
+    'Financial Secretary': 'Finance Secretary',
+    'Director of Mobilization': 'Mobilization Dir.',
+    'Assistant Director of Mobilization': 'Asst. Mobilization',
+    'Organizing Secretary': 'Organizer',
+    'Assistant Organizing Secretary': 'Asst. Organizer',
+    'Auditor General': 'Auditor General',
+    'Welfare Officer': 'Welfare Officer',
+    'Youth Development & Empowerment Officer': 'Youth Officer',
+    'Women Leader': 'Women Leader',
+    'Assistant Women Leader': 'Asst. Women Lead',
+    'Director of Media & Publicity': 'Publicity Officer',
+    'Assistant Director of Media & Publicity': 'Asst. Publicity',
+    'Public Relations & Community Engagement Officer': 'PR Officer',
+    'Zonal Coordinator': 'Zonal Coordinator.',
+    'Zonal Secretary': 'Zonal Secretary',
+    'Zonal Publicity Officer': 'Zonal Publicity',
+    'LGA Coordinator': 'LGA Coordinator',
+    'Secretary': 'Secretary',
+    'Publicity Officer': 'Publicity',
+    'Contact & Mobilization': 'Contact Officer',
+    'LGA Supervisor': 'LGA Supervisor',
+    'LGA Adviser': 'LGA Adviser',
+    'Ward Coordinator': 'Ward Coordinator',
+    'Ward Supervisor': 'Ward Supervisor',
+    'Ward Adviser': 'Ward Adviser',
+}
+
+# Layout of id_tag_template.png (about 458 x 812 pixels)
+PHOTO_CENTER = (239, 385)  # Center of the white circle for photo
+PHOTO_RADIUS = 169
+NAME_Y = 577
+POSITION_Y = 637
+ADDRESS_Y = 687
+TEXT_X = 229  # Center X for all text
+QR_POSITION = (11, 720)  # White square at bottom left
+QR_SIZE = 99
+TEXT_COLOR = (30, 58, 79)  # Navy blue from template
+
+# The PDF page is the tag scaled up for print quality
+PDF_SCALE = 1.5
+
+FONT_BOLD = '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
+FONT_REGULAR = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+
+class TagAssets:
+    """Template image, fonts and photo mask shared by every tag rendered in this process."""
+
+    def __init__(self):
+        template_path = os.path.join(settings.STATIC_ROOT, 'images', 'id_tag_template.png')
+        if not os.path.exists(template_path):
+            template_path = os.path.join(settings.BASE_DIR, 'static', 'images', 'id_tag_template.png')
+        with Image.open(template_path) as template:
+            self.template = template.convert('RGB')
+        stat = os.stat(template_path)
+        self.template_version = f'{stat.st_size}-{int(stat.st_mtime)}'
+
+        try:
+            self.font_large = ImageFont.truetype(FONT_BOLD, 24)
+            self.font_medium = ImageFont.truetype(FONT_REGULAR, 20)
+            self.font_small = ImageFont.truetype(FONT_REGULAR, 18)
+        except OSError:
+            self.font_large = self.font_medium = self.font_small = ImageFont.load_default()
+
+        size = PHOTO_RADIUS * 2
+        self.photo_mask = Image.new('L', (size, size), 0)
+        ImageDraw.Draw(self.photo_mask).ellipse((0, 0, size, size), fill=255)
+
+
+@lru_cache(maxsize=1)
+def get_assets():
+    return TagAssets()
+
+
+def tag_position(user):
+    if user.role == 'GENERAL':
+        return 'Member'
+    if user.role_definition:
+        role_title = user.role_definition.title
+        return ROLE_SHORTENING.get(role_title, role_title)
+    return user.get_role_display()
+
+
+def tag_address(user):
+    address_parts = []
+    if user.ward:
+        address_parts.append(user.ward.name)
+    if user.lga:
+        address_parts.append(user.lga.name)
+    if user.zone:
+        address_parts.append(user.zone.name)
+    return ', '.join(address_parts) if address_parts else 'Kebbi State'
+
+
+def tag_fields(user, profile_url):
+    """Everything printed on a member's tag."""
+    return {
+        'name': user.get_full_name() or user.username,
+        'position': tag_position(user),
+        'address': tag_address(user),
+        'photo': user.photo.name if user.photo else '',
+        'profile_url': profile_url,
+    }
+
+
+def cache_key(fields):
+    payload = json.dumps(
+        [LAYOUT_VERSION, get_assets().template_version, fields],
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return make_key('staff', 'idtag', hashlib.sha256(payload.encode('utf-8')).hexdigest())
+
+
+def load_photo(name):
+    """Open the profile photo stored as ``name`` (local or cloud storage), or return None."""
+    try:
+        url = default_storage.url(name)
+        if url.startswith('http'):
+            import requests
+            response = requests.get(url, timeout=PHOTO_TIMEOUT)
+            response.raise_for_status()
+            data = response.content
+        else:
+            with default_storage.open(name, 'rb') as handle:
+                data = handle.read()
+        photo = Image.open(BytesIO(data))
+        # Decode now so a truncated download counts as a failed load
+        photo.load()
+        return photo
+    except Exception:
+        # If photo fails to load, the tag is rendered without it
+        return None
+
+
+def circular_photo(photo, assets):
+    photo = photo.convert('RGB')
+
+    # Crop photo to square before resizing
+    width, height = photo.size
+    side = min(width, height)
+    left = (width - side) // 2
+    top = (height - side) // 2
+    photo = photo.crop((left, top, left + side, top + side))
+
+    size = PHOTO_RADIUS * 2
+    photo = photo.resize((size, size), Image.Resampling.LANCZOS)
+    photo.putalpha(assets.photo_mask)
+    return photo
+
+
+def qr_image(data):
+    qr = qrcode.QRCode(version=1, box_size=10, border=0)
+    qr.add_data(data)
+    qr.make(fit=True)
+    image = qr.make_image(fill_color='black', back_color='white').get_image()
+    return image.resize((QR_SIZE, QR_SIZE), Image.Resampling.LANCZOS)
+
+
+def _draw_centered(draw, y, text, font):
+    bbox = draw.textbbox((0, 0), text, font=font)
+    width = bbox[2] - bbox[0]
+    draw.text((TEXT_X - width // 2, y), text, fill=TEXT_COLOR, font=font)
+
+
+def render_tag_image(fields, photo=None, qr=None, assets=None):
+    """
+    Draw a tag as a PIL image.
+
+    ``photo`` is the member's photo as a PIL image (or None) and ``qr`` an
+    already rendered QR code; it is generated from ``profile_url`` if omitted.
+    """
+    assets = assets or get_assets()
+    tag = assets.template.copy()
+
+    if photo is not None:
+        try:
+            circle = circular_photo(photo, assets)
+            tag.paste(circle, (PHOTO_CENTER[0] - PHOTO_RADIUS, PHOTO_CENTER[1] - PHOTO_RADIUS), circle)
+        except Exception:
+            pass
+
+    tag.paste(qr if qr is not None else qr_image(fields['profile_url']), QR_POSITION)
+
+    draw = ImageDraw.Draw(tag)
+    _draw_centered(draw, NAME_Y, fields['name'], assets.font_large)
+    _draw_centered(draw, POSITION_Y, fields['position'], assets.font_medium)
+    _draw_centered(draw, ADDRESS_Y, fields['address'], assets.font_small)
+    return tag
+
+
+def render_tag_pdf(tag):
+    """A single-page PDF the size of the (scaled) tag."""
+    page_width = tag.width * PDF_SCALE
+    page_height = tag.height * PDF_SCALE
+    buffer = BytesIO()
+    canvas = pdf_canvas.Canvas(buffer, pagesize=(page_width, page_height))
+    canvas.drawImage(ImageReader(tag), 0, 0, width=page_width, height=page_height, preserveAspectRatio=True)
+    canvas.showPage()
+    canvas.save()
+    return buffer.getvalue()
+
+
+def get_tag_pdf(user, profile_url):
+    """Return the member's tag PDF, rendering it only if its content changed."""
+    fields = tag_fields(user, profile_url)
+    key = cache_key(fields)
+    pdf = cache.get(key)
+    if pdf is None:
+        photo = load_photo(fields['photo']) if fields['photo'] else None
+        pdf = render_tag_pdf(render_tag_image(fields, photo))
+        photo_missing = bool(fields['photo']) and photo is None
+        cache.set(key, pdf, MISSING_PHOTO_TTL if photo_missing else CACHE_TTL)
+    return pdf
+
+
+# Bulk printing: tags at badge size (86 mm tall), laid out on A4 sheets
+# with a light cut line around each tag.
+SHEET_SIZE = A4
+SHEET_MARGIN = 10 * mm
+SHEET_GAP = 4 * mm
+SHEET_TAG_HEIGHT = 86 * mm
+SHEET_JPEG_QUALITY = 90
+
+DEFAULT_SITE_URL = 'https://kpn.com.ng'
+
+
+def jurisdiction_members(zone_id=None, lga_id=None, ward_id=None):
+    """Approved members of a ward, LGA or zone (the whole state if none is given)."""
+    from .models import User
+    members = User.objects.filter(status='APPROVED', is_superuser=False)
+    if ward_id:
+        members = members.filter(ward_id=ward_id)
+    elif lga_id:
+        members = members.filter(lga_id=lga_id)
+    elif zone_id:
+        members = members.filter(zone_id=zone_id)
+    return members.select_related('role_definition', 'zone', 'lga', 'ward').order_by('last_name', 'first_name')
+
+
+def bulk_fields(members, site_url=DEFAULT_SITE_URL):
+    """``tag_fields()`` for every member, with profile links on ``site_url``."""
+    from django.urls import reverse
+    site_url = site_url.rstrip('/')
+    return [
+        tag_fields(member, site_url + reverse('core:view_profile', args=[member.id]))
+        for member in members
+    ]
+
+
+def _init_worker():
+    import django
+    django.setup()
+    get_assets()
+
+
+def render_sheet_tag(fields):
+    """Render one tag for a sheet and return it as JPEG bytes (runs in pool workers)."""
+    photo = load_photo(fields['photo']) if fields['photo'] else None
+    tag = render_tag_image(fields, photo)
+    buffer = BytesIO()
+    tag.save(buffer, format='JPEG', quality=SHEET_JPEG_QUALITY)
+    return buffer.getvalue()
+
+
+def sheet_slots(tag_size):
+    """Bottom-left corners of the tag positions on one sheet, in reading order."""
+    tag_width, tag_height = tag_size
+    sheet_width, sheet_height = SHEET_SIZE
+    columns = int((sheet_width - 2 * SHEET_MARGIN + SHEET_GAP) // (tag_width + SHEET_GAP))
+    rows = int((sheet_height - 2 * SHEET_MARGIN + SHEET_GAP) // (tag_height + SHEET_GAP))
+    used_width = columns * tag_width + (columns - 1) * SHEET_GAP
+    left = (sheet_width - used_width) / 2
+    top = sheet_height - SHEET_MARGIN
+    return [
+        (left + column * (tag_width + SHEET_GAP), top - (row + 1) * tag_height - row * SHEET_GAP)
+        for row in range(rows)
+        for column in range(columns)
+    ]
+
+
+def bulk_tag_pdf(fields_list, workers=None, progress=None):
+    """
+    Render the tags for ``fields_list`` into one print-ready PDF.
+
+    Tags are rendered across a pool of ``workers`` processes (one per CPU
+    by default, inline when ``workers`` is 1). Each worker loads the shared
+    assets once and returns JPEG bytes that are embedded without
+    re-encoding. ``progress(done)`` is called as tags are placed.
+    """
+    assets = get_assets()
+    tag_height = SHEET_TAG_HEIGHT
+    tag_width = tag_height * assets.template.width / assets.template.height
+    slots = sheet_slots((tag_width, tag_height))
+
+    buffer = BytesIO()
+    canvas = pdf_canvas.Canvas(buffer, pagesize=SHEET_SIZE)
+    canvas.setTitle('KPN ID Tags')
+    canvas.setStrokeColorRGB(0.8, 0.8, 0.8)
+    canvas.setLineWidth(0.3)
+
+    def place(images):
+        for index, jpeg in enumerate(images):
+            slot = index % len(slots)
+            if index and slot == 0:
+                canvas.showPage()
+                canvas.setStrokeColorRGB(0.8, 0.8, 0.8)
+                canvas.setLineWidth(0.3)
+            x, y = slots[slot]
+            canvas.drawImage(ImageReader(BytesIO(jpeg)), x, y, width=tag_width, height=tag_height)
+            canvas.rect(x, y, tag_width, tag_height, stroke=1, fill=0)
+            if progress:
+                progress(index + 1)
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(fields_list) < 2:
+        place(render_sheet_tag(fields) for fields in fields_list)
+    else:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as pool:
+            place(pool.map(render_sheet_tag, fields_list, chunksize=4))
+
+    canvas.showPage()
+    canvas.save()
+    return buffer.getvalue()
+
+
+def parse_scope(scope):
+    """``'lga:12'`` -> ``{'lga_id': 12}``; ``'state'`` -> ``{}``."""
+    if not scope or scope == 'state':
+        return {}
+    level, _, pk = scope.partition(':')
+    if level not in ('zone', 'lga', 'ward'):
+        raise ValueError(f'Unknown scope {scope!r}')
+    return {f'{level}_id': int(pk)}
+
+
+def scope_choices(user):
+    """
+    The jurisdictions ``user`` may print tags for, as ``(value, label)`` pairs:
+    their own zone, LGA or ward and everything inside it (any for state leaders).
+    """
+    from leadership.geography import get_tree
+    tree = get_tree()
+
+    if user.role == 'STATE' or user.is_superuser:
+        zones = tree.zones
+        choices = [('state', 'Entire State')]
+    elif user.role == 'ZONAL' and user.zone_id:
+        zones = [tree.zone(user.zone_id)]
+        choices = []
+    elif user.role == 'LGA' and user.lga_id:
+        lga = tree.lga(user.lga_id)
+        return [(f'lga:{lga.id}', f'{lga.name} LGA')] + [(f'ward:{ward.id}', ward.label) for ward in lga.wards]
+    elif user.role == 'WARD' and user.ward_id:
+        ward = tree.ward(user.ward_id)
+        return [(f'ward:{ward.id}', ward.label)]
+    else:
+        return []
+
+    for zone in zones:
+        choices.append((f'zone:{zone.id}', f'{zone.name} Zone'))
+        for lga in zone.lgas:
+            choices.append((f'lga:{lga.id}', f'{lga.name} LGA'))
+            choices.extend((f'ward:{ward.id}', ward.label) for ward in lga.wards)
+    return choices
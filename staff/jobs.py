@@ -0,0 +1,27 @@
+"""Background job handlers for staff exports (registered in ``core.jobs.HANDLERS``)."""
+from core.jobs import Progress
+from .forms import MemberMobilizationFilterForm
+from .models import User
+from . import pdf
+
+
+def members_pdf(job):
+    members = User.objects.filter(status='APPROVED').order_by('last_name', 'first_name')
+    progress = Progress(job, members.count(), 'Collecting members')
+    return 'kpn_all_members.pdf', pdf.members_list_pdf(members, progress)
+
+
+def contact_list_pdf(job):
+    # Export links always carry a query string, so the form is always bound
+    form = MemberMobilizationFilterForm(job.params)
+    members = form.filter_members(User.objects.filter(is_superuser=False).order_by('last_name', 'first_name'))
+    progress = Progress(job, members.count(), 'Collecting members')
+    return 'kpn_contact_list.pdf', pdf.contact_list_pdf(members, progress)
+
+
+def id_tags_pdf(job):
+    from .idtags import bulk_fields, bulk_tag_pdf, jurisdiction_members, parse_scope
+    members = jurisdiction_members(**parse_scope(job.params.get('scope')))
+    fields = bulk_fields(members, job.params['site_url'])
+    progress = Progress(job, len(fields), 'Rendering tags')
+    return 'kpn_id_tags.pdf', bulk_tag_pdf(fields, progress=progress)
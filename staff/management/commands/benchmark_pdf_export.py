@@ -0,0 +1,97 @@
+import time
+import tracemalloc
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+
+from staff.exports import CONTACT_COLUMNS
+from staff.pdf import contact_list_renderer
+
+
+class Command(BaseCommand):
+    help = 'Times the paged PDF renderer against the single-table layout for 1k to 50k member rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,5000,10000,25000,50000', help='Comma separated row counts')
+        parser.add_argument('--legacy-max', type=int, default=10000, help='Largest row count to run through the single-table layout')
+        parser.add_argument('--memory', action='store_true', help='Also report peak Python memory (slower)')
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',') if size]
+        headers = [column.header for column in CONTACT_COLUMNS]
+
+        self.stdout.write(f'{"Rows":>8}{"Legacy s":>11}{"Paged s":>10}{"ms/1k":>8}{"Pages":>7}{"KB":>9}{"Peak MB":>9}')
+        per_thousand = []
+        for size in sizes:
+            legacy = '-'
+            if size <= options['legacy_max']:
+                legacy_seconds, _, _ = self._measure(lambda: self._legacy(headers, self._rows(size)), False)
+                legacy = f'{legacy_seconds:.2f}'
+
+            pages = []
+            renderer = contact_list_renderer()
+            seconds, peak, pdf = self._measure(
+                lambda: renderer.render(self._rows(size), on_page=pages.append),
+                options['memory'],
+            )
+            per_thousand.append(seconds * 1000 / size * 1000)
+            peak_text = f'{peak / 1024 / 1024:.1f}' if options['memory'] else '-'
+            self.stdout.write(
+                f'{size:>8}{legacy:>11}{seconds:>10.2f}{per_thousand[-1]:>8.1f}'
+                f'{len(pages):>7}{len(pdf) // 1024:>9}{peak_text:>9}'
+            )
+
+        if len(per_thousand) > 1:
+            spread = max(per_thousand) / min(per_thousand)
+            self.stdout.write(f'Time per 1k rows varies by {spread:.2f}x across sizes (1.00x is perfectly linear)')
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _measure(self, render, memory):
+        if memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        pdf = render()
+        seconds = time.perf_counter() - started
+        peak = 0
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return seconds, peak, pdf
+
+    def _rows(self, count):
+        roles = ['General Member', 'Ward Excos', 'LGA Excos', 'Zonal Excos', 'State Executive']
+        for index in range(count):
+            yield [
+                f'Member{index} Surname{index % 977}',
+                f'080{index:08d}',
+                roles[index % len(roles)],
+                f'Zone {index % 3}',
+                f'LGA {index % 21}',
+                f'Ward {index % 225}',
+                'Male' if index % 2 else 'Female',
+                'Approved',
+            ]
+
+    def _legacy(self, headers, rows):
+        """The single-table layout previously used by the contact list export."""
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=landscape(letter), rightMargin=30, leftMargin=30, topMargin=70, bottomMargin=50)
+        table = Table([headers] + list(rows), repeatRows=1)
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
+        ]))
+        doc.build([table])
+        return buffer.getvalue()
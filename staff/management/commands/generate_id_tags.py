@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from staff.idtags import DEFAULT_SITE_URL, bulk_fields, bulk_tag_pdf, jurisdiction_members
+
+
+class Command(BaseCommand):
+    help = 'Renders ID tags for every approved member of a ward, LGA or zone into one printable PDF'
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group()
+        scope.add_argument('--zone', type=int, help='Zone id')
+        scope.add_argument('--lga', type=int, help='LGA id')
+        scope.add_argument('--ward', type=int, help='Ward id')
+        parser.add_argument('--output', '-o', default='kpn_id_tags.pdf', help='PDF file to write')
+        parser.add_argument('--workers', type=int, default=None, help='Render processes (default: one per CPU)')
+        parser.add_argument('--site-url', default=DEFAULT_SITE_URL, help='Base URL for the profile QR codes')
+
+    def handle(self, *args, **options):
+        members = jurisdiction_members(
+            zone_id=options['zone'],
+            lga_id=options['lga'],
+            ward_id=options['ward'],
+        )
+        fields = bulk_fields(members, options['site_url'])
+        if not fields:
+            raise CommandError('No approved members found in that jurisdiction')
+
+        self.stdout.write(f'Rendering {len(fields)} tags...')
+        started = time.monotonic()
+        pdf = bulk_tag_pdf(fields, workers=options['workers'])
+        with open(options['output'], 'wb') as handle:
+            handle.write(pdf)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {len(fields)} tags to {options["output"]} ({len(pdf) // 1024} KB) in {elapsed:.1f}s'
+        ))
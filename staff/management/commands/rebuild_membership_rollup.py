@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from staff.models import MembershipRollup
+from staff.rollup import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the membership rollup table from the user table'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding membership rollup...')
+        rows = rebuild()
+        total = sum(MembershipRollup.objects.values_list('count', flat=True))
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} rollup rows covering {total} members'))
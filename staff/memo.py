@@ -0,0 +1,36 @@
+"""
+Request-scoped memo for values derived from the logged-in user.
+
+Decorators, views and templates ask for the same facts about
+``request.user`` (approval, role title, leader flag) several times per
+request. ``user_memo(request)`` computes each of them once and keeps them on
+the request, so they are never shared between requests or users.
+"""
+from functools import cached_property
+
+
+class UserMemo:
+
+    def __init__(self, user):
+        self.user = user
+
+    @cached_property
+    def is_approved(self):
+        return self.user.is_authenticated and self.user.status == 'APPROVED'
+
+    @cached_property
+    def role_title(self):
+        if not self.user.is_authenticated or not self.user.role_definition_id:
+            return None
+        return self.user.role_definition.title
+
+    @cached_property
+    def is_leader(self):
+        return self.user.is_authenticated and self.user.is_leader()
+
+
+def user_memo(request):
+    memo = getattr(request, '_user_memo', None)
+    if memo is None or memo.user is not request.user:
+        memo = request._user_memo = UserMemo(request.user)
+    return memo
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_rollup(apps, schema_editor):
+    User = apps.get_model('staff', 'User')
+    MembershipRollup = apps.get_model('staff', 'MembershipRollup')
+    dimensions = ('zone_id', 'lga_id', 'ward_id', 'role', 'gender', 'status')
+
+    groups = User.objects.filter(is_superuser=False).values_list(*dimensions).annotate(total=Count('pk')).order_by()
+    MembershipRollup.objects.bulk_create([
+        MembershipRollup(
+            key=':'.join('' if value is None else str(value) for value in group[:-1]),
+            count=group[-1],
+            **dict(zip(dimensions, group[:-1]))
+        )
+        for group in groups
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leadership', '0002_alter_roledefinition_tier'),
+        ('staff', '0010_alter_user_role'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MembershipRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(editable=False, max_length=100, unique=True)),
+                ('role', models.CharField(choices=[('GENERAL', 'General Member'), ('STATE', 'State Executive'), ('ZONAL', 'Zonal Excos'), ('LGA', 'LGA Excos'), ('WARD', 'Ward Leaders')], max_length=10)),
+                ('gender', models.CharField(blank=True, choices=[('M', 'Male'), ('F', 'Female')], max_length=1)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending Approval'), ('APPROVED', 'Approved'), ('SUSPENDED', 'Suspended'), ('DISMISSED', 'Dismissed')], max_length=10)),
+                ('count', models.IntegerField(default=0)),
+                ('lga', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='leadership.lga')),
+                ('ward', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='leadership.ward')),
+                ('zone', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='leadership.zone')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'zone'], name='rollup_status_zone_idx'), models.Index(fields=['status', 'lga'], name='rollup_status_lga_idx'), models.Index(fields=['status', 'ward'], name='rollup_status_ward_idx')],
+            },
+        ),
+        migrations.RunPython(populate_rollup, migrations.RunPython.noop),
+    ]
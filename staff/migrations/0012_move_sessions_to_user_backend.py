@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+OLD_BACKEND = 'django.contrib.auth.backends.ModelBackend'
+NEW_BACKEND = 'staff.backends.UserBackend'
+
+
+def move_sessions_to_user_backend(apps, schema_editor):
+    # django.contrib.auth logs a session out once its backend is no longer
+    # configured, so point sessions signed in through ModelBackend at UserBackend
+    from django.contrib.sessions.backends.db import SessionStore
+
+    Session = apps.get_model('sessions', 'Session')
+    store = SessionStore()
+    sessions = []
+    for session in Session.objects.iterator():
+        data = store.decode(session.session_data)
+        if data.get('_auth_user_backend') == OLD_BACKEND:
+            data['_auth_user_backend'] = NEW_BACKEND
+            session.session_data = store.encode(data)
+            sessions.append(session)
+    Session.objects.bulk_update(sessions, ['session_data'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessions', '0001_initial'),
+        ('staff', '0011_membershiprollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_sessions_to_user_backend, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,5 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from leadership.models import Zone, LGA, Ward, RoleDefinition
 
 class User(AbstractUser):
@@ -62,6 +62,12 @@ class User(AbstractUser):
     def __str__(self):
         return f"{self.get_full_name()} ({self.get_role_display()})"
     
+    def save(self, *args, **kwargs):
+        # One transaction for the row lock taken in pre_save (see
+        # staff.signals), the save itself and the rollup move in post_save
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+    
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}".strip() or self.username
     
@@ -478,14 +484,14 @@ class Announcement(models.Model):
         
         query = Q(scope='GENERAL')
         
-        if user.zone:
-            query |= Q(scope='ZONAL', target_zone=user.zone)
+        if user.zone_id:
+            query |= Q(scope='ZONAL', target_zone_id=user.zone_id)
         
-        if user.lga:
-            query |= Q(scope='LGA', target_lga=user.lga)
+        if user.lga_id:
+            query |= Q(scope='LGA', target_lga_id=user.lga_id)
         
-        if user.ward:
-            query |= Q(scope='WARD', target_ward=user.ward)
+        if user.ward_id:
+            query |= Q(scope='WARD', target_ward_id=user.ward_id)
         
         return base_query.filter(query).select_related('created_by', 'target_zone', 'target_lga', 'target_ward')
     
@@ -499,3 +505,32 @@ class Announcement(models.Model):
         elif self.scope == 'WARD' and self.target_ward:
             return self.target_ward.name
         return 'Unknown'
+
+
+class MembershipRollup(models.Model):
+    """
+    Number of members per (zone, lga, ward, role, gender, status).
+
+    Kept up to date from User save/delete signals (see staff.rollup) so that
+    dashboard member counts read a handful of rows instead of scanning the
+    user table. Superusers are not counted. Run `rebuild_membership_rollup`
+    after bulk changes that bypass signals.
+    """
+    key = models.CharField(max_length=100, unique=True, editable=False)
+    zone = models.ForeignKey(Zone, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    lga = models.ForeignKey(LGA, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    ward = models.ForeignKey(Ward, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    role = models.CharField(max_length=10, choices=User.ROLE_CHOICES)
+    gender = models.CharField(max_length=1, choices=User.GENDER_CHOICES, blank=True)
+    status = models.CharField(max_length=10, choices=User.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'zone'], name='rollup_status_zone_idx'),
+            models.Index(fields=['status', 'lga'], name='rollup_status_lga_idx'),
+            models.Index(fields=['status', 'ward'], name='rollup_status_ward_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.key}: {self.count}"
@@ -0,0 +1,69 @@
+"""
+PDF member lists.
+
+Rendered by background jobs (see ``staff.jobs``) rather than in views, since
+a state-wide list can take far longer than a request should. Layout is done
+by ``core.pdf.PagedTableRenderer`` one page at a time.
+"""
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, letter, landscape
+
+from core.exports import iter_rows
+from core.pdf import PagedTableRenderer, table_style
+from .exports import MEMBER_COLUMNS, CONTACT_COLUMNS
+
+
+MEMBER_WIDTHS = [2.2, 1.3, 2.6, 0.8, 1.4, 1.6, 1.1]
+CONTACT_WIDTHS = [2.2, 1.3, 1.4, 1.3, 1.4, 1.4, 0.8, 0.9]
+
+MEMBERS_STYLE = table_style(grid_width=1, grid_color=colors.black, stripes=(colors.white, colors.lightgrey))
+CONTACTS_STYLE = table_style()
+
+
+def member_rows(queryset, columns, blank=()):
+    """Formatted rows for ``columns``; values at positions in ``blank`` print as N/A when empty."""
+    for values in iter_rows(queryset, columns):
+        if blank:
+            values = [(value or 'N/A') if position in blank else value for position, value in enumerate(values)]
+        yield values
+
+
+def _render(renderer, rows, progress):
+    return renderer.render(
+        rows,
+        on_row=progress,
+        on_page=lambda page: progress(message=f'Rendering page {page}'),
+    )
+
+
+def members_list_renderer():
+    return PagedTableRenderer(
+        'KPN Members List',
+        [column.header for column in MEMBER_COLUMNS],
+        MEMBER_WIDTHS,
+        pagesize=landscape(A4),
+        style=MEMBERS_STYLE,
+    )
+
+
+def contact_list_renderer():
+    return PagedTableRenderer(
+        'MEMBER CONTACT LIST',
+        [column.header for column in CONTACT_COLUMNS],
+        CONTACT_WIDTHS,
+        pagesize=landscape(letter),
+        style=CONTACTS_STYLE,
+    )
+
+
+def members_list_pdf(members, progress):
+    """The President's "KPN Members List" export."""
+    # Email and Gender print as N/A when empty
+    rows = member_rows(members, MEMBER_COLUMNS, blank=(2, 3))
+    return _render(members_list_renderer(), rows, progress)
+
+
+def contact_list_pdf(members, progress):
+    """The mobilization "MEMBER CONTACT LIST" export."""
+    rows = member_rows(members, CONTACT_COLUMNS)
+    return _render(contact_list_renderer(), rows, progress)
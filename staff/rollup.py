@@ -0,0 +1,100 @@
+"""
+Incremental maintenance of ``MembershipRollup``.
+
+Every member falls into exactly one rollup row, identified by the values of
+``DIMENSIONS``. Signal handlers in ``staff.signals`` move a member from the
+row of their previous values to the row of their new ones with ``F()``
+updates in the same transaction as the user change; ``User.save()`` opens
+that transaction and the previous values are read with a row lock.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from .models import MembershipRollup, User
+
+
+DIMENSIONS = ('zone_id', 'lga_id', 'ward_id', 'role', 'gender', 'status')
+
+# Field names that can appear in ``save(update_fields=...)`` and affect the rollup.
+TRACKED_FIELDS = set(DIMENSIONS) | {'zone', 'lga', 'ward', 'is_superuser'}
+
+
+def rollup_key(dimensions):
+    return ':'.join('' if value is None else str(value) for value in dimensions)
+
+
+def dimensions_of(user):
+    """The rollup dimensions of ``user``, or None if they are not counted."""
+    if user.is_superuser:
+        return None
+    return tuple(getattr(user, name) for name in DIMENSIONS)
+
+
+def stored_dimensions(user_id):
+    """
+    The dimensions currently stored in the database for ``user_id``.
+
+    The row is locked until the caller's transaction ends, so a concurrent
+    save of the same member waits and then reads the values written here
+    instead of moving the member out of the same row a second time.
+    """
+    row = User.objects.select_for_update().filter(pk=user_id).values_list(*DIMENSIONS, 'is_superuser').first()
+    if row is None or row[-1]:
+        return None
+    return row[:-1]
+
+
+def _apply(dimensions, delta):
+    key = rollup_key(dimensions)
+    if MembershipRollup.objects.filter(key=key).update(count=F('count') + delta):
+        return
+    try:
+        with transaction.atomic():
+            MembershipRollup.objects.create(key=key, count=delta, **dict(zip(DIMENSIONS, dimensions)))
+    except IntegrityError:
+        # Another transaction created the row first.
+        MembershipRollup.objects.filter(key=key).update(count=F('count') + delta)
+
+
+def move(previous, current):
+    """Move one member from the ``previous`` rollup row to the ``current`` one."""
+    if previous == current:
+        return
+    with transaction.atomic():
+        if previous is not None:
+            _apply(previous, -1)
+        if current is not None:
+            _apply(current, 1)
+
+
+def rebuild():
+    """Recompute the whole rollup from the user table. Returns the number of rows."""
+    groups = (
+        User.objects.filter(is_superuser=False)
+        .values_list(*DIMENSIONS)
+        .annotate(total=Count('pk'))
+        .order_by()
+    )
+    rows = [
+        MembershipRollup(key=rollup_key(group[:-1]), count=group[-1], **dict(zip(DIMENSIONS, group[:-1])))
+        for group in groups
+    ]
+    with transaction.atomic():
+        MembershipRollup.objects.all().delete()
+        MembershipRollup.objects.bulk_create(rows)
+    return len(rows)
+
+
+def member_count(*conditions, **filters):
+    """Number of members matching rollup ``filters``, e.g. ``member_count(status='APPROVED', lga_id=3)``."""
+    return MembershipRollup.objects.filter(*conditions, **filters).aggregate(total=Sum('count'))['total'] or 0
+
+
+def member_counts_by(field, *conditions, **filters):
+    """``{value: members}`` grouped by one rollup dimension."""
+    return dict(
+        MembershipRollup.objects.filter(*conditions, **filters)
+        .values_list(field)
+        .annotate(total=Sum('count'))
+        .order_by()
+    )
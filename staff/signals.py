@@ -0,0 +1,52 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import announcements, rollup, stats
+from .models import Announcement, User
+
+
+def invalidate_stats(sender, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    # Logging in only touches last_login, which no statistic depends on.
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    transaction.on_commit(lambda: stats.invalidate(sender))
+
+
+for model in stats.tracked_models():
+    post_save.connect(invalidate_stats, sender=model, dispatch_uid=f'stats_save_{model._meta.label}')
+    post_delete.connect(invalidate_stats, sender=model, dispatch_uid=f'stats_delete_{model._meta.label}')
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def invalidate_announcements(sender, **kwargs):
+    transaction.on_commit(announcements.invalidate)
+
+
+def _tracks_rollup(update_fields):
+    return not update_fields or bool(set(update_fields) & rollup.TRACKED_FIELDS)
+
+
+@receiver(pre_save, sender=User)
+def remember_rollup_dimensions(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not _tracks_rollup(update_fields):
+        return
+    if instance._state.adding or instance.pk is None:
+        instance._rollup_previous = None
+    else:
+        instance._rollup_previous = rollup.stored_dimensions(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def update_rollup_on_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not _tracks_rollup(update_fields):
+        return
+    previous = instance.__dict__.pop('_rollup_previous', None)
+    rollup.move(previous, rollup.dimensions_of(instance))
+
+
+@receiver(post_delete, sender=User)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    rollup.move(rollup.dimensions_of(instance), None)
@@ -0,0 +1,164 @@
+"""
+Dashboard statistics.
+
+Metrics are declared once in ``METRICS`` and grouped by model: every metric
+of a model is computed by a single ``aggregate()`` call using conditional
+``Count``/``Sum`` expressions, so a dashboard costs at most one query per
+model it touches. Results are cached per model for ``STATS_TTL`` seconds
+and dropped as soon as a row of that model is saved or deleted (see
+``staff.signals``). Bulk ``QuerySet.update()`` calls skip signals and are
+only picked up once the TTL expires.
+"""
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from core.caching import Namespace, versions
+
+
+STATS_TTL = 60
+
+
+class Metric:
+    """A single COUNT or SUM over a model, optionally filtered."""
+
+    def __init__(self, model, function, field, conditions, lookups):
+        self.model = model
+        self.function = function
+        self.field = field
+        self.conditions = conditions
+        self.lookups = lookups
+
+    def condition(self):
+        q = Q(**self.lookups)
+        for condition in self.conditions:
+            q &= condition() if callable(condition) else condition
+        return q
+
+    def expression(self):
+        condition = self.condition()
+        if not condition:
+            return self.function(self.field)
+        return self.function(self.field, filter=condition)
+
+
+def count(model, *conditions, **lookups):
+    return Metric(model, Count, 'pk', conditions, lookups)
+
+
+def total(model, field, *conditions, **lookups):
+    return Metric(model, Sum, field, conditions, lookups)
+
+
+def _upcoming():
+    return Q(start_date__gte=timezone.now())
+
+
+def _past():
+    return Q(start_date__lt=timezone.now())
+
+
+LEADER = ~Q(role='GENERAL')
+
+
+METRICS = {
+    # Members
+    'members_pending': count('staff.User', status='PENDING'),
+    'members_approved': count('staff.User', status='APPROVED'),
+    'leaders_approved': count('staff.User', LEADER, status='APPROVED'),
+    'members_male': count('staff.User', status='APPROVED', gender='M'),
+    'members_female': count('staff.User', status='APPROVED', gender='F'),
+    'members_pending_non_admin': count('staff.User', status='PENDING', is_superuser=False),
+    'members_approved_non_admin': count('staff.User', status='APPROVED', is_superuser=False),
+    'leaders_approved_non_admin': count('staff.User', LEADER, status='APPROVED', is_superuser=False),
+
+    # Campaigns and media
+    'campaigns_total': count('campaigns.Campaign'),
+    'campaigns_published': count('campaigns.Campaign', status='PUBLISHED'),
+    'campaigns_pending': count('campaigns.Campaign', status='PENDING'),
+    'media_pending': count('media.MediaItem', status='PENDING'),
+
+    # Events
+    'events_total': count('events.Event'),
+    'events_upcoming': count('events.Event', _upcoming),
+    'events_past': count('events.Event', _past),
+    'minutes_total': count('events.MeetingMinutes'),
+    'minutes_published': count('events.MeetingMinutes', is_published=True),
+
+    # Finance
+    'donations_verified_amount': total('donations.Donation', 'amount', status='VERIFIED'),
+    'donations_verified': count('donations.Donation', status='VERIFIED'),
+    'donations_unverified': count('donations.Donation', status='UNVERIFIED'),
+    'expenses_amount': total('donations.Expense', 'amount'),
+    'financial_reports_total': count('donations.FinancialReport'),
+
+    # Discipline and reporting
+    'disciplinary_total': count('staff.DisciplinaryAction'),
+    'disciplinary_pending': count('staff.DisciplinaryAction', is_approved=False),
+    'reports_total': count('core.Report'),
+    'reports_unreviewed': count('core.Report', is_reviewed=False),
+
+    # Programs and outreach
+    'womens_programs_total': count('staff.WomensProgram'),
+    'youth_programs_total': count('staff.YouthProgram'),
+    'welfare_programs_total': count('staff.WelfareProgram'),
+    'outreach_total': count('staff.CommunityOutreach'),
+    'outreach_completed': count('staff.CommunityOutreach', status='COMPLETED'),
+
+    # Content
+    'faqs_total': count('core.FAQ'),
+    'faqs_active': count('core.FAQ', is_active=True),
+    'faqs_inactive': count('core.FAQ', is_active=False),
+}
+
+
+def tracked_models():
+    """Models whose changes invalidate cached statistics."""
+    return [apps.get_model(label) for label in sorted({metric.model for metric in METRICS.values()})]
+
+
+def _namespace(label):
+    return Namespace('staff', 'stats', label)
+
+
+def _compute(label):
+    """Evaluate every metric declared for ``label`` in one aggregate query."""
+    model = apps.get_model(label)
+    metrics = {name: metric for name, metric in METRICS.items() if metric.model == label}
+    values = model._default_manager.aggregate(
+        **{name: metric.expression() for name, metric in metrics.items()}
+    )
+    return {name: value or 0 for name, value in values.items()}
+
+
+def get_stats(*names):
+    """
+    Return ``{name: value}`` for the requested metrics.
+
+    Each model involved is read from the cache or aggregated in one query.
+    """
+    labels = {METRICS[name].model for name in names}
+
+    namespaces = {label: _namespace(label) for label in labels}
+    current = versions(namespaces.values())
+    data_keys = {
+        label: namespace.key(version=current[namespace])
+        for label, namespace in namespaces.items()
+    }
+    cached = cache.get_many(list(data_keys.values()))
+
+    values = {}
+    for label, key in data_keys.items():
+        model_values = cached.get(key)
+        if model_values is None:
+            model_values = _compute(label)
+            cache.set(key, model_values, STATS_TTL)
+        values.update(model_values)
+
+    return {name: values[name] for name in names}
+
+
+def invalidate(model):
+    """Drop cached statistics for ``model``."""
+    _namespace(model._meta.label).bump()
@@ -11,11 +11,13 @@ urlpatterns = [
     path('dashboards/general-member/', views.general_member_dashboard, name='general_member_dashboard'),
     path('profile/', views.profile, name='profile'),
     path('generate-id-tag/', views.generate_id_tag, name='generate_id_tag'),
+    path('id-tags/bulk/', views.bulk_id_tags, name='bulk_id_tags'),
     path('change-password/', views.change_password, name='change_password'),
     path('forgot-password/', views.forgot_password, name='forgot_password'),
     path('reset-password/<uidb64>/<token>/', views.reset_password, name='reset_password'),
     
     path('api/check-vacant-roles/', views.check_vacant_roles, name='check_vacant_roles'),
+    path('api/geography/', views.geography_bundle, name='geography_bundle'),
     path('api/get-lgas/', views.get_lgas_by_zone, name='get_lgas'),
     path('api/get-wards/', views.get_wards_by_lga, name='get_wards'),
     
@@ -1,22 +1,31 @@
+import json
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate, update_session_auth_hash
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db import models
-from django.db.models import Q, Sum
-from django.http import JsonResponse, HttpResponse
+from django.db.models import Count, Q, Sum
+from django.http import JsonResponse, HttpResponse, HttpResponseNotModified
 from django.utils import timezone
 from django.contrib.auth.tokens import default_token_generator
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
+from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode, parse_etags, quote_etag
+from django.utils.cache import patch_cache_control
 from django.utils.encoding import force_bytes, force_str
-from django.core.mail import send_mail
 from django.conf import settings
 from django_ratelimit.decorators import ratelimit
 from .models import User, DisciplinaryAction, WomensProgram, YouthProgram, WelfareProgram, CommunityOutreach, WardMeeting, WardMeetingAttendance, Announcement
+from .memo import user_memo
 from .decorators import specific_role_required, role_required, approved_leader_required
+from .stats import get_stats
+from .rollup import member_count, member_counts_by
 from .forms import MemberMobilizationFilterForm, CommunityOutreachForm, WardMeetingForm, WardMeetingAttendanceForm, AnnouncementForm
 from leadership.models import Zone, LGA, Ward, RoleDefinition
+from leadership.geography import get_tree
+from leadership.supervisors import get_directory
+from core.consolidation import pending_periods
 from core.models import Report
+from core.outbox import queue_mail
+from core.pagination import KeysetPaginator, next_page_url
 from campaigns.models import Campaign
 from media.models import MediaItem
 from events.models import Event
@@ -114,9 +123,10 @@ def register(request):
             return redirect('staff:register')
         
         try:
-            zone = Zone.objects.get(id=zone_id) if zone_id else None
-            lga = LGA.objects.get(id=lga_id) if lga_id else None
-            ward = Ward.objects.get(id=ward_id) if ward_id else None
+            geography = get_tree()
+            zone = geography.get(Zone, zone_id) if zone_id else None
+            lga = geography.get(LGA, lga_id) if lga_id else None
+            ward = geography.get(Ward, ward_id) if ward_id else None
         except (Zone.DoesNotExist, LGA.DoesNotExist, Ward.DoesNotExist, ValueError, TypeError):
             messages.error(request, 'Invalid location selection.')
             return redirect('staff:register')
@@ -210,7 +220,7 @@ def register(request):
         
         # Registration successful - show appropriate message
         if status == 'APPROVED':
-            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+            login(request, user, backend='staff.backends.UserBackend')
             if photo_uploaded:
                 messages.success(request, 'Registration successful! Welcome to KPN.')
             else:
@@ -223,9 +233,10 @@ def register(request):
                 messages.warning(request, 'Registration successful! Your application is pending approval. Note: Your profile photo could not be uploaded. You can update it after approval.')
             return redirect('staff:login')
     
-    zones = Zone.objects.all()
-    lgas = LGA.objects.all()
-    wards = Ward.objects.all()
+    geography = get_tree()
+    zones = geography.zones
+    lgas = geography.lgas
+    wards = geography.wards
     role_definitions = RoleDefinition.objects.all()
     
     context = {
@@ -233,6 +244,7 @@ def register(request):
         'lgas': lgas,
         'wards': wards,
         'role_definitions': role_definitions,
+        'geography_version': geography.bundle_version,
     }
     return render(request, 'staff/register.html', context)
 
@@ -247,9 +259,8 @@ def dashboard(request):
     if user.role == 'GENERAL':
         return redirect('staff:general_member_dashboard')
     
-    if user.role_definition:
-        role_title = user.role_definition.title
-        
+    role_title = user_memo(request).role_title
+    if role_title:
         role_mapping = {
             'President': 'president_dashboard',
             'Vice President': 'vice_president_dashboard',
@@ -291,7 +302,7 @@ def dashboard(request):
     
     context = {
         'user': user,
-        'role_title': user.role_definition.title if user.role_definition else 'Leader',
+        'role_title': role_title or 'Leader',
     }
     
     return render(request, 'staff/dashboard.html', context)
@@ -382,9 +393,10 @@ def profile(request):
         
         return redirect('staff:profile')
     
-    zones = Zone.objects.all()
-    lgas = LGA.objects.all()
-    wards = Ward.objects.all()
+    geography = get_tree()
+    zones = geography.zones
+    lgas = geography.lgas
+    wards = geography.wards
     
     context = {
         'can_upload_photo': can_upload_photo,
@@ -455,12 +467,11 @@ Kebbi Progressive Network Team
             '''
             
             try:
-                send_mail(
+                queue_mail(
                     'KPN Password Reset Request',
                     message,
                     settings.DEFAULT_FROM_EMAIL,
                     [email],
-                    fail_silently=False,
                 )
                 messages.success(request, 'Password reset instructions have been sent to your email.')
             except Exception as e:
@@ -506,31 +517,50 @@ def reset_password(request, uidb64, token):
         messages.error(request, 'Invalid or expired password reset link.')
         return redirect('staff:forgot_password')
 
+def _geography_response(request, geography, content_type, build_content):
+    """
+    Serve geography data with the tree's content hash as a strong ETag.
+    
+    Clients revalidate and get a 304 until the geography changes. Requests
+    carrying the current hash as ``?v=`` may cache the response forever.
+    """
+    etag = quote_etag(geography.bundle_version)
+    client_etags = [tag.removeprefix('W/') for tag in parse_etags(request.headers.get('If-None-Match', ''))]
+    
+    if etag in client_etags or '*' in client_etags:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(build_content(), content_type=content_type)
+    
+    response['ETag'] = etag
+    if request.GET.get('v') == geography.bundle_version:
+        patch_cache_control(response, public=True, max_age=365 * 24 * 60 * 60, immutable=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+def geography_bundle(request):
+    """The whole zone → LGA → ward hierarchy as one cacheable JSON document."""
+    geography = get_tree()
+    return _geography_response(request, geography, 'application/json', lambda: geography.bundle)
+
 def get_lgas_by_zone(request):
     zone_id = request.GET.get('zone_id')
+    geography = get_tree()
+    lgas = geography.lgas_in_zone(zone_id) if zone_id else ()
     
-    if not zone_id:
-        return JsonResponse({'lgas': []})
-    
-    try:
-        zone = Zone.objects.get(id=zone_id)
-        lgas = LGA.objects.filter(zone=zone).values('id', 'name')
-        return JsonResponse({'lgas': list(lgas)})
-    except (Zone.DoesNotExist, ValueError, TypeError):
-        return JsonResponse({'lgas': []})
+    return _geography_response(request, geography, 'application/json', lambda: json.dumps({
+        'lgas': [{'id': lga.id, 'name': lga.name} for lga in lgas]
+    }))
 
 def get_wards_by_lga(request):
     lga_id = request.GET.get('lga_id')
+    geography = get_tree()
+    wards = geography.wards_in_lga(lga_id) if lga_id else ()
     
-    if not lga_id:
-        return JsonResponse({'wards': []})
-    
-    try:
-        lga = LGA.objects.get(id=lga_id)
-        wards = Ward.objects.filter(lga=lga).values('id', 'name')
-        return JsonResponse({'wards': list(wards)})
-    except (LGA.DoesNotExist, ValueError, TypeError):
-        return JsonResponse({'wards': []})
+    return _geography_response(request, geography, 'application/json', lambda: json.dumps({
+        'wards': [{'id': ward.id, 'name': ward.name} for ward in wards]
+    }))
 
 def check_vacant_roles(request):
     zone_id = request.GET.get('zone_id')
@@ -538,19 +568,20 @@ def check_vacant_roles(request):
     ward_id = request.GET.get('ward_id')
     
     vacant_roles = []
+    geography = get_tree()
     
     try:
-        zone = Zone.objects.get(id=zone_id) if zone_id else None
+        zone = geography.get(Zone, zone_id) if zone_id else None
     except (Zone.DoesNotExist, ValueError, TypeError):
         zone = None
     
     try:
-        lga = LGA.objects.get(id=lga_id) if lga_id else None
+        lga = geography.get(LGA, lga_id) if lga_id else None
     except (LGA.DoesNotExist, ValueError, TypeError):
         lga = None
     
     try:
-        ward = Ward.objects.get(id=ward_id) if ward_id else None
+        ward = geography.get(Ward, ward_id) if ward_id else None
     except (Ward.DoesNotExist, ValueError, TypeError):
         ward = None
     
@@ -619,81 +650,44 @@ def check_vacant_roles(request):
 
 @specific_role_required('President')
 def president_dashboard(request):
-    from leadership.models import Zone
-    from campaigns.models import Campaign
-    from events.models import Event
-    from donations.models import Donation, Expense
-    from core.models import FAQ
-    from staff.models import WomensProgram, YouthProgram, WelfareProgram
-    from django.db.models import Sum
-    
-    # Member statistics
-    pending_approvals = User.objects.filter(status='PENDING').count()
-    total_members = User.objects.filter(status='APPROVED').count()
-    total_leaders = User.objects.filter(status='APPROVED').exclude(role='GENERAL').count()
-    male_members = User.objects.filter(status='APPROVED', gender='M').count()
-    female_members = User.objects.filter(status='APPROVED', gender='F').count()
-    
-    # Campaign statistics
-    total_campaigns = Campaign.objects.count()
-    active_campaigns = Campaign.objects.filter(status='PUBLISHED').count()
-    pending_campaigns = Campaign.objects.filter(status='PENDING').count()
-    
-    # Event statistics  
-    upcoming_events = Event.objects.filter(start_date__gte=timezone.now()).count()
-    total_events = Event.objects.count()
-    
-    # Financial statistics
-    total_donations = Donation.objects.filter(status='VERIFIED').aggregate(total=Sum('amount'))['total'] or 0
-    pending_donations = Donation.objects.filter(status='UNVERIFIED').count()
-    total_expenses = Expense.objects.aggregate(total=Sum('amount'))['total'] or 0
-    
-    # Disciplinary actions
-    pending_disciplinary = DisciplinaryAction.objects.filter(is_approved=False).count()
-    
-    # Reporting statistics
-    pending_reports = Report.objects.filter(is_reviewed=False).count()
-    total_reports = Report.objects.count()
+    stats = get_stats(
+        'members_pending', 'members_approved', 'leaders_approved', 'members_male', 'members_female',
+        'campaigns_total', 'campaigns_published', 'campaigns_pending',
+        'events_upcoming', 'events_total',
+        'donations_verified_amount', 'donations_unverified', 'expenses_amount',
+        'disciplinary_pending', 'reports_unreviewed', 'reports_total',
+        'womens_programs_total', 'youth_programs_total', 'welfare_programs_total', 'faqs_total',
+    )
     
     # Organizational structure
-    total_zones = Zone.objects.count()
-    total_lgas = LGA.objects.count()
-    total_wards = Ward.objects.count()
-    
-    # Programs statistics
-    total_womens_programs = WomensProgram.objects.count()
-    total_youth_programs = YouthProgram.objects.count()
-    total_welfare_programs = WelfareProgram.objects.count()
-    
-    # Content
-    total_faqs = FAQ.objects.count()
+    geography = get_tree()
     
     pending_applicants = User.objects.filter(status='PENDING').order_by('-created_at')[:10]
     
     context = {
-        'pending_approvals': pending_approvals,
-        'total_members': total_members,
-        'total_leaders': total_leaders,
-        'male_members': male_members,
-        'female_members': female_members,
-        'total_campaigns': total_campaigns,
-        'active_campaigns': active_campaigns,
-        'pending_campaigns': pending_campaigns,
-        'upcoming_events': upcoming_events,
-        'total_events': total_events,
-        'total_donations': total_donations,
-        'pending_donations': pending_donations,
-        'total_expenses': total_expenses,
-        'pending_disciplinary': pending_disciplinary,
-        'pending_reports': pending_reports,
-        'total_reports': total_reports,
-        'total_zones': total_zones,
-        'total_lgas': total_lgas,
-        'total_wards': total_wards,
-        'total_womens_programs': total_womens_programs,
-        'total_youth_programs': total_youth_programs,
-        'total_welfare_programs': total_welfare_programs,
-        'total_faqs': total_faqs,
+        'pending_approvals': stats['members_pending'],
+        'total_members': stats['members_approved'],
+        'total_leaders': stats['leaders_approved'],
+        'male_members': stats['members_male'],
+        'female_members': stats['members_female'],
+        'total_campaigns': stats['campaigns_total'],
+        'active_campaigns': stats['campaigns_published'],
+        'pending_campaigns': stats['campaigns_pending'],
+        'upcoming_events': stats['events_upcoming'],
+        'total_events': stats['events_total'],
+        'total_donations': stats['donations_verified_amount'],
+        'pending_donations': stats['donations_unverified'],
+        'total_expenses': stats['expenses_amount'],
+        'pending_disciplinary': stats['disciplinary_pending'],
+        'pending_reports': stats['reports_unreviewed'],
+        'total_reports': stats['reports_total'],
+        'total_zones': len(geography.zones),
+        'total_lgas': len(geography.lgas),
+        'total_wards': len(geography.wards),
+        'total_womens_programs': stats['womens_programs_total'],
+        'total_youth_programs': stats['youth_programs_total'],
+        'total_welfare_programs': stats['welfare_programs_total'],
+        'total_faqs': stats['faqs_total'],
         'pending_applicants': pending_applicants,
         'recent_activities': [],
     }
@@ -702,101 +696,20 @@ def president_dashboard(request):
 
 @specific_role_required('President')
 def export_members_csv(request):
-    import csv
-    from django.http import HttpResponse
+    """Stream all approved members as CSV (or NDJSON with ?format=ndjson)"""
+    from core.exports import export_format, stream_export
+    from .exports import MEMBER_COLUMNS
     
     members = User.objects.filter(status='APPROVED').order_by('last_name', 'first_name')
-    
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="kpn_all_members.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['Name', 'Phone', 'Email', 'Gender', 'Role', 'Location', 'Date Joined'])
-    
-    for member in members:
-        location = member.get_jurisdiction()
-        writer.writerow([
-            member.get_full_name(),
-            member.phone,
-            member.email,
-            member.get_gender_display() if member.gender else '',
-            member.get_role_display(),
-            location,
-            member.created_at.strftime('%Y-%m-%d')
-        ])
-    
-    return response
+    return stream_export(members, MEMBER_COLUMNS, 'kpn_all_members', export_format(request))
 
 @specific_role_required('President')
 def export_members_pdf(request):
-    from django.http import HttpResponse
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4, landscape
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from io import BytesIO
-    
-    members = User.objects.filter(status='APPROVED').order_by('last_name', 'first_name')
-    
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), topMargin=0.5*inch, bottomMargin=0.5*inch)
-    
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#28a745'),
-        spaceAfter=30,
-        alignment=1
-    )
-    
-    title = Paragraph("KPN Members List", title_style)
-    elements.append(title)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    data = [['Name', 'Phone', 'Email', 'Gender', 'Role', 'Location', 'Date Joined']]
-    
-    for member in members:
-        location = member.get_jurisdiction()
-        data.append([
-            member.get_full_name(),
-            member.phone,
-            member.email or 'N/A',
-            member.get_gender_display() if member.gender else 'N/A',
-            member.get_role_display(),
-            location,
-            member.created_at.strftime('%Y-%m-%d')
-        ])
-    
-    table = Table(data, repeatRows=1)
-    
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-    ]))
-    
-    elements.append(table)
-    
-    doc.build(elements)
-    
-    buffer.seek(0)
-    response = HttpResponse(buffer.read(), content_type='application/pdf')
-    response['Content-Disposition'] = 'attachment; filename="kpn_all_members.pdf"'
+    """Queue the members list PDF; it is rendered by the job worker"""
+    from core.jobs import enqueue
     
-    return response
+    job = enqueue('members_pdf', request.user)
+    return redirect('core:job_detail', pk=job.pk)
 
 @role_required('STATE', 'ZONAL', 'LGA')
 def approve_members(request):
@@ -815,9 +728,10 @@ def approve_members(request):
         if ward_filter:
             pending_users = pending_users.filter(ward_id=ward_filter)
         
-        zones = Zone.objects.all()
-        lgas = LGA.objects.all()
-        wards = Ward.objects.all()
+        geography = get_tree()
+        zones = geography.zones
+        lgas = geography.lgas
+        wards = geography.wards
         
     elif request.user.role == 'ZONAL':
         pending_users = User.objects.filter(
@@ -906,7 +820,7 @@ def manage_staff(request):
     if status_filter:
         staff = staff.filter(status=status_filter)
     
-    zones = Zone.objects.all()
+    zones = get_tree().zones
     
     context = {
         'staff': staff,
@@ -967,6 +881,10 @@ def my_jurisdiction_members(request):
     
     return render(request, 'staff/my_jurisdiction_members.html', context)
 
+
+REPORTS_PER_PAGE = 25
+
+
 @approved_leader_required
 def view_reports(request):
     """View reports submitted to the current user with dashboard statistics"""
@@ -1004,33 +922,37 @@ def view_reports(request):
             status__in=['DRAFT', 'SUBMITTED']
         )
     
-    reports = reports.select_related('submitted_by', 'submitted_to', 'reviewed_by', 'parent_report').order_by('-created_at')
+    if request.GET.get('export') in ('csv', 'ndjson'):
+        from core.exports import stream_export
+        from .exports import REPORT_COLUMNS
+        return stream_export(reports.order_by('-created_at'), REPORT_COLUMNS, 'kpn_reports', request.GET['export'])
     
-    pending_count = base_reports.filter(status='SUBMITTED', is_reviewed=False).count()
-    reviewed_count = base_reports.filter(is_reviewed=True).count()
-    approved_count = base_reports.filter(status='APPROVED').count()
-    flagged_count = base_reports.filter(status='FLAGGED').count()
-    rejected_count = base_reports.filter(status='REJECTED').count()
-    escalated_count = base_reports.filter(status='ESCALATED').count()
+    reports = reports.select_related('submitted_by', 'submitted_to', 'reviewed_by')
+    # Newest first by (created_at, id) instead of rendering every report in
+    # the state at once: the unfiltered state-wide list walks
+    # report_created_idx, a status filter report_status_created_idx
+    page = KeysetPaginator(reports, 'created_at', REPORTS_PER_PAGE).get_page(request.GET.get('after'))
     
     from django.utils import timezone
     today = timezone.now().date()
-    overdue_count = base_reports.filter(
-        deadline__lt=today,
-        status__in=['DRAFT', 'SUBMITTED']
-    ).count()
+    # All counters in one pass over the user's reports
+    counts = base_reports.aggregate(
+        pending_count=Count('pk', filter=Q(status='SUBMITTED', is_reviewed=False)),
+        reviewed_count=Count('pk', filter=Q(is_reviewed=True)),
+        approved_count=Count('pk', filter=Q(status='APPROVED')),
+        flagged_count=Count('pk', filter=Q(status='FLAGGED')),
+        rejected_count=Count('pk', filter=Q(status='REJECTED')),
+        escalated_count=Count('pk', filter=Q(status='ESCALATED')),
+        overdue_count=Count('pk', filter=Q(deadline__lt=today, status__in=['DRAFT', 'SUBMITTED'])),
+        total_count=Count('pk'),
+    )
     
     context = {
-        'reports': reports,
+        'reports': page,
+        'next_url': next_page_url(request, request.path, page),
         'filter_status': filter_status,
-        'pending_count': pending_count,
-        'reviewed_count': reviewed_count,
-        'approved_count': approved_count,
-        'flagged_count': flagged_count,
-        'rejected_count': rejected_count,
-        'escalated_count': escalated_count,
-        'overdue_count': overdue_count,
-        'total_count': base_reports.count(),
+        'consolidation_periods': pending_periods(None if is_president or is_state_supervisor else user),
+        **counts,
     }
     
     return render(request, 'staff/view_reports.html', context)
@@ -1157,75 +1079,64 @@ def reject_disciplinary_action(request, action_id):
 
 @specific_role_required('Director of Media & Publicity')
 def media_director_dashboard(request):
-    pending_campaigns = Campaign.objects.filter(status='PENDING').count()
-    pending_media = MediaItem.objects.filter(status='PENDING').count()
-    pending_members = User.objects.filter(status='PENDING').count()
+    stats = get_stats('campaigns_pending', 'media_pending', 'members_pending')
     
     context = {
-        'pending_campaigns': pending_campaigns,
-        'pending_media': pending_media,
-        'pending_members': pending_members,
+        'pending_campaigns': stats['campaigns_pending'],
+        'pending_media': stats['media_pending'],
+        'pending_members': stats['members_pending'],
     }
     
     return render(request, 'staff/dashboards/media_director.html', context)
 
 @specific_role_required('Treasurer')
 def treasurer_dashboard(request):
-    from donations.models import Donation
-    unverified_donations = Donation.objects.filter(status='UNVERIFIED').count()
-    verified_donations = Donation.objects.filter(status='VERIFIED').count()
+    stats = get_stats('donations_unverified', 'donations_verified')
     
     context = {
-        'unverified_donations': unverified_donations,
-        'verified_donations': verified_donations,
+        'unverified_donations': stats['donations_unverified'],
+        'verified_donations': stats['donations_verified'],
     }
     
     return render(request, 'staff/dashboards/treasurer.html', context)
 
 @specific_role_required('Financial Secretary')
 def financial_secretary_dashboard(request):
-    from donations.models import Donation, FinancialReport
-    verified_donations = Donation.objects.filter(status='VERIFIED').count()
-    financial_reports_count = FinancialReport.objects.count()
+    stats = get_stats('donations_verified', 'financial_reports_total')
     
     context = {
-        'verified_donations': verified_donations,
-        'financial_reports_count': financial_reports_count,
+        'verified_donations': stats['donations_verified'],
+        'financial_reports_count': stats['financial_reports_total'],
     }
     
     return render(request, 'staff/dashboards/financial_secretary.html', context)
 
 @specific_role_required('Organizing Secretary')
 def organizing_secretary_dashboard(request):
-    from events.models import MeetingMinutes
-    upcoming_events = Event.objects.filter(start_date__gte=timezone.now()).count()
-    past_events = Event.objects.filter(start_date__lt=timezone.now()).count()
+    stats = get_stats('events_upcoming', 'events_past')
     
     context = {
-        'upcoming_events': upcoming_events,
-        'past_events': past_events,
+        'upcoming_events': stats['events_upcoming'],
+        'past_events': stats['events_past'],
     }
     
     return render(request, 'staff/dashboards/organizing_secretary.html', context)
 
 @specific_role_required('General Secretary')
 def general_secretary_dashboard(request):
-    from events.models import MeetingMinutes
-    meeting_minutes_count = MeetingMinutes.objects.all().count()
-    published_minutes = MeetingMinutes.objects.filter(is_published=True).count()
-    upcoming_meetings = Event.objects.filter(start_date__gte=timezone.now()).count()
+    stats = get_stats('minutes_total', 'minutes_published', 'events_upcoming')
     
     context = {
-        'meeting_minutes_count': meeting_minutes_count,
-        'published_minutes': published_minutes,
-        'upcoming_meetings': upcoming_meetings,
+        'meeting_minutes_count': stats['minutes_total'],
+        'published_minutes': stats['minutes_published'],
+        'upcoming_meetings': stats['events_upcoming'],
     }
     return render(request, 'staff/dashboards/general_secretary.html', context)
 
 @specific_role_required('Zonal Coordinator')
 def zonal_coordinator_dashboard(request):
-    lgas_in_zone = LGA.objects.filter(zone=request.user.zone).count()
-    members_in_zone = User.objects.filter(zone=request.user.zone, status='APPROVED').count()
+    lgas_in_zone = len(get_tree().lgas_in_zone(request.user.zone_id))
+    members_in_zone = member_count(status='APPROVED', zone_id=request.user.zone_id)
     
     # Get pending reports submitted to Zonal Coordinator
     pending_reports = Report.objects.filter(
@@ -1243,8 +1154,8 @@ def zonal_coordinator_dashboard(request):
 
 @specific_role_required('LGA Coordinator')
 def lga_coordinator_dashboard(request):
-    wards_in_lga = Ward.objects.filter(lga=request.user.lga).count()
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count()
+    wards_in_lga = len(get_tree().wards_in_lga(request.user.lga_id))
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id)
     
     # Get pending reports submitted to LGA Coordinator
     pending_reports = Report.objects.filter(
@@ -1262,7 +1173,7 @@ def lga_coordinator_dashboard(request):
 
 @specific_role_required('Ward Coordinator')
 def ward_coordinator_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count()
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id)
     total_meetings = WardMeeting.objects.filter(ward=request.user.ward).count() if request.user.ward else 0
     reports_submitted = Report.objects.filter(submitted_by=request.user).count()
     
@@ -1277,23 +1188,20 @@ def ward_coordinator_dashboard(request):
 @specific_role_required('Vice President')
 def vice_president_dashboard(request):
     """Vice President dashboard with inter-zone reports and disciplinary review"""
-    from leadership.models import Zone
-    
     # Get all zones with statistics
-    zones = Zone.objects.all()
+    zones = get_tree().zones
     zone_stats = []
     
+    # Superusers are not part of the membership rollup
+    members_by_zone = member_counts_by('zone_id', status='APPROVED')
+    leaders_by_zone = member_counts_by('zone_id', ~Q(role='GENERAL'), status='APPROVED')
+    
     for zone in zones:
-        # Exclude superusers from statistics
-        total_members = User.objects.filter(zone=zone, status='APPROVED', is_superuser=False).count()
-        leaders = User.objects.filter(zone=zone, status='APPROVED', is_superuser=False).exclude(role='GENERAL').count()
-        lgas = zone.lgas.count()
-        
         zone_stats.append({
             'zone': zone,
-            'total_members': total_members,
-            'leaders': leaders,
-            'lgas': lgas,
+            'total_members': members_by_zone.get(zone.id, 0),
+            'leaders': leaders_by_zone.get(zone.id, 0),
+            'lgas': len(zone.lgas),
         })
     
     # Get disciplinary actions for review (exclude actions against superusers)
@@ -1303,16 +1211,14 @@ def vice_president_dashboard(request):
     ).order_by('-created_at')[:10]
     
     # Overall statistics - exclude superusers
-    total_members = User.objects.filter(status='APPROVED', is_superuser=False).count()
-    total_leaders = User.objects.filter(status='APPROVED', is_superuser=False).exclude(role='GENERAL').count()
-    pending_members = User.objects.filter(status='PENDING', is_superuser=False).count()
+    stats = get_stats('members_approved_non_admin', 'leaders_approved_non_admin', 'members_pending_non_admin')
     
     context = {
         'zone_stats': zone_stats,
         'recent_disciplinary_actions': recent_disciplinary_actions,
-        'total_members': total_members,
-        'total_leaders': total_leaders,
-        'pending_members': pending_members,
+        'total_members': stats['members_approved_non_admin'],
+        'total_leaders': stats['leaders_approved_non_admin'],
+        'pending_members': stats['members_pending_non_admin'],
     }
     return render(request, 'staff/dashboards/vice_president.html', context)
 
@@ -1321,23 +1227,22 @@ def assistant_general_secretary_dashboard(request):
     from core.models import FAQ
     
     # FAQ Statistics
-    total_faqs = FAQ.objects.count()
-    active_faqs = FAQ.objects.filter(is_active=True).count()
-    inactive_faqs = FAQ.objects.filter(is_active=False).count()
+    stats = get_stats('faqs_total', 'faqs_active', 'faqs_inactive')
     recent_faqs = FAQ.objects.all().order_by('-created_at')[:5]
     
     context = {
-        'total_faqs': total_faqs,
-        'active_faqs': active_faqs,
-        'inactive_faqs': inactive_faqs,
+        'total_faqs': stats['faqs_total'],
+        'active_faqs': stats['faqs_active'],
+        'inactive_faqs': stats['faqs_inactive'],
         'recent_faqs': recent_faqs,
     }
     return render(request, 'staff/dashboards/assistant_general_secretary.html', context)
 
 @specific_role_required('State Supervisor')
 def state_supervisor_dashboard(request):
-    total_zones = Zone.objects.count()
-    total_lgas = LGA.objects.count()
+    geography = get_tree()
+    total_zones = len(geography.zones)
+    total_lgas = len(geography.lgas)
     
     # Get pending reports submitted to State Supervisor
     pending_reports = Report.objects.filter(
@@ -1355,23 +1260,22 @@ def state_supervisor_dashboard(request):
 
 @specific_role_required('Legal & Ethics Adviser')
 def legal_ethics_adviser_dashboard(request):
-    disciplinary_actions = DisciplinaryAction.objects.all().count()
-    pending_actions = DisciplinaryAction.objects.filter(is_approved=False).count()
+    stats = get_stats('disciplinary_total', 'disciplinary_pending')
     
     context = {
-        'disciplinary_actions': disciplinary_actions,
-        'pending_actions': pending_actions,
+        'disciplinary_actions': stats['disciplinary_total'],
+        'pending_actions': stats['disciplinary_pending'],
     }
     
     return render(request, 'staff/dashboards/legal_ethics_adviser.html', context)
 
 @specific_role_required('Director of Mobilization')
 def director_of_mobilization_dashboard(request):
-    total_members = User.objects.filter(status='APPROVED').count()
-    total_zones = Zone.objects.count()
+    stats = get_stats('members_approved')
+    total_zones = len(get_tree().zones)
     
     context = {
-        'total_members': total_members,
+        'total_members': stats['members_approved'],
         'total_zones': total_zones,
     }
     
@@ -1379,20 +1283,20 @@ def director_of_mobilization_dashboard(request):
 
 @specific_role_required('Assistant Director of Mobilization')
 def assistant_director_of_mobilization_dashboard(request):
-    total_members = User.objects.filter(status='APPROVED').count()
+    stats = get_stats('members_approved')
     
     context = {
-        'total_members': total_members,
+        'total_members': stats['members_approved'],
     }
     
     return render(request, 'staff/dashboards/assistant_director_of_mobilization.html', context)
 
 @specific_role_required('Assistant Organizing Secretary')
 def assistant_organizing_secretary_dashboard(request):
-    upcoming_events = Event.objects.filter(start_date__gte=timezone.now()).count()
+    stats = get_stats('events_upcoming')
     
     context = {
-        'upcoming_events': upcoming_events,
+        'upcoming_events': stats['events_upcoming'],
     }
     
     return render(request, 'staff/dashboards/assistant_organizing_secretary.html', context)
@@ -1428,7 +1332,7 @@ def auditor_general_dashboard(request):
 def welfare_officer_dashboard(request):
     from .models import WelfareProgram
     
-    total_members = User.objects.filter(status='APPROVED').count()
+    total_members = get_stats('members_approved')['members_approved']
     
     # Get welfare programs based on user's jurisdiction
     if request.user.role == 'STATE':
@@ -1461,7 +1365,7 @@ def welfare_officer_dashboard(request):
 def youth_empowerment_officer_dashboard(request):
     from .models import YouthProgram
     
-    total_members = User.objects.filter(status='APPROVED').count()
+    total_members = get_stats('members_approved')['members_approved']
     
     # Get youth programs based on user's jurisdiction
     if request.user.role == 'STATE':
@@ -1490,6 +1394,18 @@ def youth_empowerment_officer_dashboard(request):
     
     return render(request, 'staff/dashboards/youth_empowerment_officer.html', context)
 
+def _female_members_by_role(user):
+    """Approved female members in the user's jurisdiction, counted per role from the rollup."""
+    if user.role == 'STATE':
+        scope = {}
+    elif user.role == 'ZONAL':
+        scope = {'zone_id': user.zone_id}
+    elif user.role == 'LGA':
+        scope = {'lga_id': user.lga_id}
+    else:
+        return {}
+    return member_counts_by('role', status='APPROVED', gender='F', **scope)
+
 @specific_role_required('Women Leader')
 def women_leader_dashboard(request):
     # Filter only female members
@@ -1502,23 +1418,17 @@ def women_leader_dashboard(request):
     else:
         female_members = User.objects.none()
     
-    total_members = female_members.count()
-    
     # Get role-based statistics for female members
-    state_female_count = female_members.filter(role='STATE').count()
-    zonal_female_count = female_members.filter(role='ZONAL').count()
-    lga_female_count = female_members.filter(role='LGA').count()
-    ward_female_count = female_members.filter(role='WARD').count()
-    general_female_count = female_members.filter(role='GENERAL').count()
+    female_by_role = _female_members_by_role(request.user)
     
     context = {
-        'total_members': total_members,
+        'total_members': sum(female_by_role.values()),
         'female_members': female_members[:20],  # Show first 20
-        'state_female_count': state_female_count,
-        'zonal_female_count': zonal_female_count,
-        'lga_female_count': lga_female_count,
-        'ward_female_count': ward_female_count,
-        'general_female_count': general_female_count,
+        'state_female_count': female_by_role.get('STATE', 0),
+        'zonal_female_count': female_by_role.get('ZONAL', 0),
+        'lga_female_count': female_by_role.get('LGA', 0),
+        'ward_female_count': female_by_role.get('WARD', 0),
+        'general_female_count': female_by_role.get('GENERAL', 0),
     }
     
     return render(request, 'staff/dashboards/women_leader.html', context)
@@ -1535,7 +1445,7 @@ def assistant_women_leader_dashboard(request):
     else:
         female_members = User.objects.none()
     
-    total_members = female_members.count()
+    total_members = sum(_female_members_by_role(request.user).values())
     
     context = {
         'total_members': total_members,
@@ -1546,34 +1456,31 @@ def assistant_women_leader_dashboard(request):
 
 @specific_role_required('Assistant Director of Media & Publicity')
 def assistant_media_director_dashboard(request):
-    pending_campaigns = Campaign.objects.filter(status='PENDING').count()
-    pending_media = MediaItem.objects.filter(status='PENDING').count()
+    stats = get_stats('campaigns_pending', 'media_pending')
     
     context = {
-        'pending_campaigns': pending_campaigns,
-        'pending_media': pending_media,
+        'pending_campaigns': stats['campaigns_pending'],
+        'pending_media': stats['media_pending'],
     }
     
     return render(request, 'staff/dashboards/assistant_media_director.html', context)
 
 @specific_role_required('Public Relations & Community Engagement Officer')
 def pr_officer_dashboard(request):
-    published_campaigns = Campaign.objects.filter(status='PUBLISHED').count()
-    total_outreach = CommunityOutreach.objects.count()
-    completed_outreach = CommunityOutreach.objects.filter(status='COMPLETED').count()
+    stats = get_stats('campaigns_published', 'outreach_total', 'outreach_completed')
     
     context = {
-        'published_campaigns': published_campaigns,
-        'total_outreach': total_outreach,
-        'completed_outreach': completed_outreach,
+        'published_campaigns': stats['campaigns_published'],
+        'total_outreach': stats['outreach_total'],
+        'completed_outreach': stats['outreach_completed'],
     }
     
     return render(request, 'staff/dashboards/pr_officer.html', context)
 
 @specific_role_required('Zonal Secretary')
 def zonal_secretary_dashboard(request):
-    lgas_in_zone = LGA.objects.filter(zone=request.user.zone).count() if request.user.zone else 0
-    members_in_zone = User.objects.filter(zone=request.user.zone, status='APPROVED').count() if request.user.zone else 0
+    lgas_in_zone = len(get_tree().lgas_in_zone(request.user.zone_id))
+    members_in_zone = member_count(status='APPROVED', zone_id=request.user.zone_id) if request.user.zone_id else 0
     
     context = {
         'lgas_in_zone': lgas_in_zone,
@@ -1584,7 +1491,7 @@ def zonal_secretary_dashboard(request):
 
 @specific_role_required('Zonal Publicity Officer')
 def zonal_publicity_officer_dashboard(request):
-    members_in_zone = User.objects.filter(zone=request.user.zone, status='APPROVED').count() if request.user.zone else 0
+    members_in_zone = member_count(status='APPROVED', zone_id=request.user.zone_id) if request.user.zone_id else 0
     
     context = {
         'members_in_zone': members_in_zone,
@@ -1594,8 +1501,8 @@ def zonal_publicity_officer_dashboard(request):
 
 @specific_role_required('Secretary')
 def lga_secretary_dashboard(request):
-    wards_in_lga = Ward.objects.filter(lga=request.user.lga).count() if request.user.lga else 0
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    wards_in_lga = len(get_tree().wards_in_lga(request.user.lga_id))
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'wards_in_lga': wards_in_lga,
@@ -1606,7 +1513,7 @@ def lga_secretary_dashboard(request):
 
 @specific_role_required('Organizing Secretary')
 def lga_organizing_secretary_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1616,7 +1523,7 @@ def lga_organizing_secretary_dashboard(request):
 
 @specific_role_required('Treasurer')
 def lga_treasurer_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1626,7 +1533,7 @@ def lga_treasurer_dashboard(request):
 
 @specific_role_required('Publicity Officer')
 def lga_publicity_officer_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1636,7 +1543,7 @@ def lga_publicity_officer_dashboard(request):
 
 @specific_role_required('LGA Supervisor')
 def lga_supervisor_dashboard(request):
-    wards_in_lga = Ward.objects.filter(lga=request.user.lga).count() if request.user.lga else 0
+    wards_in_lga = len(get_tree().wards_in_lga(request.user.lga_id))
     
     context = {
         'wards_in_lga': wards_in_lga,
@@ -1646,7 +1553,7 @@ def lga_supervisor_dashboard(request):
 
 @specific_role_required('Women Leader')
 def lga_women_leader_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1656,7 +1563,7 @@ def lga_women_leader_dashboard(request):
 
 @specific_role_required('Welfare Officer')
 def lga_welfare_officer_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1666,7 +1573,7 @@ def lga_welfare_officer_dashboard(request):
 
 @specific_role_required('Director of Contact and Mobilization')
 def lga_contact_mobilization_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1676,7 +1583,7 @@ def lga_contact_mobilization_dashboard(request):
 
 @specific_role_required('LGA Adviser')
 def lga_adviser_dashboard(request):
-    members_in_lga = User.objects.filter(lga=request.user.lga, status='APPROVED').count() if request.user.lga else 0
+    members_in_lga = member_count(status='APPROVED', lga_id=request.user.lga_id) if request.user.lga_id else 0
     
     context = {
         'members_in_lga': members_in_lga,
@@ -1686,7 +1593,7 @@ def lga_adviser_dashboard(request):
 
 @specific_role_required('Secretary')
 def ward_secretary_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     total_meetings = WardMeeting.objects.filter(ward=request.user.ward).count() if request.user.ward else 0
     
     context = {
@@ -1698,7 +1605,7 @@ def ward_secretary_dashboard(request):
 
 @specific_role_required('Organizing Secretary')
 def ward_organizing_secretary_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     
     context = {
         'members_in_ward': members_in_ward,
@@ -1708,7 +1615,7 @@ def ward_organizing_secretary_dashboard(request):
 
 @specific_role_required('Treasurer')
 def ward_treasurer_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     
     context = {
         'members_in_ward': members_in_ward,
@@ -1718,7 +1625,7 @@ def ward_treasurer_dashboard(request):
 
 @specific_role_required('Publicity Officer')
 def ward_publicity_officer_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     
     context = {
         'members_in_ward': members_in_ward,
@@ -1728,7 +1635,7 @@ def ward_publicity_officer_dashboard(request):
 
 @specific_role_required('Financial Secretary')
 def ward_financial_secretary_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     
     context = {
         'members_in_ward': members_in_ward,
@@ -1738,7 +1645,7 @@ def ward_financial_secretary_dashboard(request):
 
 @specific_role_required('Ward Supervisor')
 def ward_supervisor_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     
     context = {
         'members_in_ward': members_in_ward,
@@ -1748,7 +1655,7 @@ def ward_supervisor_dashboard(request):
 
 @specific_role_required('Ward Adviser')
 def ward_adviser_dashboard(request):
-    members_in_ward = User.objects.filter(ward=request.user.ward, status='APPROVED').count() if request.user.ward else 0
+    members_in_ward = member_count(status='APPROVED', ward_id=request.user.ward_id) if request.user.ward_id else 0
     
     context = {
         'members_in_ward': members_in_ward,
@@ -1977,8 +1884,9 @@ def women_members(request):
     if lga_filter:
         female_members = female_members.filter(lga_id=lga_filter)
     
-    zones = Zone.objects.all()
-    lgas = LGA.objects.all()
+    geography = get_tree()
+    zones = geography.zones
+    lgas = geography.lgas
     
     context = {
         'female_members': female_members,
@@ -1995,180 +1903,22 @@ def women_members(request):
 @specific_role_required('Director of Mobilization', 'Assistant Director of Mobilization', 'Director of Contact and Mobilization', 'President', 'Zonal Coordinator', 'LGA Coordinator', 'Ward Coordinator')
 def member_mobilization(request):
     """Member filtering and contact list generation for mobilization"""
-    import csv
-    from django.http import HttpResponse
-    
     form = MemberMobilizationFilterForm(request.GET or None)
     # Start with all members - exclude superusers
-    members = User.objects.filter(is_superuser=False).order_by('last_name', 'first_name')
+    members = form.filter_members(User.objects.filter(is_superuser=False).order_by('last_name', 'first_name'))
     
-    # Apply filters
-    if form.is_valid():
-        if form.cleaned_data.get('zone'):
-            members = members.filter(zone=form.cleaned_data['zone'])
-        
-        if form.cleaned_data.get('lga'):
-            members = members.filter(lga=form.cleaned_data['lga'])
-        
-        if form.cleaned_data.get('ward'):
-            members = members.filter(ward=form.cleaned_data['ward'])
-        
-        if form.cleaned_data.get('role'):
-            members = members.filter(role=form.cleaned_data['role'])
-        
-        if form.cleaned_data.get('tier'):
-            members = members.filter(role=form.cleaned_data['tier'])
-        
-        if form.cleaned_data.get('gender'):
-            members = members.filter(gender=form.cleaned_data['gender'])
-        
-        if form.cleaned_data.get('status'):
-            members = members.filter(status=form.cleaned_data['status'])
-        else:
-            # If no status filter selected, default to APPROVED members only
-            members = members.filter(status='APPROVED')
+    # Handle CSV / NDJSON export
+    if request.GET.get('export') in ('csv', 'ndjson'):
+        from core.exports import stream_export
+        from .exports import CONTACT_COLUMNS
+        return stream_export(members, CONTACT_COLUMNS, 'kpn_contact_list', request.GET['export'])
     
-    # Handle CSV export
-    if 'export' in request.GET and request.GET['export'] == 'csv':
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="kpn_contact_list.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Name', 'Phone', 'Role', 'Zone', 'LGA', 'Ward', 'Gender', 'Status'])
-        
-        for member in members:
-            writer.writerow([
-                member.get_full_name(),
-                member.phone,
-                member.get_role_display(),
-                member.zone.name if member.zone else '',
-                member.lga.name if member.lga else '',
-                member.ward.name if member.ward else '',
-                member.get_gender_display() if member.gender else '',
-                member.get_status_display()
-            ])
-        
-        return response
-    
-    # Handle PDF export
-    if 'export' in request.GET and request.GET['export'] == 'pdf':
-        from reportlab.lib.pagesizes import letter, landscape
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.enums import TA_LEFT, TA_RIGHT
-        from io import BytesIO
-        from datetime import datetime
-        
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=landscape(letter), rightMargin=30, leftMargin=30, topMargin=70, bottomMargin=50)
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Letterhead Header Styles
-        header_style = ParagraphStyle(
-            'HeaderStyle',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.black,
-            spaceAfter=2,
-            alignment=TA_LEFT
-        )
-        
-        header_right_style = ParagraphStyle(
-            'HeaderRightStyle',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.black,
-            spaceAfter=2,
-            alignment=TA_RIGHT
-        )
-        
-        footer_style = ParagraphStyle(
-            'FooterStyle',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=4,
-            alignment=TA_LEFT
-        )
-        
-        # Add letterhead header
-        header_data = [
-            [Paragraph("Our Ref:", header_style), '', Paragraph(f"Date: {datetime.now().strftime('%B %d, %Y')}", header_right_style)]
-        ]
-        header_table = Table(header_data, colWidths=[2*inch, 4*inch, 3*inch])
-        header_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-        elements.append(header_table)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=14,
-            textColor=colors.HexColor('#28a745'),
-            spaceAfter=10,
-            alignment=1
-        )
-        
-        title = Paragraph("MEMBER CONTACT LIST", title_style)
-        elements.append(title)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        data = [['Name', 'Phone', 'Role', 'Zone', 'LGA', 'Ward', 'Gender', 'Status']]
-        
-        for member in members:
-            data.append([
-                member.get_full_name(),
-                member.phone or '',
-                member.get_role_display(),
-                member.zone.name if member.zone else '',
-                member.lga.name if member.lga else '',
-                member.ward.name if member.ward else '',
-                member.get_gender_display() if member.gender else '',
-                member.get_status_display()
-            ])
-        
-        table = Table(data, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
-        ]))
-        
-        elements.append(table)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Add letterhead footer
-        footer_text = Paragraph(
-            '<b>kpn.kebbi@gmail.com</b><br/>'
-            'Sani Abacha Bypass Road, Birnin Kebbi &nbsp;&nbsp;&nbsp; '
-            '+2348037851112, +2348067770283<br/>'
-            '<b>www.mykpn.onrender.com</b>',
-            footer_style
-        )
-        elements.append(footer_text)
-        
-        doc.build(elements)
-        
-        buffer.seek(0)
-        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
-        response['Content-Disposition'] = 'attachment; filename="kpn_contact_list.pdf"'
-        
-        return response
+    # PDF export runs in the background job worker
+    if request.GET.get('export') == 'pdf':
+        from core.jobs import enqueue
+        params = {key: value for key, value in sorted(request.GET.items()) if key not in ('export', 'page') and value}
+        job = enqueue('contact_list_pdf', request.user, **params)
+        return redirect('core:job_detail', pk=job.pk)
     
     # Pagination
     from django.core.paginator import Paginator
@@ -2180,6 +1930,7 @@ def member_mobilization(request):
         'form': form,
         'members': page_obj,
         'total_count': members.count(),
+        'geography_version': get_tree().bundle_version,
     }
     
     return render(request, 'staff/member_mobilization.html', context)
@@ -2772,11 +2523,7 @@ def create_audit_report(request):
             audit = form.save(commit=False)
             audit.submitted_by = request.user
             # Get President as submitted_to
-            president = User.objects.filter(
-                role_definition__title='President',
-                status='APPROVED'
-            ).first()
-            audit.submitted_to = president
+            audit.submitted_to = get_directory().president()
             audit.save()
             messages.success(request, 'Audit report created successfully!')
             return redirect('staff:auditor_general_dashboard')
@@ -2865,11 +2612,9 @@ def vice_president_staff_directory(request):
         members = members.filter(role=role)
     
     # Get filter options
-    from leadership.models import Zone, LGA
-    zones = Zone.objects.all()
-    lgas = LGA.objects.all()
-    if zone_id:
-        lgas = lgas.filter(zone_id=zone_id)
+    geography = get_tree()
+    zones = geography.zones
+    lgas = geography.lgas_in_zone(zone_id) if zone_id else geography.lgas
     
     context = {
         'members': members[:100],  # Limit to 100 for performance
@@ -3172,231 +2917,52 @@ def delete_announcement(request, pk):
     return render(request, 'staff/announcements/delete.html', context)
 
 
-# Role name shortening mapping for ID tags
-ROLE_SHORTENING = {
-    'President': 'President',
-    'Vice President': 'Vice President',
-    'General Secretary': 'General Secretary',
-    'Assistant General Secretary': 'Asst. Secretary',
-    'State Supervisor': 'State Supervisor',
-    'Legal & Ethics Adviser': 'Legal Adviser',
-    'Treasurer': 'Treasurer',
-    'Financial Secretary': 'Finance Secretary',
-    'Director of Mobilization': 'Mobilization Dir.',
-    'Assistant Director of Mobilization': 'Asst. Mobilization',
-    'Organizing Secretary': 'Organizer',
-    'Assistant Organizing Secretary': 'Asst. Organizer',
-    'Auditor General': 'Auditor General',
-    'Welfare Officer': 'Welfare Officer',
-    'Youth Development & Empowerment Officer': 'Youth Officer',
-    'Women Leader': 'Women Leader',
-    'Assistant Women Leader': 'Asst. Women Lead',
-    'Director of Media & Publicity': 'Publicity Officer',
-    'Assistant Director of Media & Publicity': 'Asst. Publicity',
-    'Public Relations & Community Engagement Officer': 'PR Officer',
-    'Zonal Coordinator': 'Zonal Coordinator.',
-    'Zonal Secretary': 'Zonal Secretary',
-    'Zonal Publicity Officer': 'Zonal Publicity',
-    'LGA Coordinator': 'LGA Coordinator',
-    'Secretary': 'Secretary',
-    'Publicity Officer': 'Publicity',
-    'Contact & Mobilization': 'Contact Officer',
-    'LGA Supervisor': 'LGA Supervisor',
-    'LGA Adviser': 'LGA Adviser',
-    'Ward Coordinator': 'Ward Coordinator',
-    'Ward Supervisor': 'Ward Supervisor',
-    'Ward Adviser': 'Ward Adviser',
-}
-
 @login_required
 def generate_id_tag(request):
     '''Generate an ID tag for the logged-in user as PDF'''
-    from PIL import Image, ImageDraw, ImageFont
-    from io import BytesIO
     from django.urls import reverse
-    import qrcode
-    import os
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfgen import canvas as pdf_canvas
+    from .idtags import get_tag_pdf
     
     user = request.user
+    profile_url = request.build_absolute_uri(reverse('core:view_profile', args=[user.id]))
     
-    # Get the tag template
-    template_path = os.path.join(settings.STATIC_ROOT, 'images', 'id_tag_template.png')
-    if not os.path.exists(template_path):
-        template_path = os.path.join(settings.BASE_DIR, 'static', 'images', 'id_tag_template.png')
-    
-    #  the template
     try:
-        tag = Image.open(template_path).convert('RGB')
-    except Exception as e:
+        pdf = get_tag_pdf(user, profile_url)
+    except OSError as e:
         messages.error(request, f'Error loading tag template: {str(e)}')
-        return Openredirect('staff:dashboard')
-    
-    draw = ImageDraw.Draw(tag)
-    
-    # Define positions for text (adjusted for better layout)
-    # Template size is around 458 x 812 pixels
-    photo_center = (239, 385)  # Center of the white circle for photo
-    photo_radius = 169  # Increased radius for better fit
-    
-    # Text positions - moved all text higher and closer together
-    name_y = 577  # Moved up significantly
-    position_y = 637  # Moved up
-    address_y = 687  # Moved up
-    text_x = 229  # Center X for all text
-    
-    # QR code position (white square at bottom left) - increased size to fill properly
-    qr_position = (11, 720)
-    qr_size = 99  # Increased size to fill the white square better
-    
-    # Try to load a font - use default if not available
-    try:
-        # Use clean, professional fonts with better sizing
-        font_large = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 24)
-        font_medium = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 20)
-        font_small = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 18)
-    except:
-        # Fallback to default font
-        font_large = ImageFont.load_default()
-        font_medium = ImageFont.load_default()
-        font_small = ImageFont.load_default()
-    
-    # Get user information
-    full_name = user.get_full_name() or user.username
-    
-    # Get position/role
-    if user.role == 'GENERAL':
-        position = 'Member'
-    else:
-        if user.role_definition:
-            role_title = user.role_definition.title
-            position = ROLE_SHORTENING.get(role_title, role_title)
-        else:
-            position = user.get_role_display()
-    
-    # Get address
-    address_parts = []
-    if user.ward:
-        address_parts.append(user.ward.name)
-    if user.lga:
-        address_parts.append(user.lga.name)
-    if user.zone:
-        address_parts.append(user.zone.name)
-    
-    address = ', '.join(address_parts) if address_parts else 'Kebbi State'
-    
-    # Add user photo to the white circle
-    if user.photo:
-        try:
-            # Open user photo
-            if hasattr(user.photo, 'url'):
-                # Handle both local and cloud storage
-                if user.photo.url.startswith('http'):
-                    import requests
-                    response = requests.get(user.photo.url)
-                    user_photo = Image.open(BytesIO(response.content))
-                else:
-                    user_photo_path = os.path.join(settings.BASE_DIR, user.photo.url.lstrip('/'))
-                    user_photo = Image.open(user_photo_path)
-            else:
-                user_photo = Image.open(user.photo)
-            
-            # Convert to RGB
-            user_photo = user_photo.convert('RGB')
-            
-            # Crop photo to square before resizing
-            width, height = user_photo.size
-            min_dimension = min(width, height)
-            left = (width - min_dimension) // 2
-            top = (height - min_dimension) // 2
-            right = left + min_dimension
-            bottom = top + min_dimension
-            user_photo = user_photo.crop((left, top, right, bottom))
-            
-            # Resize to fit circle perfectly
-            size = photo_radius * 2
-            user_photo = user_photo.resize((size, size), Image.Resampling.LANCZOS)
-            
-            # Create a circular mask
-            mask = Image.new('L', (size, size), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.ellipse((0, 0, size, size), fill=255)
-            
-            # Apply mask to create circular photo
-            output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            output.paste(user_photo, (0, 0))
-            output.putalpha(mask)
-            
-            # Paste circular photo onto tag (centered properly)
-            tag.paste(output, (photo_center[0] - photo_radius, photo_center[1] - photo_radius), output)
-        except Exception as e:
-            # If photo fails to load, continue without it
-            pass
+        return redirect('staff:dashboard')
     
-    # Generate QR code with link to user profile
-    profile_url = request.build_absolute_uri(reverse('core:view_profile', args=[user.id]))
-    qr = qrcode.QRCode(version=1, box_size=10, border=0)  # No border for better fit
-    qr.add_data(profile_url)
-    qr.make(fit=True)
-    qr_img = qr.make_image(fill_color='black', back_color='white')
-    qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.LANCZOS)
-    
-    # Paste QR code onto tag
-    tag.paste(qr_img, qr_position)
-    
-    # Draw text on tag (navy blue color to match template)
-    text_color = (30, 58, 79)  # Navy blue from template
-    
-    # Draw name
-    name_bbox = draw.textbbox((0, 0), full_name, font=font_large)
-    name_width = name_bbox[2] - name_bbox[0]
-    draw.text((text_x - name_width//2, name_y), full_name, fill=text_color, font=font_large)
-    
-    # Draw position
-    pos_bbox = draw.textbbox((0, 0), position, font=font_medium)
-    pos_width = pos_bbox[2] - pos_bbox[0]
-    draw.text((text_x - pos_width//2, position_y), position, fill=text_color, font=font_medium)
-    
-    # Draw address
-    addr_bbox = draw.textbbox((0, 0), address, font=font_small)
-    addr_width = addr_bbox[2] - addr_bbox[0]
-    draw.text((text_x - addr_width//2, address_y), address, fill=text_color, font=font_small)
-    
-    # Save tag image to a temporary buffer for PDF conversion
-    img_buffer = BytesIO()
-    tag.save(img_buffer, format='PNG', quality=95)
-    img_buffer.seek(0)
-    
-    # Create PDF with the tag image
-    pdf_buffer = BytesIO()
-    
-    # Set page size to match ID tag dimensions (scale up for print quality)
-    tag_width, tag_height = tag.size
-    page_width = tag_width * 1.5  # Scale for better print quality
-    page_height = tag_height * 1.5
-    
-    c = pdf_canvas.Canvas(pdf_buffer, pagesize=(page_width, page_height))
-    
-    # Save the image to a temporary file to embed in PDF
-    temp_img_path = os.path.join(settings.BASE_DIR, 'temp_tag.png')
-    tag.save(temp_img_path, format='PNG', quality=95)
-    
-    # Draw the image on PDF (fill entire page)
-    c.drawImage(temp_img_path, 0, 0, width=page_width, height=page_height, preserveAspectRatio=True)
-    
-    # Finalize PDF
-    c.showPage()
-    c.save()
-    
-    # Clean up temporary image file
-    if os.path.exists(temp_img_path):
-        os.remove(temp_img_path)
-    
-    # Return PDF as response
-    pdf_buffer.seek(0)
-    response = HttpResponse(pdf_buffer, content_type='application/pdf')
+    response = HttpResponse(pdf, content_type='application/pdf')
     response['Content-Disposition'] = f'attachment; filename="{user.username}_id_tag.pdf"'
     
     return response
 
+
+@approved_leader_required
+def bulk_id_tags(request):
+    '''Queue print sheets of ID tags for every member of a ward, LGA or zone'''
+    from core.jobs import enqueue
+    from .idtags import jurisdiction_members, parse_scope, scope_choices
+    
+    choices = scope_choices(request.user)
+    if not choices:
+        messages.error(request, 'Your account is not assigned to a jurisdiction.')
+        return redirect('staff:dashboard')
+    
+    if request.method == 'POST':
+        scope = request.POST.get('scope')
+        if scope not in dict(choices):
+            messages.error(request, 'Please choose a jurisdiction you lead.')
+            return redirect('staff:bulk_id_tags')
+        if not jurisdiction_members(**parse_scope(scope)).exists():
+            messages.error(request, 'There are no approved members in that jurisdiction.')
+            return redirect('staff:bulk_id_tags')
+        job = enqueue('id_tags_pdf', request.user, scope=scope, site_url=request.build_absolute_uri('/'))
+        return redirect('core:job_detail', pk=job.pk)
+    
+    context = {
+        'scope_choices': choices,
+        'member_count': jurisdiction_members(**parse_scope(choices[0][0])).count(),
+    }
+    return render(request, 'staff/bulk_id_tags.html', context)
+
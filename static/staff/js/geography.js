@@ -0,0 +1,49 @@
+/**
+ * Geography - Zone → LGA → Ward lookups from the cached geography bundle
+ * Include with data-url pointing at the versioned bundle endpoint; the
+ * bundle is fetched once per page and cached by the browser until the
+ * geography changes.
+ */
+
+const KPNGeography = (() => {
+    const url = document.currentScript.dataset.url;
+    let loading = null;
+
+    function index(bundle) {
+        const lgasByZone = {};
+        const wardsByLga = {};
+
+        bundle.zones.forEach(([zoneId, zoneName, lgas]) => {
+            lgasByZone[zoneId] = lgas.map(([id, name]) => ({ id, name }));
+            lgas.forEach(([lgaId, lgaName, wards]) => {
+                wardsByLga[lgaId] = wards.map(([id, name]) => ({ id, name }));
+            });
+        });
+
+        return {
+            version: bundle.version,
+            lgas: (zoneId) => lgasByZone[zoneId] || [],
+            wards: (lgaId) => wardsByLga[lgaId] || [],
+        };
+    }
+
+    function load() {
+        if (!loading) {
+            loading = fetch(url)
+                .then((response) => {
+                    if (!response.ok) {
+                        throw new Error(`Geography request failed: ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .then(index)
+                .catch((error) => {
+                    loading = null;
+                    throw error;
+                });
+        }
+        return loading;
+    }
+
+    return { load };
+})();